@@ -0,0 +1,99 @@
+"""Charts computed per second with 1, 2, 4, 8 and 16 threads, on the GIL or the free-threaded (3.13t) interpreter.
+
+Every thread computes its share of the rows with `compute_many`, which fills one chart object of its own,
+the caches (names, compiled figures, interpretations, reduction tables) being shared. A few rows have names long
+enough for sums beyond the initial size of the reduction tables: the first run, with the most threads, grows
+the shared tables concurrently. The charts of every run, the first one included, are checked against the charts
+of one thread, the other runs being timed with warm caches.
+
+    python benchmarks/thread_scaling.py --rows 50000
+    python3.13t -X gil=0 benchmarks/thread_scaling.py --rows 50000
+"""
+import argparse
+import os
+import platform
+import random
+import string
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import compute_many
+
+Row = Tuple[str, str, Optional[str]]
+
+
+def generate_rows(count: int, seed: int = 0) -> List[Row]:
+    """Returns random people, a tenth of them without birthdate and one in 500 with a name of 1000 to 4000 letters."""
+    generator = random.Random(seed)
+
+    def name(length: int) -> str:
+        return "".join(generator.choice(string.ascii_lowercase) for _ in range(length)).title()
+
+    rows = []
+    for _ in range(count):
+        birthdate = None
+        if generator.random() > 0.1:
+            birthdate = f"{generator.randint(1900, 2024)}-{generator.randint(1, 12):02d}-{generator.randint(1, 28):02d}"
+        # Sums of up to 36000, beyond the 4096 sums of a new reduction table
+        last_name_length = generator.randint(1000, 4000) if generator.random() < 0.002 else generator.randint(3, 10)
+        rows.append((name(generator.randint(3, 10)), name(last_name_length), birthdate))
+    return rows
+
+
+def compute_share(rows: Sequence[Row], system: str) -> list:
+    return list(compute_many(rows, system=system))
+
+
+def run(rows: Sequence[Row], threads: int, system: str) -> Tuple[float, list]:
+    """Returns the seconds taken to compute the rows with the threads, and the results in the order of the rows."""
+    size = -(-len(rows) // threads)
+    shares = [rows[start : start + size] for start in range(0, len(rows), size)]
+    with ThreadPoolExecutor(threads) as executor:
+        start = time.perf_counter()
+        results = list(executor.map(compute_share, shares, [system] * len(shares)))
+        seconds = time.perf_counter() - start
+    return seconds, [result for share in results for result in share]
+
+
+def gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the charts computed per second by 1 to 16 threads.")
+    parser.add_argument("--rows", type=int, default=20000, help="People computed by every run")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="Thread counts")
+    parser.add_argument("--system", default="pythagorean", help="pythagorean, chaldean or vedic")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per thread count, the best one being kept")
+    args = parser.parse_args()
+
+    rows = generate_rows(args.rows)
+    # Grows the shared reduction tables from several threads at once, then checks the charts
+    _, grown = run(rows, max(args.threads), args.system)
+    _, expected = run(rows, 1, args.system)
+    if grown != expected:
+        raise RuntimeError("The charts computed while the threads grew the reduction tables are wrong.")
+
+    print(f"Python {platform.python_version()} ({'GIL' if gil_enabled() else 'free-threaded'}), {os.cpu_count()} CPUs")
+    print(f"{args.rows} {args.system} charts a run, best of {args.repeat}\n")
+    print(f"{'threads':>8} {'charts/s':>12} {'speedup':>8}")
+    baseline = None
+    for threads in args.threads:
+        best = None
+        for _ in range(args.repeat):
+            seconds, results = run(rows, threads, args.system)
+            if results != expected:
+                raise RuntimeError(f"The charts computed by {threads} threads differ from the charts of 1 thread.")
+            best = seconds if best is None else min(best, seconds)
+        rate = args.rows / best
+        baseline = baseline or rate
+        print(f"{threads:>8} {rate:>12,.0f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
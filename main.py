@@ -1,13 +1,15 @@
 from numerology import Pythagorean
-from numerology import Chaldean
-from numerology import Vedic
+from numerology import compute_all_systems
 import argparse
 
 def start_app(first_name, last_name, birthdate):
     print("Starting...\n")
-    Pythagorean(first_name, last_name, birthdate)
-    Chaldean(first_name, last_name, birthdate)
-    Vedic(first_name, last_name, birthdate)
+    results = compute_all_systems(first_name, last_name, birthdate)
+    for diagnostic in results["pythagorean"].diagnostics:
+        print(diagnostic.message)
+    for chart, diagnostics in results.values():
+        if chart is not None:
+            Pythagorean.print_chart(chart)
 
 if __name__ == "__main__":
     """Interactive version of the package."""
@@ -8,10 +8,18 @@ sys.path.append(os.path.dirname(os.path.realpath(__file__)))
 
 localedir_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "locale")
 
+from pythagorean.chart import Chart
 from pythagorean.common import Functions as fct
+from pythagorean.date_table import DateFigureTable
+from pythagorean.interning import ChartInterner
+from pythagorean.dates import DateParser
+from pythagorean.names import NAME_CACHE, NameCache
+from pythagorean.ruleset import Ruleset
 from pythagorean.numerology import Numerology as Pythagorean
 from chaldean.numerology import CNumerology as Chaldean
 from vedic.numerology import VNumerology as Vedic
+from .engine import compute, compute_all_systems, compute_many
+from .editable import EditableChart
 
 assert sys.version_info[0] == 3, "Numerology requires Python 3."
 
@@ -31,7 +39,6 @@ except:
     language = gettext.translation(
         "numerology", localedir=localedir_path, languages=[default_lang]
     )
-language.install()
 _ = language.gettext
 
 if __name__ == "__main__":
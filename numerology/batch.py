@@ -0,0 +1,264 @@
+"""Charts of many people computed in parallel processes, sent back packed into 64-bit integers."""
+import os
+from array import array
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from pythagorean.dates import DateParser
+from pythagorean.diagnostics import Diagnostic
+from pythagorean.interning import IDENTITY_FIGURES
+from pythagorean.ruleset import Ruleset
+
+from .dedup import RowDeduplicator, Slot
+from .engine import check_row, evaluate_rows, numerology_system, row_error
+from .packing import ChartPacker
+
+# Separators of the encoded chunks: one line a row, one tab between the fields
+ROW_SEPARATOR = "\n"
+FIELD_SEPARATOR = "\t"
+# The separators found in the fields are sent as spaces, which are not letters either
+SEPARATORS_AS_SPACES = str.maketrans({ROW_SEPARATOR: " ", FIELD_SEPARATOR: " "})
+
+
+class PackedResult(NamedTuple):
+    """Packed chart of a row of `compute_parallel`.
+
+    Attributes:
+        index (int): Position of the row in the input, the results being possibly out of order.
+        words (Optional[Tuple[int, ...]]): The chart packed by ChartPacker, None if there is none (see `diagnostics`)
+            or if it cannot be packed.
+        diagnostics (Tuple[Diagnostic, ...]): The problems found in the inputs.
+        key_figures (Dict[str, Any], optional): The key figures but the names and the birthdate of a chart which
+            is not packed exactly (see `ChartPacker.is_exact`), None for the other rows.
+    """
+
+    index: int
+    words: Optional[Tuple[int, ...]]
+    diagnostics: Tuple[Diagnostic, ...]
+    key_figures: Optional[Dict[str, Any]] = None
+
+    def unpack(self, packer: ChartPacker, system: str) -> Optional[Dict[str, Any]]:
+        """Returns the key figures of the row but the names and the birthdate, None if it has no chart."""
+        if self.key_figures is not None:
+            return self.key_figures
+        return None if self.words is None else packer.unpack(system, self.words)
+
+
+class PackedChunk(NamedTuple):
+    """Packed charts of consecutive rows, as sent back by a worker.
+
+    The charts are stored `words_per_chart` integers a row, and are all zeros for the rows without chart
+    (a packed chart is never zero, its name numbers being at least 1).
+    The key figures of the charts which are not packed exactly are sent as they are.
+    """
+
+    words: array
+    diagnostics: Dict[int, Tuple[Diagnostic, ...]]
+    key_figures: Dict[int, Dict[str, Any]]
+
+
+def encode_chunk(rows: Sequence[Sequence[Optional[str]]]) -> Tuple[bytes, Dict[int, Tuple[Diagnostic, ...]]]:
+    """Encodes rows of (first name, last name, birthdate) into one UTF-8 buffer, cheaper to send than tuples.
+
+    A missing birthdate is left out of its line, so that None and an empty birthdate are told apart.
+    The tabs and new lines of the fields are replaced by spaces.
+    The rows which cannot be encoded are sent as empty lines, and their diagnostics returned.
+
+    Returns:
+        Tuple[bytes, Dict[int, Tuple[Diagnostic, ...]]]: The buffer, and the diagnostics by row offset.
+    """
+    lines: List[str] = []
+    errors: Dict[int, Tuple[Diagnostic, ...]] = {}
+    for offset, row in enumerate(rows):
+        try:
+            fields = [field for field in check_row(row) if field is not None]
+            lines.append(FIELD_SEPARATOR.join(field.translate(SEPARATORS_AS_SPACES) for field in fields))
+        except Exception as error:
+            lines.append("")
+            errors[offset] = (row_error(error),)
+    return ROW_SEPARATOR.join(lines).encode("utf-8", "surrogatepass"), errors
+
+
+def decode_chunk(buffer: bytes) -> List[List[str]]:
+    """Returns the rows of a buffer encoded by `encode_chunk`."""
+    return [line.split(FIELD_SEPARATOR) for line in buffer.decode("utf-8", "surrogatepass").split(ROW_SEPARATOR)]
+
+
+# Settings of the worker processes (see `_init_worker`)
+_worker = {}
+
+
+def _init_worker(system: str, ruleset: Optional[Ruleset], date_parser: Optional[DateParser]):
+    numerology_class, _ = numerology_system(system)
+    _worker.update(
+        numerology_class=numerology_class,
+        ruleset=ruleset,
+        date_parser=date_parser,
+        packer=ChartPacker(ruleset or numerology_class.ruleset),
+    )
+
+
+def _compute_chunk(buffer: bytes) -> PackedChunk:
+    """Computes and packs the charts of an encoded chunk, in a worker process."""
+    numerology_class, packer = _worker["numerology_class"], _worker["packer"]
+    width = packer.WORDS[numerology_class.system]
+    rows = decode_chunk(buffer)
+    words = array("Q", bytes(8 * width * len(rows)))
+    diagnostics: Dict[int, Tuple[Diagnostic, ...]] = {}
+    key_figures: Dict[int, Dict[str, Any]] = {}
+    results = evaluate_rows(rows, numerology_class, None, _worker["ruleset"], _worker["date_parser"], interpret=False)
+    for offset, (chart, row_diagnostics) in enumerate(results):
+        if chart is not None:
+            try:
+                chart_words = packer.pack(chart)
+                words[offset * width : (offset + 1) * width] = array("Q", chart_words)
+                exact = packer.is_exact(chart.system, chart_words)
+            except ValueError:
+                exact = False
+            if not exact:
+                key_figures[offset] = {
+                    name: value for name, value in chart.key_figures.items() if name not in IDENTITY_FIGURES
+                }
+        if row_diagnostics:
+            diagnostics[offset] = row_diagnostics
+    return PackedChunk(words, diagnostics, key_figures)
+
+
+def compute_parallel(
+    rows: Iterable[Sequence[Optional[str]]],
+    system: str = "pythagorean",
+    workers: Optional[int] = None,
+    chunk_size: int = 4096,
+    ordered: bool = True,
+    ruleset: Optional[Ruleset] = None,
+    date_parser: Optional[DateParser] = None,
+    deduplicator: Optional[RowDeduplicator] = None,
+) -> Iterator[PackedResult]:
+    """Computes the full charts of many people on every core, packed into 64-bit integers (see ChartPacker).
+
+    The rows are read `chunk_size` at a time and sent to the worker processes as UTF-8 buffers,
+    which send the charts back as arrays of integers. At most two chunks a worker are in flight,
+    so any iterable can be given, as the lines of a huge file:
+
+        packer = ChartPacker()
+        for result in compute_parallel(csv.reader(file)):
+            key_figures = result.unpack(packer, "pythagorean")
+
+    A row which cannot be computed gives a ROW_ERROR diagnostic instead of stopping the batch.
+    A chart which cannot be packed exactly, as the names with more than 126 letters of a number,
+    is sent back as its key figures (see `PackedResult.key_figures`).
+
+    Args:
+        rows (Iterable[Sequence[Optional[str]]]): Rows of (first name, last name, birthdate), the birthdate optional.
+        system (str, optional): 'pythagorean', 'chaldean' or 'vedic'. Defaults to 'pythagorean'.
+        workers (int, optional): Worker processes. Defaults to None, meaning one a core.
+        chunk_size (int, optional): Rows sent at once to a worker. Defaults to 4096.
+        ordered (bool, optional): Whether the results are in the order of the rows, or as soon as computed.
+            Defaults to True.
+        ruleset (Ruleset, optional): Rules of the reductions. Defaults to the ruleset of the system.
+            The charts are to be unpacked with the same ruleset.
+        date_parser (DateParser, optional): Accepted birthdate formats. Defaults to the parser of the system.
+        deduplicator (RowDeduplicator, optional): Sends the same people once to the workers, counting
+            the duplicates. The rows of the chunks in flight are not deduplicated against each other.
+            Defaults to None, meaning every row is computed.
+
+    Raises:
+        ValueError: If the system is unknown, or if `workers` or `chunk_size` is not positive.
+
+    Returns:
+        Iterator[PackedResult]: The packed chart of every row, None if the names are not valid, and the problems found.
+    """
+    numerology_class, _ = numerology_system(system)
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, not {chunk_size}.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be positive, not {workers}.")
+    # Checks the ruleset before starting the workers
+    ChartPacker(ruleset or numerology_class.ruleset)
+    return _compute_parallel(iter(rows), system, workers, chunk_size, ordered, ruleset, date_parser, deduplicator)
+
+
+def _compute_parallel(
+    rows: Iterator[Sequence[Optional[str]]],
+    system: str,
+    workers: int,
+    chunk_size: int,
+    ordered: bool,
+    ruleset: Optional[Ruleset],
+    date_parser: Optional[DateParser],
+    deduplicator: Optional[RowDeduplicator],
+) -> Iterator[PackedResult]:
+    numerology_class, _ = numerology_system(system)
+    width = ChartPacker.WORDS[system]
+    parser = date_parser or numerology_class.date_parser
+    context = ("packed", system, None, (ruleset or numerology_class.ruleset).fingerprint, parser)
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(system, ruleset, date_parser)) as executor:
+        pending: "deque[_PendingChunk]" = deque()
+        start = 0
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < 2 * workers:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    exhausted = True
+                    break
+                todo, slots = chunk, None
+                if deduplicator is not None:
+                    todo, slots = deduplicator.plan(chunk, context, parser)
+                buffer, errors = encode_chunk(todo)
+                if todo:
+                    future = executor.submit(_compute_chunk, buffer)
+                else:
+                    # Every row is a copy of a row already computed
+                    future = Future()
+                    future.set_result(PackedChunk(array("Q"), {}, {}))
+                pending.append(_PendingChunk(future, start, chunk, slots, errors))
+                start += len(chunk)
+            if not pending:
+                break
+            if ordered:
+                item = pending.popleft()
+            else:
+                done, _ = wait([item.future for item in pending], return_when=FIRST_COMPLETED)
+                item = next(item for item in pending if item.future in done)
+                pending.remove(item)
+            results = _unpack_chunk(item.future.result(), item.errors, width)
+            if item.slots is not None:
+                results = deduplicator.resolve(item.rows, item.slots, results, lambda result, row: result)
+            for offset, (words, diagnostics, key_figures) in enumerate(results):
+                yield PackedResult(item.start + offset, words, diagnostics, key_figures)
+
+
+class _PendingChunk(NamedTuple):
+    future: Future
+    # Position of the first row of the chunk in the input
+    start: int
+    rows: List[Sequence[Optional[str]]]
+    # Deduplication of the rows (see `RowDeduplicator.plan`), None if every row is computed
+    slots: Optional[List[Slot]]
+    # Diagnostics of the rows which cannot be encoded
+    errors: Dict[int, Tuple[Diagnostic, ...]]
+
+
+def _unpack_chunk(
+    chunk: PackedChunk, errors: Dict[int, Tuple[Diagnostic, ...]], width: int
+) -> List[Tuple[Optional[Tuple[int, ...]], Tuple[Diagnostic, ...], Optional[Dict[str, Any]]]]:
+    words = chunk.words
+    results = []
+    for offset in range(len(words) // width):
+        if offset in errors:
+            results.append((None, errors[offset], None))
+        else:
+            chart_words = tuple(words[offset * width : (offset + 1) * width])
+            results.append(
+                (
+                    chart_words if chart_words[0] else None,
+                    chunk.diagnostics.get(offset, ()),
+                    chunk.key_figures.get(offset),
+                )
+            )
+    return results
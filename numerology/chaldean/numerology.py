@@ -1,10 +1,15 @@
 import os
 import locale
 import gettext
+from typing import Iterable, Optional
 from numerology.pythagorean import *
 import pythagorean.numerology as pNumerology
 
-from pythagorean.common import Functions as fct
+from pythagorean.date_table import DateField
+from pythagorean.dates import DateParser
+from pythagorean.letters import LetterValues
+from pythagorean.ruleset import Ruleset
+from pythagorean.specs import COMPOUND, Fig, FigureSpec, Var, add, recorded, reduce
 from chaldean.interpretations import Interpretations as CInterpretations
 
 localedir_path = os.path.join(
@@ -27,7 +32,6 @@ except Exception:
     language = gettext.translation(
         "numerology", localedir=localedir_path, languages=[default_lang]
     )
-language.install()
 _ = language.gettext
 
 class CNumerology(pNumerology.Numerology):
@@ -94,124 +98,141 @@ class CNumerology(pNumerology.Numerology):
         "z",
     )
 
-    def __init__(self, first_name: str, last_name: str, birthdate: str, verbose: bool = True):
-        super().__init__(first_name, last_name, birthdate, False)
-        self.verbose = verbose
-        if self.names_are_valid:
-            self._interpretations = CInterpretations(key_figures=self.key_figures)
-        if self.verbose and self.names_are_valid:
-            print(_("KEY FIGURES:"))
-            fct.print_beautiful_dict(dictionary=self.key_figures)
-            print(_("INTERPRETATIONS:"))
-            fct.print_beautiful_dict(dictionary=self.interpretations)
-
-    def set_key_figures(self):
-        """Initializes the key figures dictionary."""
-        self._key_figures["life_path_number"] = self.life_path_number
-        self._key_figures["birthdate_day_num"] = self.birthdate_day_num
-        self._key_figures["birthdate_year_num_alternative"] = self.birthdate_year_num_alternative
-        self._key_figures["name_number"] = self.name_number
-        self._key_figures["active_number"] = self.active_number
-        self._key_figures["life_path_number_alternative"] = None
-        self._key_figures["destiny_number"] = None
-        self._key_figures["expression_number"] = None
-        self._key_figures["psychic_number"] = None
-        self._key_figures["attitude_number"] = None
-        self._key_figures["karma_number"] = None
-        self._key_figures["karmic_debt_numbers"] = None
-        self._key_figures["power_number"] = None
-        self._key_figures["power_number_alternative"] = None
-        self._key_figures["full_name_numbers"] = None
-        self._key_figures["full_name_missing_numbers"] = None
-
-    @property
-    def name_number(self) -> tuple:
-        """Returns the Name Number.
-
-        Name Numbers, also known as Spiritual Numbers, denote the inner you, as well as any hidden influences that play a role in your life (present and future).
-        It is calculated from adding the numbers assigned to the letters of your name full name. Then reduce till double digits.
-
-        Returns:
-            tuple: Name Number.
-        """
-        active_number = self.get_numerology_sum(self.first_name_num, master_number=False)
-        legacy_number = self.get_numerology_sum(self.last_name_num, master_number=False)
-        nsum = active_number + legacy_number
-        if (nsum,) == self.destiny_number:
-            return self.destiny_number
-        else:
-            return (nsum,) + self.destiny_number
-
-    @property
-    def birthdate_year_num_alternative(self) -> int:
-        """Returns the numerology sum of the birthday year.
-
-        This method sums-reduces the 4 digits of the year.
-        This alternative one reduces upto 2 digits till 52."""
-        return self.get_numerology_sum(
-            fct.int_to_tuple(self.birthdate_year), upper_bound=52, master_number=True
-        )
-
-    @property
-    def active_number(self) -> tuple:
-        """Returns the First Name / Active Number.
-
-        The numbers from your first name.
-
-        Returns:
-            tuple: The Active Number
-        """
-        first_name_compound = self.get_numerology_sum(self.first_name_num, upper_bound=52, master_number=True)
-        first_name_single   = self.get_numerology_sum(self.first_name_num, master_number=False)
-        if first_name_compound == first_name_single:
-            return (first_name_single,)
-        else:
-            return first_name_compound, first_name_single
-
-    @property
-    def birthdate_day_num(self) -> tuple:
-        """Returns the numerology sum of the birthday day.
-
-        Example: The 27 in 1986-03-27 will give 27,9."""
-        birthdate_day_single = self.get_numerology_sum(
-            fct.int_to_tuple(self.birthdate_day), master_number=False
-        )
-        if self.birthdate_day == birthdate_day_single:
-            return (birthdate_day_single,)
-        else:
-            return self.birthdate_day, birthdate_day_single
-
-    @property
-    def life_path_number(self) -> tuple:
-        """Returns the Life Path Number Or Birthdate Number.
-
-        The life path number, also referred as Lucky Number in some places, is the most important one in a numerology chart.
-        It describes the direction of your life journey.
-        It offers insight into the skills and traits you may possess and the kinds of challenges you can expect to face in your life.
-        It is calculated from the birth date.
-
-        This method sums-reduces to one digit the date, month, and year before summing-reducing their total.
-        The alternative method `life_path_number_alternative` sums-reduces to one digit the total of day, month, and year from the birthdate.
-
-        Returns:
-            int: Life Path Number (Initial method).
-        """
-        if self.birthdate:
-            day = self.get_numerology_sum(
-                fct.int_to_tuple(self.birthdate_day), master_number=False
-            )
-            month = self.get_numerology_sum(
-                fct.int_to_tuple(self.birthdate_month), master_number=False
-            )
-            year = self.get_numerology_sum(
-                fct.int_to_tuple(self.birthdate_year), master_number=False
-            )
-            nsum = day + month + year
-            num_sum = self.get_numerology_sum(fct.int_to_tuple(nsum), master_number=False)
-            if nsum == num_sum:
-                return (num_sum,)
-            else:
-                return nsum, num_sum
-        else:
-            print(f"{Colors.WARNING}Birthdate is not set. Cannot calculate Life Path Number.{Colors.ENDC}")
-            return (0,)
+    letter_values = LetterValues(alphabet, vowels, consonants)
+
+    system = "chaldean"
+    interpretations_class = CInterpretations
+
+    # The Chaldean figures keep the compound number before its reduction
+    figure_specs = pNumerology.Numerology.figure_specs.extend(
+        [
+            FigureSpec(
+                "name_number",
+                add(reduce("sum_single", Var("first_name_sum")), reduce("sum_single", Var("last_name_sum"))),
+                COMPOUND,
+                Fig("destiny_number", 0),
+                doc="""Returns the Name Number.
+
+                Name Numbers, also known as Spiritual Numbers, denote the inner you, as well as any hidden influences that play a role in your life (present and future).
+                It is calculated from adding the numbers assigned to the letters of your name full name. Then reduce till double digits.
+
+                Returns:
+                    tuple: Name Number.
+                """,
+            ),
+            FigureSpec(
+                "birthdate_year_num_alternative",
+                recorded(DateField.COMPOUND_YEAR, reduce("digits_compound", Var("birthdate_year"))),
+                doc="""Returns the numerology sum of the birthday year.
+
+                This method sums-reduces the 4 digits of the year.
+                This alternative one reduces upto 2 digits till 52.""",
+            ),
+            FigureSpec(
+                "active_number",
+                reduce("sum_compound", Var("first_name_sum")),
+                COMPOUND,
+                reduce("sum_single", Var("first_name_sum")),
+                doc="""Returns the First Name / Active Number.
+
+                The numbers from your first name.
+
+                Returns:
+                    tuple: The Active Number
+                """,
+            ),
+            FigureSpec(
+                "birthdate_day_num",
+                Var("birthdate_day"),
+                COMPOUND,
+                recorded(DateField.DAY, reduce("digits_single", Var("birthdate_day"))),
+                doc="""Returns the numerology sum of the birthday day.
+
+                Example: The 27 in 1986-03-27 will give 27,9.""",
+            ),
+            FigureSpec(
+                "life_path_number",
+                recorded(
+                    DateField.COMPOUND_LIFE_PATH,
+                    add(
+                        reduce("digits_single", Var("birthdate_day")),
+                        reduce("digits_single", Var("birthdate_month")),
+                        reduce("digits_single", Var("birthdate_year")),
+                    ),
+                ),
+                COMPOUND,
+                recorded(
+                    DateField.LIFE_PATH,
+                    reduce(
+                        "digits_single",
+                        reduce("digits_single", Var("birthdate_day")),
+                        reduce("digits_single", Var("birthdate_month")),
+                        reduce("digits_single", Var("birthdate_year")),
+                    ),
+                ),
+                doc="""Returns the Life Path Number Or Birthdate Number.
+
+                The life path number, also referred as Lucky Number in some places, is the most important one in a numerology chart.
+                It describes the direction of your life journey.
+                It offers insight into the skills and traits you may possess and the kinds of challenges you can expect to face in your life.
+                It is calculated from the birth date.
+
+                This method sums-reduces to one digit the date, month, and year before summing-reducing their total.
+                The alternative method `life_path_number_alternative` sums-reduces to one digit the total of day, month, and year from the birthdate.
+
+                Returns:
+                    int: Life Path Number (Initial method).
+                """,
+            ),
+        ]
+    )
+
+    figure_graph = pNumerology.Numerology.figure_graph.extend(
+        key_figures=(
+            "first_name",
+            "last_name",
+            "birthdate",
+            "life_path_number",
+            "birthdate_day_num",
+            "birthdate_year_num_alternative",
+            "name_number",
+            "active_number",
+            "life_path_number_alternative",
+            "destiny_number",
+            "expression_number",
+            "psychic_number",
+            "attitude_number",
+            "karma_number",
+            "karmic_debt_numbers",
+            "power_number",
+            "power_number_alternative",
+            "full_name_numbers",
+            "full_name_missing_numbers",
+        ),
+        dependencies=figure_specs.dependencies(),
+        empty_figures=(
+            "life_path_number_alternative",
+            "destiny_number",
+            "expression_number",
+            "psychic_number",
+            "attitude_number",
+            "karma_number",
+            "karmic_debt_numbers",
+            "power_number",
+            "power_number_alternative",
+            "full_name_numbers",
+            "full_name_missing_numbers",
+        ),
+    )
+
+    def __init__(
+        self,
+        first_name: str,
+        last_name: str,
+        birthdate: str,
+        verbose: bool = True,
+        ruleset: Optional[Ruleset] = None,
+        date_parser: Optional[DateParser] = None,
+        figures: Optional[Iterable[str]] = None,
+    ):
+        super().__init__(first_name, last_name, birthdate, verbose, ruleset, date_parser, figures)
@@ -0,0 +1,253 @@
+"""Rows of a batch computed once per distinct person, the results being copied to the duplicate rows."""
+import math
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from pythagorean.chart import Chart, ChartResult
+from pythagorean.dates import DateParser
+from pythagorean.interning import IDENTITY_FIGURES
+from pythagorean.names import NAME_CACHE, NameCache
+
+Row = Sequence[Optional[str]]
+
+MASK_64 = (1 << 64) - 1
+
+
+class Slot(NamedTuple):
+    """How `RowDeduplicator.resolve` gives the result of a row planned by `RowDeduplicator.plan`."""
+
+    # Key of the row, None if the row is not deduplicated
+    key: Optional[Hashable]
+    # Position among the rows to compute of the row giving the result, None if computed by a previous chunk
+    position: Optional[int]
+    # Whether the result is copied from a same row
+    copied: bool = False
+    # Result of a same row of a previous chunk, taken by `plan` as it may leave the cache before `resolve`
+    result: Any = None
+
+
+class DistinctCounter:
+    """Number of distinct items added, in bounded memory.
+
+    The items are counted exactly up to `exact_limit`, then forgotten for a HyperLogLog estimate
+    of `2 ** precision` one-byte registers, about 1 % wrong by default however many items are added.
+
+    Args:
+        exact_limit (int, optional): Items kept to count them exactly. Defaults to 4096.
+        precision (int, optional): Bits of the hashes choosing the register, from 4 to 16. Defaults to 14.
+    """
+
+    def __init__(self, exact_limit: int = 4096, precision: int = 14):
+        if not 4 <= precision <= 16:
+            raise ValueError(f"The precision must be from 4 to 16, not {precision}.")
+        self.exact_limit = exact_limit
+        self.precision = precision
+        self.clear()
+
+    def add(self, item: Hashable):
+        """Counts an item, unless it was added before."""
+        items = self._items
+        if items is None:
+            self._add_hash(item)
+            return
+        items.add(item)
+        if len(items) > self.exact_limit:
+            self._items = None
+            self._registers = bytearray(1 << self.precision)
+            for item in items:
+                self._add_hash(item)
+
+    def _add_hash(self, item: Hashable):
+        # The bits of `hash` are mixed (splitmix64), the hashes of integers and tuples being far from random.
+        value = hash(item) & MASK_64
+        value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+        value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+        value ^= value >> 31
+        index = value >> (64 - self.precision)
+        rest = (value << self.precision) & MASK_64
+        # Position of the first 1 bit after the index bits
+        rank = 65 - rest.bit_length() if rest else 65 - self.precision
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def __len__(self) -> int:
+        if self._items is not None:
+            return len(self._items)
+        registers = self._registers
+        size = len(registers)
+        estimate = 0.7213 / (1 + 1.079 / size) * size * size / sum(2.0 ** -rank for rank in registers)
+        empty = registers.count(0)
+        if estimate <= 2.5 * size and empty:
+            # Linear counting, more accurate for the small numbers
+            estimate = size * math.log(size / empty)
+        return round(estimate)
+
+    def clear(self):
+        """Forgets the items."""
+        self._items: Optional[Set[Hashable]] = set()
+        self._registers = bytearray()
+
+
+class DedupStats(NamedTuple):
+    """Counters of a RowDeduplicator."""
+
+    # Rows given
+    rows: int
+    # Rows computed, the other ones getting a copy of the result of a same row
+    computed: int
+    # Distinct pairs of normalized first name and last name, estimated past 4096 (see DistinctCounter)
+    names: int
+    # Distinct birthdates, estimated past 4096
+    dates: int
+
+    @property
+    def ratio(self) -> float:
+        """Rows for a row computed."""
+        return self.rows / self.computed if self.computed else 1.0
+
+    @property
+    def name_ratio(self) -> float:
+        """Rows for distinct names, the name figures being independent of the birthdate."""
+        return self.rows / self.names if self.names else 1.0
+
+    @property
+    def date_ratio(self) -> float:
+        """Rows for distinct birthdates, the birthdate figures being independent of the names."""
+        return self.rows / self.dates if self.dates else 1.0
+
+
+class RowDeduplicator:
+    """Deduplication of the rows of a batch before computing them (see `compute_many` and `compute_parallel`).
+
+    Two rows are the same if their names are the same once normalized as `Functions.keep_valid_letters` does
+    (no accent, lower case, letters only) and their birthdates are the same date. A row is computed once,
+    then its result is copied to the same rows, with their own names and birthdate:
+
+        deduplicator = RowDeduplicator()
+        results = list(compute_many(rows, deduplicator=deduplicator))
+        deduplicator.stats().ratio  # rows for a row computed
+
+    The results are kept for the next chunks and batches of the same settings (system, figures, ruleset,
+    date parser), until `clear` or until they are the least recently used ones of `maxsize` results.
+
+    Args:
+        name_cache (NameCache, optional): Cache normalizing the names. Defaults to NAME_CACHE.
+        maxsize (int, optional): Maximum number of results kept. Defaults to 65536.
+    """
+
+    def __init__(self, name_cache: NameCache = NAME_CACHE, maxsize: int = 65536):
+        self.name_cache = name_cache
+        self.maxsize = maxsize
+        self._results: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._names = DistinctCounter()
+        self._dates = DistinctCounter()
+        self._rows = 0
+        self._computed = 0
+
+    def key(self, row: Row, date_parser: DateParser) -> Optional[Hashable]:
+        """Returns the normalized names and the birthdate of a row, None if the row is not made of 2 or 3 strings.
+
+        A valid birthdate is normalized into (year, month, day), an invalid one is kept as supplied,
+        its diagnostic depending on it, and an empty birthdate is None.
+        """
+        if not 2 <= len(row) <= 3 or not all(isinstance(field, str) for field in row[:2]):
+            return None
+        birthdate = row[2] if len(row) == 3 else None
+        if birthdate is not None and not isinstance(birthdate, str):
+            return None
+        names = (self.name_cache.get(row[0]).cleaned, self.name_cache.get(row[1]).cleaned)
+        date = None
+        if birthdate:
+            parsed, error = date_parser.parse(birthdate)
+            date = birthdate if error is not None else parsed
+        return names, date
+
+    def deduplicate(
+        self,
+        rows: Sequence[Row],
+        context: Hashable,
+        date_parser: DateParser,
+        compute: Callable[[List[Row]], Iterable[Any]],
+        copy: Callable[[Any, Row], Any],
+    ) -> List[Any]:
+        """Returns the results of the rows, computing only the rows not seen yet.
+
+        Args:
+            rows (Sequence[Row]): Rows of (first name, last name, birthdate).
+            context (Hashable): Settings of the computation, the results of other settings not being reused.
+            date_parser (DateParser): Parser of the birthdates.
+            compute (Callable[[List[Row]], Iterable[Any]]): Returns the results of rows.
+            copy (Callable[[Any, Row], Any]): Returns the result of a row for a same row.
+        """
+        todo, slots = self.plan(rows, context, date_parser)
+        return self.resolve(rows, slots, list(compute(todo)), copy)
+
+    def plan(self, rows: Sequence[Row], context: Hashable, date_parser: DateParser) -> Tuple[List[Row], List[Slot]]:
+        """Returns the rows to compute, and the slots of the rows to give to `resolve` with their results."""
+        todo: List[Row] = []
+        slots: List[Slot] = []
+        # Position of the row computed for every key of the chunk
+        planned: Dict[Hashable, int] = {}
+        results = self._results
+        for row in rows:
+            try:
+                key = self.key(row, date_parser)
+            except TypeError:
+                key = None
+            if key is not None:
+                self._names.add(key[0])
+                self._dates.add(key[1])
+                key = (context, key)
+                if key in planned:
+                    slots.append(Slot(key, planned[key], copied=True))
+                    continue
+                if key in results:
+                    results.move_to_end(key)
+                    slots.append(Slot(key, None, copied=True, result=results[key]))
+                    continue
+                planned[key] = len(todo)
+            slots.append(Slot(key, len(todo)))
+            todo.append(row)
+        self._rows += len(rows)
+        self._computed += len(todo)
+        return todo, slots
+
+    def resolve(self, rows: Sequence[Row], slots: List[Slot], computed: List[Any], copy: Callable[[Any, Row], Any]):
+        """Returns the results of the rows, from the results of the rows to compute returned by `plan`."""
+        results = []
+        for row, (key, position, copied, result) in zip(rows, slots):
+            if position is not None:
+                result = computed[position]
+            if copied:
+                result = copy(result, row)
+            elif key is not None:
+                self._results[key] = result
+                if len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+            results.append(result)
+        return results
+
+    def stats(self) -> DedupStats:
+        return DedupStats(self._rows, self._computed, len(self._names), len(self._dates))
+
+    def clear(self):
+        """Forgets the results and resets the counters."""
+        self._results.clear()
+        self._names.clear()
+        self._dates.clear()
+        self._rows = self._computed = 0
+
+
+def with_inputs(result: ChartResult, row: Row) -> ChartResult:
+    """Returns the result of a row for a same row, with the names and birthdate of the row."""
+    chart = result.chart
+    if chart is None:
+        return result
+    inputs = {"first_name": row[0], "last_name": row[1], "birthdate": row[2] if len(row) == 3 else None}
+    if all(chart.key_figures.get(name, inputs[name]) == inputs[name] for name in IDENTITY_FIGURES):
+        return result
+    key_figures = {name: inputs[name] if name in inputs else value for name, value in chart.key_figures.items()}
+    interpretations = {
+        name: inputs[name] if name in inputs else value for name, value in chart.interpretations.items()
+    }
+    return ChartResult(Chart(chart.system, key_figures, interpretations), result.diagnostics)
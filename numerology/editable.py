@@ -0,0 +1,111 @@
+"""Chart of a person edited one input at a time, as in an editor."""
+from typing import Any, FrozenSet, Iterable, Mapping, Optional, Tuple
+
+from pythagorean.chart import Chart
+from pythagorean.dates import DateParser
+from pythagorean.diagnostics import Diagnostic
+from pythagorean.ruleset import Ruleset
+
+from .engine import numerology_system
+
+
+class EditableChart:
+    """A chart whose names and birthdate can be changed, computing again only the figures depending on them.
+
+    Editing the last name leaves the birthdate figures untouched, editing the birthdate leaves
+    the name figures untouched, and so are the interpretations of the untouched figures:
+
+        editable = EditableChart("Barack", "Obam", "1961-08-04")
+        editable.last_name = "Obama"  # fixes the typo
+        editable.chart.key_figures["destiny_number"]  # (5,)
+
+    Nothing is printed: the problems found in the inputs are listed in `diagnostics`.
+
+    Args:
+        first_name (str): First name.
+        last_name (str): Last name.
+        birthdate (str, optional): Birthdate. Defaults to None.
+        system (str, optional): 'pythagorean', 'chaldean' or 'vedic'. Defaults to 'pythagorean'.
+        figures (Iterable[str], optional): Figures to compute. Defaults to None, meaning every key figure.
+        ruleset (Ruleset, optional): Rules of the reductions. Defaults to the ruleset of the system.
+        date_parser (DateParser, optional): Accepted birthdate formats. Defaults to the parser of the system.
+
+    Raises:
+        ValueError: If the system or a figure is unknown.
+    """
+
+    def __init__(
+        self,
+        first_name: str,
+        last_name: str,
+        birthdate: Optional[str] = None,
+        system: str = "pythagorean",
+        figures: Optional[Iterable[str]] = None,
+        ruleset: Optional[Ruleset] = None,
+        date_parser: Optional[DateParser] = None,
+    ):
+        numerology_class, figures = numerology_system(system, figures)
+        self._numerology = numerology_class.evaluate(first_name, last_name, birthdate, ruleset, date_parser, figures)
+        # The requested figures are kept even if the names are not valid yet
+        self._numerology.selected_figures = figures
+        # Key figures computed again by the last change
+        self.updated_figures: FrozenSet[str] = frozenset(self.key_figures)
+
+    def __repr__(self) -> str:
+        return (
+            f"EditableChart({self.first_name!r}, {self.last_name!r}, {self.birthdate!r}, "
+            f"system={self._numerology.system!r})"
+        )
+
+    def update(self, **inputs: Optional[str]) -> FrozenSet[str]:
+        """Changes several inputs at once (`first_name`, `last_name`, `birthdate`).
+
+        Returns:
+            FrozenSet[str]: The key figures computed again.
+        """
+        self.updated_figures = self._numerology.update_inputs(**inputs)
+        return self.updated_figures
+
+    @property
+    def first_name(self) -> str:
+        return self._numerology.first_name
+
+    @first_name.setter
+    def first_name(self, value: str):
+        self.update(first_name=value)
+
+    @property
+    def last_name(self) -> str:
+        return self._numerology.last_name
+
+    @last_name.setter
+    def last_name(self, value: str):
+        self.update(last_name=value)
+
+    @property
+    def birthdate(self) -> Optional[str]:
+        return self._numerology.birthdate
+
+    @birthdate.setter
+    def birthdate(self, value: Optional[str]):
+        self.update(birthdate=value)
+
+    @property
+    def chart(self) -> Optional[Chart]:
+        """Returns the chart of the current inputs, None if the names are not valid."""
+        return self._numerology.chart
+
+    @property
+    def key_figures(self) -> Mapping[str, Any]:
+        chart = self.chart
+        return {} if chart is None else chart.key_figures
+
+    @property
+    def interpretations(self) -> Mapping[str, Any]:
+        chart = self.chart
+        return {} if chart is None else chart.interpretations
+
+    @property
+    def diagnostics(self) -> Tuple[Diagnostic, ...]:
+        """Returns the problems found in the current inputs."""
+        return tuple(self._numerology.diagnostics)
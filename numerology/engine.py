@@ -0,0 +1,227 @@
+"""Entry points computing numerology charts, without printing or logging anything."""
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+
+from chaldean.numerology import CNumerology
+from pythagorean.chart import Chart, ChartResult
+from pythagorean.date_table import DateFigureTable
+from pythagorean.dates import DateParser
+from pythagorean.diagnostics import ROW_ERROR, Diagnostic
+from pythagorean.numerology import Numerology
+from pythagorean.ruleset import Ruleset
+from vedic.numerology import VNumerology
+
+from .dedup import RowDeduplicator, with_inputs
+
+SYSTEMS: Dict[str, Type[Numerology]] = {
+    "pythagorean": Numerology,
+    "chaldean": CNumerology,
+    "vedic": VNumerology,
+}
+
+
+def compute(
+    first_name: str,
+    last_name: str,
+    birthdate: Optional[str] = None,
+    figures: Optional[Iterable[str]] = None,
+    system: str = "pythagorean",
+    ruleset: Optional[Ruleset] = None,
+    date_parser: Optional[DateParser] = None,
+) -> ChartResult:
+    """Computes the chart of a person, or only some of its figures.
+
+    Only the inputs and intermediate figures needed by the requested figures are computed:
+
+        compute("Barack", "Obama", "1961-08-04", figures={"life_path_number", "destiny_number"}).chart
+
+    Args:
+        first_name (str): First name.
+        last_name (str): Last name.
+        birthdate (str, optional): Birthdate. Defaults to None.
+        figures (Iterable[str], optional): Figures to compute (see `figure_graph` of the system).
+            Defaults to None, meaning every key figure.
+        system (str, optional): 'pythagorean', 'chaldean' or 'vedic'. Defaults to 'pythagorean'.
+        ruleset (Ruleset, optional): Rules of the reductions. Defaults to the ruleset of the system.
+        date_parser (DateParser, optional): Accepted birthdate formats. Defaults to the parser of the system.
+
+    Raises:
+        ValueError: If the system or a figure is unknown.
+
+    Returns:
+        ChartResult: The chart, None if the names are not valid, and the problems found in the inputs.
+    """
+    numerology_class, figures = numerology_system(system, figures)
+    numerology = numerology_class.evaluate(first_name, last_name, birthdate, ruleset, date_parser, figures)
+    return ChartResult(numerology.chart, tuple(numerology.diagnostics))
+
+
+def compute_many(
+    rows: Iterable[Sequence[Optional[str]]],
+    system: str = "pythagorean",
+    figures: Optional[Iterable[str]] = None,
+    chunk_size: int = 1024,
+    ruleset: Optional[Ruleset] = None,
+    date_parser: Optional[DateParser] = None,
+    deduplicator: Optional[RowDeduplicator] = None,
+) -> Iterator[ChartResult]:
+    """Computes the charts of many people, lazily and in the order of the rows.
+
+    The rows are read `chunk_size` at a time, so any iterable can be given, as the lines of a huge file.
+    The names are normalized through the shared name cache, the figures are computed by the function compiled
+    for the figures (see FigureSpecs), and every interpretation is translated once and shared between the charts
+    as read-only mappings (see `Interpretations.cached_interpretation`). A row which cannot be computed gives
+    a ROW_ERROR diagnostic instead of stopping the batch:
+
+        for chart, diagnostics in compute_many(csv.reader(file), figures=("life_path_number",)):
+            ...
+
+    Args:
+        rows (Iterable[Sequence[Optional[str]]]): Rows of (first name, last name, birthdate), the birthdate optional.
+        system (str, optional): 'pythagorean', 'chaldean' or 'vedic'. Defaults to 'pythagorean'.
+        figures (Iterable[str], optional): Figures to compute. Defaults to None, meaning every key figure.
+        chunk_size (int, optional): Rows read and computed at once. Defaults to 1024.
+        ruleset (Ruleset, optional): Rules of the reductions. Defaults to the ruleset of the system.
+        date_parser (DateParser, optional): Accepted birthdate formats. Defaults to the parser of the system.
+        deduplicator (RowDeduplicator, optional): Computes the same people once, counting the duplicates.
+            Defaults to None, meaning every row is computed.
+
+    Raises:
+        ValueError: If the system or a figure is unknown, or if `chunk_size` is not positive.
+
+    Returns:
+        Iterator[ChartResult]: The chart of every row, None if the names are not valid, and the problems found.
+    """
+    numerology_class, figures = numerology_system(system, figures)
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, not {chunk_size}.")
+    return _compute_many(iter(rows), numerology_class, figures, chunk_size, ruleset, date_parser, deduplicator)
+
+
+def _compute_many(
+    rows: Iterator[Sequence[Optional[str]]],
+    numerology_class: Type[Numerology],
+    figures: Optional[Tuple[str, ...]],
+    chunk_size: int,
+    ruleset: Optional[Ruleset],
+    date_parser: Optional[DateParser],
+    deduplicator: Optional[RowDeduplicator],
+) -> Iterator[ChartResult]:
+    def compute_chunk(chunk: List[Sequence[Optional[str]]]) -> Iterator[ChartResult]:
+        return evaluate_rows(chunk, numerology_class, figures, ruleset, date_parser)
+
+    parser = date_parser or numerology_class.date_parser
+    context = ("chart", numerology_class.system, figures, (ruleset or numerology_class.ruleset).fingerprint, parser)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        if deduplicator is None:
+            yield from list(compute_chunk(chunk))
+        else:
+            yield from deduplicator.deduplicate(chunk, context, parser, compute_chunk, with_inputs)
+
+
+def evaluate_rows(
+    rows: Iterable[Sequence[Optional[str]]],
+    numerology_class: Type[Numerology],
+    figures: Optional[Tuple[str, ...]] = None,
+    ruleset: Optional[Ruleset] = None,
+    date_parser: Optional[DateParser] = None,
+    interpret: bool = True,
+) -> Iterator[ChartResult]:
+    """Computes the chart of every row with one numerology object, filled with the inputs of every row in turn.
+
+    A row which cannot be computed gives a ROW_ERROR diagnostic. The charts have no interpretation if `interpret`
+    is False, as the charts packed into integers (see ChartPacker).
+    """
+    numerology = numerology_class.__new__(numerology_class)
+    numerology.verbose = False
+    interpretation = numerology_class.interpretations_class.cached_interpretation
+    system = numerology_class.system
+    for row in rows:
+        try:
+            numerology.set_inputs(*check_row(row), ruleset, date_parser)
+            chart = None
+            if numerology.names_are_valid:
+                names, inputs = numerology.select_figures(figures)
+                numerology.init_inner_variables(inputs)
+                key_figures = numerology.compute_figures(names)
+                interpretations = (
+                    {name: interpretation(name, value) for name, value in key_figures.items()} if interpret else {}
+                )
+                chart = Chart(system, key_figures, interpretations)
+            yield ChartResult(chart, tuple(numerology.diagnostics))
+        except Exception as error:
+            yield ChartResult(None, (row_error(error),))
+
+
+def check_row(row: Sequence[Optional[str]]) -> Tuple[str, str, Optional[str]]:
+    """Returns the first name, last name and birthdate of a row, the birthdate optional.
+
+    Raises:
+        ValueError: If the row has not 2 or 3 fields.
+        TypeError: If a field is not a string.
+    """
+    if not 2 <= len(row) <= 3:
+        raise ValueError(f"A row has 2 or 3 fields, not {len(row)}.")
+    birthdate = row[2] if len(row) == 3 else None
+    if not (isinstance(row[0], str) and isinstance(row[1], str) and (birthdate is None or isinstance(birthdate, str))):
+        raise TypeError(f"The fields of a row must be strings: {row!r}.")
+    return row[0], row[1], birthdate
+
+
+def row_error(error: Exception) -> Diagnostic:
+    """Returns the diagnostic of a row which cannot be computed."""
+    return Diagnostic(ROW_ERROR, "row", f"{type(error).__name__}: {error}")
+
+
+def numerology_system(
+    system: str, figures: Optional[Iterable[str]] = None
+) -> Tuple[Type[Numerology], Optional[Tuple[str, ...]]]:
+    """Returns the class of a numerology system, and the figures checked against its figure graph.
+
+    Raises:
+        ValueError: If the system or a figure is unknown.
+    """
+    try:
+        numerology_class = SYSTEMS[system]
+    except KeyError:
+        raise ValueError(f"Unknown numerology system: {system!r}.") from None
+    if figures is not None:
+        figures = tuple(figures)
+        numerology_class.figure_graph.resolve(figures)
+    return numerology_class, figures
+
+
+def compute_all_systems(
+    first_name: str,
+    last_name: str,
+    birthdate: Optional[str] = None,
+    ruleset: Optional[Ruleset] = None,
+    date_parser: Optional[DateParser] = None,
+) -> Dict[str, ChartResult]:
+    """Computes the Pythagorean, Chaldean and Vedic charts of a person in one pass.
+
+    The names and birthdate are checked and normalized once, and the figures of the birthdate
+    common to the three systems are computed once (or read from the date table, see DateFigureTable).
+
+    Args:
+        first_name (str): First name.
+        last_name (str): Last name.
+        birthdate (str, optional): Birthdate. Defaults to None.
+        ruleset (Ruleset, optional): Rules of the reductions. Defaults to DEFAULT_RULESET.
+        date_parser (DateParser, optional): Accepted birthdate formats. Defaults to ISO_DATE_PARSER.
+
+    Returns:
+        Dict[str, ChartResult]: The charts by numerology system, with the problems found in the inputs.
+    """
+    # Checks the inputs without computing any figure
+    inputs = Numerology.evaluate(first_name, last_name, birthdate, ruleset, date_parser, figures=())
+    if inputs.birthdate_is_valid and inputs.date_record is None:
+        inputs.date_record = DateFigureTable.date_figures(*inputs.birthdate_parsed, ruleset=inputs.ruleset)
+    results = {}
+    for system, numerology_class in SYSTEMS.items():
+        numerology = numerology_class.from_inputs(inputs)
+        results[system] = ChartResult(numerology.chart, tuple(numerology.diagnostics))
+    return results
@@ -0,0 +1,295 @@
+"""Charts of a table computed again only for the rows changed since the previous run."""
+import ast
+import glob
+import hashlib
+import json
+import os
+import sys
+from itertools import islice
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from pythagorean import common, date_table, dates, figures, letters, names, reduction, specs
+from pythagorean.chart import Chart, ChartResult
+from pythagorean.dates import DateParser
+from pythagorean.diagnostics import Diagnostic
+from pythagorean.interning import IDENTITY_FIGURES
+from pythagorean.ruleset import Ruleset
+
+from . import packing
+from .dedup import RowDeduplicator
+from .engine import evaluate_rows, numerology_system
+from .jobs import fsync_directory
+from .packing import ChartPacker
+
+# Status of a row compared with the previous run
+ADDED = "added"
+CHANGED = "changed"
+# Same figures and interpretations as in the previous run
+UNCHANGED = "unchanged"
+# Same figures, but interpreted by other meanings than in the previous run
+RERENDERED = "rerendered"
+
+# Modules computing the figures, besides the modules of the numerology classes
+FIGURE_MODULES = (common, date_table, dates, figures, letters, names, reduction, specs, packing)
+
+
+class IncrementalResult(NamedTuple):
+    """Chart of a row of `IncrementalBatch.run`, and whether it changed since the previous run."""
+
+    row_id: Hashable
+    result: ChartResult
+    status: str
+
+
+class IncrementalReport(NamedTuple):
+    """Rows of a run of an IncrementalBatch, by status."""
+
+    added: int
+    changed: int
+    unchanged: int
+    rerendered: int
+    # Rows of the previous run missing in this one
+    removed: int
+
+
+class ManifestEntry(NamedTuple):
+    """What is kept of a row between the runs: its content hash, its packed chart and its diagnostics.
+
+    The hash is None if the row is to be computed again anyway, as a row which cannot be computed.
+    The key figures but the names and the birthdate are kept unpacked if the chart cannot be packed exactly
+    (see `ChartPacker.is_exact`), None otherwise.
+    """
+
+    hash: Optional[str]
+    words: Optional[Tuple[int, ...]]
+    diagnostics: Tuple[Diagnostic, ...]
+    key_figures: Optional[Dict[str, Any]] = None
+
+
+def source_fingerprint(paths: Iterable[str]) -> str:
+    """Returns a hash of the contents of the files."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(paths):
+        with open(path, "rb") as file:
+            digest.update(os.path.basename(path).encode("utf-8"))
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+class IncrementalBatch:
+    """Charts of a table of people computed again only for the rows added or changed since the previous run.
+
+    A manifest file keeps, for every row id, a hash of the content of the row (names normalized as
+    `Functions.keep_valid_letters` does, birthdate, version of the figures), the chart packed into integers
+    (see ChartPacker) and its diagnostics. The rows whose hash did not change are not computed again: their figures
+    are unpacked from the manifest and interpreted with the current meanings, so that a change of the meanings
+    alone does not compute any figure again:
+
+        batch = IncrementalBatch("charts.manifest")
+        for row_id, (chart, diagnostics), status in batch.run(users):  # rows of (id, first, last, birthdate)
+            if status != UNCHANGED:
+                save(row_id, chart)
+        batch.report()  # IncrementalReport(added=..., changed=..., unchanged=..., rerendered=..., removed=...)
+
+    The manifest is replaced once every row has been read, the rows missing in the run being removed.
+    The row ids are kept in the JSON manifest, so they must be strings or integers.
+
+    Args:
+        manifest_path (str): Manifest of the previous run, created by the first run.
+        system (str, optional): 'pythagorean', 'chaldean' or 'vedic'. Defaults to 'pythagorean'.
+        ruleset (Ruleset, optional): Rules of the reductions. Defaults to the ruleset of the system.
+        date_parser (DateParser, optional): Accepted birthdate formats. Defaults to the parser of the system.
+        chunk_size (int, optional): Rows read and computed at once. Defaults to 1024.
+
+    Raises:
+        ValueError: If the system is unknown or if `chunk_size` is not positive.
+    """
+
+    def __init__(
+        self,
+        manifest_path: str,
+        system: str = "pythagorean",
+        ruleset: Optional[Ruleset] = None,
+        date_parser: Optional[DateParser] = None,
+        chunk_size: int = 1024,
+    ):
+        self.numerology_class, _ = numerology_system(system)
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, not {chunk_size}.")
+        self.manifest_path = manifest_path
+        self.system = system
+        self.ruleset = ruleset or self.numerology_class.ruleset
+        self.date_parser = date_parser or self.numerology_class.date_parser
+        self.chunk_size = chunk_size
+        self.packer = ChartPacker(self.ruleset)
+        # Normalizes the names and birthdates of the rows as the deduplication does
+        self.deduplicator = RowDeduplicator()
+        self.figures_version = self.get_figures_version()
+        self.meanings_version = self.get_meanings_version()
+        self._report = IncrementalReport(0, 0, 0, 0, 0)
+
+    def get_figures_version(self) -> str:
+        """Returns a hash of the system, the ruleset and the source code of the modules computing the figures."""
+        paths = {module.__file__ for module in FIGURE_MODULES}
+        paths.update(sys.modules[cls.__module__].__file__ for cls in self.numerology_class.__mro__[:-1])
+        return f"{self.system}:{self.ruleset.fingerprint.hex()}:{source_fingerprint(paths)}"
+
+    def get_meanings_version(self) -> str:
+        """Returns a hash of the source code of the interpretations and meanings, and of the translations."""
+        paths = set()
+        for cls in self.numerology_class.interpretations_class.__mro__[:-1]:
+            module_path = sys.modules[cls.__module__].__file__
+            paths.add(module_path)
+            paths.update(glob.glob(os.path.join(os.path.dirname(module_path), "meanings", "*.py")))
+        locale_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "locale")
+        paths.update(glob.glob(os.path.join(locale_path, "*", "LC_MESSAGES", "*.mo")))
+        return source_fingerprint(paths)
+
+    def report(self) -> IncrementalReport:
+        """Returns the rows of the last run, by status."""
+        return self._report
+
+    def run(self, rows: Iterable[Sequence[Any]]) -> Iterator[IncrementalResult]:
+        """Yields the chart of every row of (id, first name, last name, birthdate), the birthdate optional.
+
+        The manifest is replaced when the last row has been yielded.
+
+        Raises:
+            TypeError: If a row id is not a string or an integer, which JSON would not give back as it is.
+        """
+        previous_meanings, previous = self.read_manifest()
+        rerendered = previous_meanings != self.meanings_version
+        manifest: Dict[Hashable, ManifestEntry] = {}
+        counts = dict.fromkeys((ADDED, CHANGED, UNCHANGED, RERENDERED), 0)
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                break
+            for result in self._run_chunk(chunk, previous, manifest, rerendered):
+                counts[result.status] += 1
+                yield result
+        self.write_manifest(manifest)
+        removed = sum(1 for row_id in previous if row_id not in manifest)
+        self._report = IncrementalReport(removed=removed, **counts)
+
+    def _run_chunk(
+        self,
+        chunk: List[Sequence[Any]],
+        previous: Dict[Hashable, ManifestEntry],
+        manifest: Dict[Hashable, ManifestEntry],
+        rerendered: bool,
+    ) -> List[IncrementalResult]:
+        results: List[Optional[IncrementalResult]] = []
+        # Rows to compute, and their position and hash
+        todo: List[Tuple[int, Optional[str], Sequence[Any]]] = []
+        for position, row in enumerate(chunk):
+            row_id, person = row[0], row[1:]
+            if not isinstance(row_id, (str, int)):
+                raise TypeError(f"A row id must be a string or an integer, not {type(row_id).__name__}: {row_id!r}.")
+            try:
+                key = self.deduplicator.key(person, self.date_parser)
+            except TypeError:
+                key = None
+            content_hash = None if key is None else self.content_hash(key)
+            entry = previous.get(row_id)
+            if content_hash is not None and entry is not None and entry.hash == content_hash:
+                manifest[row_id] = entry
+                result = self.unpack_result(entry, person, isinstance(key[1], tuple))
+                results.append(IncrementalResult(row_id, result, RERENDERED if rerendered else UNCHANGED))
+            else:
+                todo.append((position, content_hash, person))
+                results.append(None)
+
+        people = [person for _, _, person in todo]
+        computed = evaluate_rows(people, self.numerology_class, None, self.ruleset, self.date_parser)
+        for (position, content_hash, _), result in zip(todo, computed):
+            row_id = chunk[position][0]
+            words = key_figures = None
+            if result.chart is not None:
+                try:
+                    words = self.packer.pack(result.chart)
+                    exact = self.packer.is_exact(self.system, words)
+                except ValueError:
+                    exact = False
+                if not exact:
+                    key_figures = {
+                        name: value for name, value in result.chart.key_figures.items() if name not in IDENTITY_FIGURES
+                    }
+            manifest[row_id] = ManifestEntry(content_hash, words, result.diagnostics, key_figures)
+            results[position] = IncrementalResult(row_id, result, ADDED if row_id not in previous else CHANGED)
+        return results
+
+    def content_hash(self, key: Tuple[Tuple[str, str], Any]) -> str:
+        """Returns the hash of the normalized names and birthdate of a row (see `RowDeduplicator.key`)."""
+        (first_name, last_name), date = key
+        if date is None:
+            date = ""
+        elif isinstance(date, tuple):
+            date = "{:04d}-{:02d}-{:02d}".format(*date)
+        else:
+            # Invalid birthdate, as supplied
+            date = f"!{date}"
+        content = "\t".join((first_name, last_name, date, self.figures_version))
+        return hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+    def unpack_result(self, entry: ManifestEntry, person: Sequence[Any], birthdate_is_valid: bool) -> ChartResult:
+        """Returns the chart of a row from its manifest entry, interpreted with the current meanings."""
+        if entry.key_figures is not None:
+            unpacked = entry.key_figures
+        elif entry.words is not None:
+            unpacked = self.packer.unpack(self.system, entry.words)
+        else:
+            return ChartResult(None, entry.diagnostics)
+        inputs = {"first_name": person[0], "last_name": person[1], "birthdate": person[2] if len(person) == 3 else None}
+        key_figures = {}
+        for name in self.numerology_class.figure_graph.key_figures:
+            if name in unpacked:
+                key_figures[name] = unpacked[name]
+            elif name in IDENTITY_FIGURES and (name != "birthdate" or birthdate_is_valid):
+                key_figures[name] = inputs[name]
+        interpretation = self.numerology_class.interpretations_class.cached_interpretation
+        interpretations = {name: interpretation(name, value) for name, value in key_figures.items()}
+        return ChartResult(Chart(self.system, key_figures, interpretations), entry.diagnostics)
+
+    def read_manifest(self) -> Tuple[Optional[str], Dict[Hashable, ManifestEntry]]:
+        """Returns the meanings version and the entries of the manifest, None and no entry if there is none."""
+        try:
+            file = open(self.manifest_path, encoding="utf-8")
+        except FileNotFoundError:
+            return None, {}
+        with file:
+            header = json.loads(file.readline())
+            entries = {}
+            for line in file:
+                entry = json.loads(line)
+                words = entry["words"]
+                key_figures = entry.get("key_figures")
+                entries[entry["id"]] = ManifestEntry(
+                    entry["hash"],
+                    None if words is None else tuple(words),
+                    tuple(Diagnostic(*diagnostic) for diagnostic in entry["diagnostics"]),
+                    None if key_figures is None else ast.literal_eval(key_figures),
+                )
+        return header["meanings_version"], entries
+
+    def write_manifest(self, manifest: Dict[Hashable, ManifestEntry]):
+        """Replaces the manifest at once, so that a crash leaves the previous one."""
+        temporary_path = f"{self.manifest_path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            header = {"figures_version": self.figures_version, "meanings_version": self.meanings_version}
+            file.write(json.dumps(header) + "\n")
+            for row_id, entry in manifest.items():
+                line = {
+                    "id": row_id,
+                    "hash": entry.hash,
+                    "words": entry.words,
+                    "diagnostics": entry.diagnostics,
+                    # As a Python literal, so that the tuples and the integer keys come back as they are
+                    "key_figures": None if entry.key_figures is None else repr(entry.key_figures),
+                }
+                file.write(json.dumps(line, ensure_ascii=False, separators=(",", ":")) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.manifest_path)
+        fsync_directory(os.path.dirname(os.path.abspath(self.manifest_path)))
@@ -0,0 +1,264 @@
+"""Batch jobs computing the charts of a CSV file into a JSON lines file, resumable after a crash.
+
+    python -m numerology.jobs people.csv charts.jsonl --workers 8
+    python -m numerology.jobs people.csv charts.jsonl --workers 8 --resume
+"""
+import argparse
+import csv
+import json
+import os
+from collections import deque
+from typing import Any, BinaryIO, Deque, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from pythagorean.dates import DateParser
+from pythagorean.diagnostics import Diagnostic
+from pythagorean.interning import IDENTITY_FIGURES
+from pythagorean.ruleset import Ruleset
+
+from .batch import compute_parallel
+from .dedup import RowDeduplicator
+from .engine import compute_many, numerology_system
+from .packing import ChartPacker
+
+
+class Checkpoint(NamedTuple):
+    """Progress of a batch job: the rows before `input_offset` have their lines before `output_offset`.
+
+    Attributes:
+        input_offset (int): Position in bytes of the first row not computed in the input file.
+        output_offset (int): Size in bytes of the output file holding the rows computed.
+        rows (int): Rows computed.
+        settings (Dict[str, Any]): Settings of the job, which must be the same to resume it.
+    """
+
+    input_offset: int
+    output_offset: int
+    rows: int
+    settings: Dict[str, Any]
+
+    @classmethod
+    def read(cls, path: str) -> Optional["Checkpoint"]:
+        """Returns the checkpoint saved in a file, None if there is none."""
+        try:
+            with open(path, encoding="utf-8") as file:
+                return cls(**json.load(file))
+        except FileNotFoundError:
+            return None
+
+    def write(self, path: str):
+        """Saves the checkpoint on disk, replacing the previous one at once so that a crash leaves one of them."""
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(self._asdict(), file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+        fsync_directory(os.path.dirname(os.path.abspath(path)))
+
+
+class JobReport(NamedTuple):
+    """Rows of the input file computed by a batch job."""
+
+    # Rows computed by this run
+    rows: int
+    # Rows computed by the previous runs, skipped when resuming
+    resumed_rows: int
+    # Checkpoints written by this run
+    checkpoints: int
+
+
+def run_job(
+    input_path: str,
+    output_path: str,
+    system: str = "pythagorean",
+    workers: int = 0,
+    chunk_size: int = 4096,
+    checkpoint_every: int = 100_000,
+    resume: bool = False,
+    ruleset: Optional[Ruleset] = None,
+    date_parser: Optional[DateParser] = None,
+    deduplicator: Optional[RowDeduplicator] = None,
+) -> JobReport:
+    """Computes the full chart of every row of a CSV file of (first name, last name, birthdate), the birthdate optional.
+
+    Every row gives one line of JSON in the output file, in the order of the input:
+    `{"row": 0, "key_figures": {...}, "diagnostics": [["invalid_date", "birthdate", "..."]]}`, the key figures
+    being null if the names are not valid, the names and the birthdate being left out.
+    The lines are the same with or without worker processes.
+
+    About every `checkpoint_every` rows, the output file is flushed to disk, then the positions reached
+    in the input and output files are saved in `<output_path>.checkpoint`. A job stopped at any time is resumed
+    from its last checkpoint, the lines written after it being truncated, so that no row is lost or written twice.
+
+    Args:
+        input_path (str): CSV file, one row a line.
+        output_path (str): JSON lines file, overwritten unless the job is resumed.
+        system (str, optional): 'pythagorean', 'chaldean' or 'vedic'. Defaults to 'pythagorean'.
+        workers (int, optional): Worker processes (see `compute_parallel`), 0 to compute in this process.
+            Defaults to 0.
+        chunk_size (int, optional): Rows read and computed at once. Defaults to 4096.
+        checkpoint_every (int, optional): Rows between checkpoints, rounded up to whole chunks. Defaults to 100000.
+        resume (bool, optional): Whether to resume from the checkpoint of the output file, if any. Defaults to False.
+        ruleset (Ruleset, optional): Rules of the reductions. Defaults to the ruleset of the system.
+        date_parser (DateParser, optional): Accepted birthdate formats. Defaults to the parser of the system.
+        deduplicator (RowDeduplicator, optional): Computes the same people once. Defaults to None.
+
+    Raises:
+        ValueError: If the system is unknown, if `workers`, `chunk_size` or `checkpoint_every` is not valid,
+            or if the checkpoint was written by a job of other settings or does not match the output file.
+
+    Returns:
+        JobReport: The rows computed.
+    """
+    numerology_class, _ = numerology_system(system)
+    if workers < 0:
+        raise ValueError(f"workers must be positive or 0, not {workers}.")
+    if chunk_size < 1 or checkpoint_every < 1:
+        raise ValueError("chunk_size and checkpoint_every must be positive.")
+    ruleset = ruleset or numerology_class.ruleset
+    parser = date_parser or numerology_class.date_parser
+    settings = {
+        "system": system,
+        "ruleset": ruleset.fingerprint.hex(),
+        "date_formats": [date_format.pattern for date_format in parser.formats],
+    }
+    checkpoint_path = f"{output_path}.checkpoint"
+
+    checkpoint = Checkpoint.read(checkpoint_path) if resume else None
+    if checkpoint is not None:
+        if checkpoint.settings != settings:
+            raise ValueError(f"The checkpoint was written by a job of other settings: {checkpoint.settings}.")
+        if not os.path.exists(output_path) or os.path.getsize(output_path) < checkpoint.output_offset:
+            raise ValueError(f"The output file is shorter than its checkpoint: {output_path}.")
+    resumed_rows = 0 if checkpoint is None else checkpoint.rows
+    mode = "r+b"
+    if checkpoint is None:
+        # Replaces the checkpoint of another job before the output file is emptied
+        checkpoint = Checkpoint(0, 0, 0, settings)
+        checkpoint.write(checkpoint_path)
+        mode = "wb"
+
+    with open(input_path, "rb") as input_file, open(output_path, mode) as output:
+        input_file.seek(checkpoint.input_offset)
+        output.truncate(checkpoint.output_offset)
+        output.seek(checkpoint.output_offset)
+
+        # Rows read and position in the input file at the end of every chunk read
+        boundaries: Deque[Tuple[int, int]] = deque()
+        rows = read_rows(input_file, chunk_size, checkpoint.rows, boundaries)
+        if workers:
+            packer = ChartPacker(ruleset)
+            packed = compute_parallel(
+                rows,
+                system,
+                workers,
+                chunk_size,
+                ordered=True,
+                ruleset=ruleset,
+                date_parser=date_parser,
+                deduplicator=deduplicator,
+            )
+            results = ((result.unpack(packer, system), result.diagnostics) for result in packed)
+        else:
+            charts = compute_many(
+                rows, system, chunk_size=chunk_size, ruleset=ruleset, date_parser=date_parser, deduplicator=deduplicator
+            )
+            results = ((figures_of(chart.key_figures) if chart else None, diagnostics) for chart, diagnostics in charts)
+
+        index = checkpoint.rows
+        checkpoints = 0
+        for key_figures, diagnostics in results:
+            output.write(dump_line(index, key_figures, diagnostics))
+            index += 1
+            while boundaries and boundaries[0][0] <= index:
+                boundary_rows, input_offset = boundaries.popleft()
+                if boundary_rows == index and index - checkpoint.rows >= checkpoint_every:
+                    checkpoint = save_checkpoint(output, checkpoint_path, input_offset, index, settings)
+                    checkpoints += 1
+        if index > checkpoint.rows or checkpoint.input_offset != input_file.tell():
+            save_checkpoint(output, checkpoint_path, input_file.tell(), index, settings)
+            checkpoints += 1
+    return JobReport(index - resumed_rows, resumed_rows, checkpoints)
+
+
+def read_rows(
+    input_file: BinaryIO, chunk_size: int, rows: int, boundaries: Deque[Tuple[int, int]]
+) -> Iterator[List[str]]:
+    """Yields the CSV rows of the input file, appending the rows read and the position to `boundaries` every chunk.
+
+    A row is a line: the fields cannot contain new lines.
+    """
+    while True:
+        lines = [line for line in (input_file.readline() for _ in range(chunk_size)) if line]
+        if not lines:
+            return
+        rows += len(lines)
+        boundaries.append((rows, input_file.tell()))
+        for line in lines:
+            yield next(csv.reader([line.decode("utf-8", "replace").rstrip("\r\n")]), [])
+
+
+def figures_of(key_figures: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the key figures but the names and the birthdate."""
+    return {name: value for name, value in key_figures.items() if name not in IDENTITY_FIGURES}
+
+
+def dump_line(index: int, key_figures: Optional[Dict[str, Any]], diagnostics: Sequence[Diagnostic]) -> bytes:
+    line = {"row": index, "key_figures": key_figures, "diagnostics": [list(diagnostic) for diagnostic in diagnostics]}
+    return (json.dumps(line, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def save_checkpoint(output: BinaryIO, path: str, input_offset: int, rows: int, settings: Dict[str, Any]) -> Checkpoint:
+    """Flushes the output file to disk, then saves the checkpoint."""
+    output.flush()
+    os.fsync(output.fileno())
+    checkpoint = Checkpoint(input_offset, output.tell(), rows, settings)
+    checkpoint.write(path)
+    return checkpoint
+
+
+def fsync_directory(path: str):
+    """Flushes a directory to disk, so that a file renamed in it stays renamed after a crash (POSIX only)."""
+    if os.name != "posix":
+        return
+    descriptor = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def main(arguments: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="Compute the charts of a CSV file into a JSON lines file.")
+    parser.add_argument("input", help="CSV file of first name, last name and birthdate (optional), one row a line")
+    parser.add_argument("output", help="JSON lines file, one chart a line")
+    parser.add_argument("--system", default="pythagorean", help="pythagorean, chaldean or vedic")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes, 0 to compute in this process")
+    parser.add_argument("--chunk-size", type=int, default=4096, help="Rows read and computed at once")
+    parser.add_argument("--checkpoint-every", type=int, default=100_000, help="Rows between checkpoints")
+    parser.add_argument("--resume", action="store_true", help="Resume from the checkpoint of the output file")
+    parser.add_argument("--deduplicate", action="store_true", help="Compute the same people once")
+    args = parser.parse_args(arguments)
+
+    deduplicator = RowDeduplicator() if args.deduplicate else None
+    report = run_job(
+        args.input,
+        args.output,
+        args.system,
+        args.workers,
+        args.chunk_size,
+        args.checkpoint_every,
+        args.resume,
+        deduplicator=deduplicator,
+    )
+    print(f"{report.rows} rows computed, {report.resumed_rows} resumed, {report.checkpoints} checkpoints.")
+    if deduplicator is not None:
+        stats = deduplicator.stats()
+        print(
+            f"Rows for a row computed: {stats.ratio:.2f} "
+            f"(names: {stats.name_ratio:.2f}, dates: {stats.date_ratio:.2f})."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -21,7 +21,6 @@ except Exception:
     language = gettext.translation(
         "numerology", localedir=localedir_path, languages=[default_lang]
     )
-language.install()
 _ = language.gettext
 
 print(_("Welcome!"))
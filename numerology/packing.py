@@ -0,0 +1,372 @@
+"""Canonical encoding of numerology charts into 64-bit integers."""
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple, Union
+
+from pythagorean.chart import Chart
+from pythagorean.ruleset import DEFAULT_RULESET, Ruleset
+
+from .engine import SYSTEMS
+
+
+class BitLayout:
+    """Unsigned integer fields of fixed widths packed into one integer, the first field in the lowest bits.
+
+    The values too large for a saturating field are packed as the largest value of the field,
+    which stands for itself or more (see `is_saturated`).
+
+    Args:
+        fields (Iterable[Tuple[str, int]]): Names and widths in bits of the fields.
+        saturating (Iterable[str], optional): Names of the saturating fields. Defaults to none.
+    """
+
+    def __init__(self, fields: Iterable[Tuple[str, int]], saturating: Iterable[str] = ()):
+        self.fields: Tuple[Tuple[str, int, int], ...] = ()
+        offset = 0
+        for name, width in fields:
+            self.fields += ((name, offset, width),)
+            offset += width
+        self.bits = offset
+        self.saturating = frozenset(saturating)
+
+    def pack(self, values: Mapping[str, int]) -> int:
+        """Packs the values of the fields.
+
+        Raises:
+            ValueError: If a value does not fit in its field, or is negative.
+        """
+        word = 0
+        for name, offset, width in self.fields:
+            value = values[name]
+            if name in self.saturating and value >= 1 << width:
+                value = (1 << width) - 1
+            if not 0 <= value < 1 << width:
+                raise ValueError(f"{name}={value} does not fit in {width} bits.")
+            word |= value << offset
+        return word
+
+    def unpack(self, word: int) -> Dict[str, int]:
+        """Returns the values of the fields."""
+        return {name: (word >> offset) & ((1 << width) - 1) for name, offset, width in self.fields}
+
+    def is_saturated(self, word: int) -> bool:
+        """Returns whether a saturating field holds its largest value, which may stand for a larger one."""
+        return any(
+            (word >> offset) & ((1 << width) - 1) == (1 << width) - 1
+            for name, offset, width in self.fields
+            if name in self.saturating
+        )
+
+
+def compound(first: int, second: int) -> Tuple[int, ...]:
+    """Returns the figure made of a compound number and its reduction, a single number if they are equal."""
+    return (second,) if first == second else (first, second)
+
+
+def permutation_rank(permutation: Sequence[int]) -> int:
+    """Returns the rank of a permutation of 0 to n - 1 in lexicographic order, from 0 to n! - 1."""
+    rank = 0
+    remaining = sorted(permutation)
+    for item in permutation:
+        index = remaining.index(item)
+        rank = rank * len(remaining) + index
+        del remaining[index]
+    return rank
+
+
+def permutation_of_rank(rank: int, size: int) -> List[int]:
+    """Returns the permutation of 0 to size - 1 of a rank given by `permutation_rank`."""
+    indexes = []
+    for radix in range(1, size + 1):
+        rank, index = divmod(rank, radix)
+        indexes.append(index)
+    remaining = list(range(size))
+    return [remaining.pop(index) for index in reversed(indexes)]
+
+
+class ChartPacker:
+    """Canonical encoding of the key figures of a chart into unsigned 64-bit integers.
+
+    A Pythagorean chart is packed into three integers (the name figures, the occurrences of the full name numbers,
+    then the birthdate figures), a Chaldean or a Vedic chart into one. Packed charts can be hashed, compared,
+    deduplicated, stored in `array('Q')` or NumPy uint64 columns and sent to other processes at 8 or 24 bytes a chart:
+
+        packer = ChartPacker()
+        words = packer.pack(chart)
+        packer.unpack(chart.system, words)  # the key figures, but the names and the birthdate
+
+    The names and the birthdate are not packed, and the birthdate figures are left out of the unpacked figures
+    if the chart has none. The figures derived from others (the Pythagorean destiny number, expression number
+    and missing numbers) are not stored but computed back with the ruleset, which must be the ruleset of the chart.
+    The figures of the names growing with their length saturate, so that any name can be packed:
+    the occurrences of the full name numbers at 127, the Pythagorean hearts desire and personality numbers
+    (multiples of 11 being master numbers) at 65535 and the Chaldean compound active number at 4095.
+    The charts of the names reaching these values are not packed exactly (see `is_exact`).
+
+    Args:
+        ruleset (Ruleset, optional): Rules of the charts. Defaults to DEFAULT_RULESET.
+    """
+
+    WORD_BITS = 64
+    WORDS = {"pythagorean": 3, "chaldean": 1, "vedic": 1}
+
+    # The figures reduced with master numbers take 8 bits, the single digits 4 bits, the compound numbers 8 bits,
+    # but the figures of the names without upper bound, which saturate.
+    PYTHAGOREAN_NAMES = BitLayout(
+        [
+            ("hearts_desire_number", 16),
+            ("personality_number", 16),
+            ("active_number", 4),
+            ("legacy_number", 4),
+            # Rank of the order of the numbers from 1 to 9 in full_name_numbers, then of the missing numbers
+            # (see `permutation_rank`), so that the numbers of the same count keep their order: 9! fits in 19 bits.
+            ("number_order", 19),
+        ],
+        saturating=("hearts_desire_number", "personality_number"),
+    )
+    # The occurrences of the numbers from 1 to 9 in the full name, saturated at COUNT_MAX.
+    # A count is never 0 for a number of the name, so the missing numbers are exact.
+    PYTHAGOREAN_NUMBERS = BitLayout(
+        [(f"count_{number}", 7) for number in range(1, 10)], saturating=[f"count_{number}" for number in range(1, 10)]
+    )
+    COUNT_MAX = 127
+    # The karmic debts are stored as 1 + their index in the sorted karmic debt numbers, 0 if there is none.
+    KARMIC_DEBT_FIGURES = (
+        "life_path_number",
+        "hearts_desire_number",
+        "personality_number",
+        "destiny_number",
+        "birthdate_day_num",
+    )
+    PYTHAGOREAN_BIRTHDATE = BitLayout(
+        [
+            ("life_path_number", 4),
+            ("life_path_number_alternative", 4),
+            ("birthdate_day_num", 4),
+            ("birthdate_month_num", 4),
+            ("birthdate_year_num", 4),
+            ("birthdate_year_num_alternative", 4),
+            ("attitude_number", 4),
+            ("karma_number", 4),
+            ("power_number", 4),
+            ("power_number_alternative", 4),
+        ]
+        + [(f"karmic_{name}", 3) for name in KARMIC_DEBT_FIGURES]
+    )
+    CHALDEAN = BitLayout(
+        [
+            ("life_path_number_compound", 8),
+            ("life_path_number", 4),
+            ("birthdate_day_num_compound", 8),
+            ("birthdate_day_num", 4),
+            ("birthdate_year_num_alternative", 8),
+            ("name_number_compound", 8),
+            ("name_number", 8),
+            ("active_number_compound", 12),
+            ("active_number", 4),
+        ],
+        saturating=("active_number_compound",),
+    )
+    VEDIC = BitLayout(
+        [
+            ("name_number", 8),
+            ("destiny_number", 4),
+            ("psychic_number", 4),
+        ]
+    )
+    # Layouts of the integers of a packed chart, by system
+    LAYOUTS = {
+        "pythagorean": (PYTHAGOREAN_NAMES, PYTHAGOREAN_NUMBERS, PYTHAGOREAN_BIRTHDATE),
+        "chaldean": (CHALDEAN,),
+        "vedic": (VEDIC,),
+    }
+
+    def __init__(self, ruleset: Ruleset = DEFAULT_RULESET):
+        self.ruleset = ruleset
+        self.karmic_debts: Tuple[int, ...] = tuple(sorted(ruleset.karmic_debts))
+        if len(self.karmic_debts) > 7:
+            raise ValueError("At most 7 karmic debt numbers can be packed.")
+
+    def pack(self, chart: Union[Chart, Mapping[str, Any]], system: str = None) -> Tuple[int, ...]:
+        """Packs the key figures of a full chart.
+
+        Args:
+            chart (Union[Chart, Mapping[str, Any]]): A chart, or its key figures with the numerology system.
+            system (str, optional): Numerology system of the key figures. Defaults to the system of the chart.
+
+        Raises:
+            ValueError: If a figure is missing, does not fit in its field, or was not computed with the ruleset.
+
+        Returns:
+            Tuple[int, ...]: The packed chart.
+        """
+        if isinstance(chart, Chart):
+            system, key_figures = chart.system, chart.key_figures
+        else:
+            key_figures = chart
+        try:
+            pack = getattr(self, f"_pack_{system}")
+        except AttributeError:
+            raise ValueError(f"Unknown numerology system: {system!r}.") from None
+        try:
+            return pack(key_figures)
+        except (KeyError, IndexError, TypeError) as error:
+            raise ValueError(f"Not a full {system} chart: {error!r}.") from None
+
+    def is_exact(self, system: str, words: Tuple[int, ...]) -> bool:
+        """Returns whether a packed chart unpacks into the figures it was packed from.
+
+        The charts with a saturated figure are not exact, the figure being possibly too low.
+        """
+        return not any(layout.is_saturated(word) for layout, word in zip(self.LAYOUTS[system], words))
+
+    def unpack(self, system: str, words: Tuple[int, ...]) -> Dict[str, Any]:
+        """Returns the key figures of a packed chart, in display order, but the names and the birthdate.
+
+        Raises:
+            ValueError: If the system is unknown or the number of integers is not the one of the system.
+        """
+        try:
+            unpack = getattr(self, f"_unpack_{system}")
+        except AttributeError:
+            raise ValueError(f"Unknown numerology system: {system!r}.") from None
+        if len(words) != self.WORDS[system]:
+            raise ValueError(f"A packed {system} chart is made of {self.WORDS[system]} integers.")
+        figures = unpack(*words)
+        graph = SYSTEMS[system].figure_graph
+        return {
+            name: figures.get(name)
+            for name in graph.key_figures
+            if name in figures or name in graph.empty_figures
+        }
+
+    # PYTHAGOREAN
+
+    def _pack_pythagorean(self, key_figures: Mapping[str, Any]) -> Tuple[int, int, int]:
+        active_number = key_figures["active_number"][0]
+        legacy_number = key_figures["legacy_number"][0]
+        if key_figures["destiny_number"] != (self.ruleset.sum_master[active_number + legacy_number],):
+            raise ValueError("The chart was not computed with the ruleset of the packer.")
+        values = {
+            "hearts_desire_number": key_figures["hearts_desire_number"],
+            "personality_number": key_figures["personality_number"],
+            "active_number": active_number,
+            "legacy_number": legacy_number,
+        }
+        full_name_numbers = key_figures["full_name_numbers"]
+        missing_numbers = (number for number in range(1, 10) if number not in full_name_numbers)
+        values["number_order"] = permutation_rank([number - 1 for number in (*full_name_numbers, *missing_numbers)])
+        names_word = self.PYTHAGOREAN_NAMES.pack(values)
+        values = {f"count_{number}": full_name_numbers.get(number, 0) for number in range(1, 10)}
+        numbers_word = self.PYTHAGOREAN_NUMBERS.pack(values)
+
+        if "life_path_number" not in key_figures:
+            return names_word, numbers_word, 0
+        values = {}
+        for name, _, _ in self.PYTHAGOREAN_BIRTHDATE.fields[:10]:
+            value = key_figures[name]
+            values[name] = value[0] if isinstance(value, tuple) else value
+        karmic_debt_numbers = key_figures["karmic_debt_numbers"]
+        for name in self.KARMIC_DEBT_FIGURES:
+            debt = karmic_debt_numbers.get(name)
+            values[f"karmic_{name}"] = 0 if debt is None else self.karmic_debts.index(debt) + 1
+        return names_word, numbers_word, self.PYTHAGOREAN_BIRTHDATE.pack(values)
+
+    def _unpack_pythagorean(self, names_word: int, numbers_word: int, birthdate_word: int) -> Dict[str, Any]:
+        values = self.PYTHAGOREAN_NAMES.unpack(names_word)
+        destiny_number = (self.ruleset.sum_master[values["active_number"] + values["legacy_number"]],)
+        counts = self.PYTHAGOREAN_NUMBERS.unpack(numbers_word)
+        number_order = [index + 1 for index in permutation_of_rank(values["number_order"], 9)]
+        number_counts = [(number, counts[f"count_{number}"]) for number in number_order]
+        key_figures = {
+            "hearts_desire_number": values["hearts_desire_number"],
+            "personality_number": values["personality_number"],
+            "destiny_number": destiny_number,
+            "expression_number": destiny_number,
+            "active_number": (values["active_number"],),
+            "legacy_number": (values["legacy_number"],),
+            "full_name_numbers": {number: count for number, count in number_counts if count},
+            "full_name_missing_numbers": tuple(sorted(number for number, count in number_counts if not count)),
+        }
+        if not birthdate_word:
+            return key_figures
+
+        values = self.PYTHAGOREAN_BIRTHDATE.unpack(birthdate_word)
+        karmic_debt_numbers = {}
+        for name in self.KARMIC_DEBT_FIGURES:
+            index = values[f"karmic_{name}"]
+            if index:
+                karmic_debt_numbers[name] = self.karmic_debts[index - 1]
+        key_figures.update(
+            {
+                "life_path_number": (values["life_path_number"],),
+                "life_path_number_alternative": (values["life_path_number_alternative"],),
+                "birthdate_day_num": (values["birthdate_day_num"],),
+                "birthdate_month_num": values["birthdate_month_num"],
+                "birthdate_year_num": values["birthdate_year_num"],
+                "birthdate_year_num_alternative": values["birthdate_year_num_alternative"],
+                "attitude_number": values["attitude_number"],
+                "karma_number": values["karma_number"],
+                "karmic_debt_numbers": karmic_debt_numbers,
+                "power_number": (values["power_number"],),
+                "power_number_alternative": (values["power_number_alternative"],),
+            }
+        )
+        return key_figures
+
+    # CHALDEAN
+
+    def _pack_chaldean(self, key_figures: Mapping[str, Any]) -> Tuple[int]:
+        values = {
+            "name_number_compound": key_figures["name_number"][0],
+            "name_number": key_figures["name_number"][-1],
+            "active_number_compound": key_figures["active_number"][0],
+            "active_number": key_figures["active_number"][-1],
+            "life_path_number_compound": 0,
+            "life_path_number": 0,
+            "birthdate_day_num_compound": 0,
+            "birthdate_day_num": 0,
+            "birthdate_year_num_alternative": 0,
+        }
+        if "life_path_number" in key_figures:
+            values.update(
+                {
+                    "life_path_number_compound": key_figures["life_path_number"][0],
+                    "life_path_number": key_figures["life_path_number"][-1],
+                    "birthdate_day_num_compound": key_figures["birthdate_day_num"][0],
+                    "birthdate_day_num": key_figures["birthdate_day_num"][-1],
+                    "birthdate_year_num_alternative": key_figures["birthdate_year_num_alternative"],
+                }
+            )
+        return (self.CHALDEAN.pack(values),)
+
+    def _unpack_chaldean(self, word: int) -> Dict[str, Any]:
+        values = self.CHALDEAN.unpack(word)
+        key_figures = {
+            "name_number": compound(values["name_number_compound"], values["name_number"]),
+            "active_number": compound(values["active_number_compound"], values["active_number"]),
+        }
+        if values["life_path_number"]:
+            key_figures.update(
+                {
+                    "life_path_number": compound(values["life_path_number_compound"], values["life_path_number"]),
+                    "birthdate_day_num": compound(values["birthdate_day_num_compound"], values["birthdate_day_num"]),
+                    "birthdate_year_num_alternative": values["birthdate_year_num_alternative"],
+                }
+            )
+        return key_figures
+
+    # VEDIC
+
+    def _pack_vedic(self, key_figures: Mapping[str, Any]) -> Tuple[int]:
+        values = {"name_number": key_figures["name_number"][0], "destiny_number": 0, "psychic_number": 0}
+        if "destiny_number" in key_figures:
+            values["destiny_number"] = key_figures["destiny_number"][0]
+            values["psychic_number"] = key_figures["psychic_number"][0]
+        return (self.VEDIC.pack(values),)
+
+    def _unpack_vedic(self, word: int) -> Dict[str, Any]:
+        values = self.VEDIC.unpack(word)
+        key_figures = {"name_number": (values["name_number"],)}
+        if values["destiny_number"]:
+            key_figures["destiny_number"] = (values["destiny_number"],)
+            key_figures["psychic_number"] = (values["psychic_number"],)
+        return key_figures
@@ -0,0 +1,57 @@
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from .diagnostics import Diagnostic
+
+
+class Chart:
+    """The result of a numerology computation: the key figures of a person and their interpretations.
+
+    A chart is immutable and owns its figures, so charts can be built and read from several threads at once:
+
+        chart = Pythagorean("Barack", "Obama", "1961-08-04", verbose=False).chart
+        chart.key_figures["life_path_number"]  # (2,)
+
+    Args:
+        system (str): Numerology system: 'pythagorean', 'chaldean' or 'vedic'.
+        key_figures (Dict[str, Any]): Key figures, copied into a read-only mapping.
+        interpretations (Dict[str, Any]): Interpretations of the key figures, copied into a read-only mapping.
+    """
+
+    __slots__ = ("system", "key_figures", "interpretations", "__weakref__")
+
+    system: str
+    key_figures: Mapping[str, Any]
+    interpretations: Mapping[str, Any]
+
+    def __init__(self, system: str, key_figures: Dict[str, Any], interpretations: Dict[str, Any]):
+        object.__setattr__(self, "system", system)
+        object.__setattr__(self, "key_figures", MappingProxyType(dict(key_figures)))
+        object.__setattr__(self, "interpretations", MappingProxyType(dict(interpretations)))
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f"Chart is immutable, {name} cannot be set.")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"Chart is immutable, {name} cannot be deleted.")
+
+    def __repr__(self) -> str:
+        return f"Chart(system={self.system!r}, key_figures={dict(self.key_figures)!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Chart):
+            return NotImplemented
+        return (
+            self.system == other.system
+            and self.key_figures == other.key_figures
+            and self.interpretations == other.interpretations
+        )
+
+    __hash__ = None
+
+
+class ChartResult(NamedTuple):
+    """The chart of a person, None if the names are not valid, and the problems found in the inputs."""
+
+    chart: Optional[Chart]
+    diagnostics: Tuple[Diagnostic, ...]
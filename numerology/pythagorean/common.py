@@ -1,22 +1,50 @@
 import json
-import re
 import unicodedata
-from datetime import datetime
 from typing import Dict, Tuple, Optional
 
 from .colors import Colors
+from .dates import ISO_DATE_PARSER, DateError, DateParser
+from .letters import LetterFilter
 
 
 class Functions:
+    # Translation tables of the alphabets, by alphabet id.
+    _letter_filters: Dict[int, Tuple[Dict, LetterFilter]] = {}
+
     @classmethod
     def keep_letters(cls, string: str, filter_string: str) -> str:
         return str(letter for letter in string if letter in filter_string)
 
     @classmethod
-    def keep_valid_letters(cls, string: str, alphabet: Dict) -> str:
+    def letter_filter(cls, alphabet: Dict) -> LetterFilter:
+        """Returns the translation table keeping the letters of the alphabet, built once per alphabet."""
+        alphabet_filter = cls._letter_filters.get(id(alphabet))
+        if alphabet_filter is None or alphabet_filter[0] is not alphabet:
+            alphabet_filter = cls._letter_filters[id(alphabet)] = (alphabet, LetterFilter(alphabet))
+        return alphabet_filter[1]
+
+    @classmethod
+    def clean_letters(cls, string: str, alphabet: Dict) -> str:
         """Removes accents and special characters, converts to lower case then keeps the valid letters.
 
         The valid letters are the ones in the alphabet.
+        Pure ASCII strings have no accent and skip the Unicode normalization.
+
+        Args:
+            string (str): The string to clean.
+
+        Returns:
+            string (str): A string without accent, in lower case. It is empty if no letter is valid.
+        """
+        if not string.isascii():
+            string = unicodedata.normalize("NFD", string)
+        return string.translate(cls.letter_filter(alphabet))
+
+    @classmethod
+    def keep_valid_letters(cls, string: str, alphabet: Dict) -> str:
+        """Removes accents and special characters, converts to lower case then keeps the valid letters.
+
+        Same as `clean_letters`, with a warning when the string contains no valid letter.
 
         Args:
             string (str): The string to clean.
@@ -24,17 +52,7 @@ class Functions:
         Returns:
             string (str): A string without accent, in lower case.
         """
-        valid_letters: str = ""
-        string_without_accent = "".join(
-            (
-                c
-                for c in unicodedata.normalize("NFD", string)
-                if unicodedata.category(c) != "Mn"
-            )
-        )
-        valid_letters = "".join(
-            (letter for letter in string_without_accent.lower() if letter in alphabet)
-        )
+        valid_letters = cls.clean_letters(string, alphabet)
 
         if len(valid_letters) == 0:
             print(
@@ -52,29 +70,33 @@ class Functions:
             return (0,)
 
     @classmethod
-    def is_valid_date(cls, date_supplied: str) -> bool:
+    def is_valid_date(cls, date_supplied: str, date_parser: DateParser = ISO_DATE_PARSER) -> bool:
         """Checks if the date supplied is valid.
 
         The valid format is yyyy-mm-dd, for example '2020-11-25'.
 
         Args:
             date_supplied (str): Date to check. The accepted format is 'yyyy-mm-dd'.
+            date_parser (DateParser, optional): Parser of the accepted formats. Defaults to the 'yyyy-mm-dd' parser.
 
         Returns:
             bool: Returns True if the date supplied is valid. Else, False.
         """
-        if not re.match(r"(\d){4}-(\d){2}-(\d){2}", date_supplied):
-            print(f"{Colors.WARNING}Invalid date format. Expected: yyyy-mm-dd.{Colors.ENDC}")
+        birthdate, error = date_parser.parse(date_supplied)
+        if error is not None:
+            cls.print_date_error(error)
             return False
+        return True
+
+    @classmethod
+    def print_date_error(cls, error: DateError):
+        """Prints why a date is not valid."""
+        if error.code == "format":
+            print(f"{Colors.WARNING}{error.message}{Colors.ENDC}")
         else:
-            try:
-                datetime.strptime(date_supplied, "%Y-%m-%d")
-            except ValueError as err:
-                print(
-                    f"{Colors.WARNING}Invalid date: {str(err).capitalize()} (Example of valid date: '2020-11-25').{Colors.ENDC}"
-                )
-                return False
-            return True
+            print(
+                f"{Colors.WARNING}Invalid date: {error.message.capitalize()} (Example of valid date: '2020-11-25').{Colors.ENDC}"
+            )
 
     @classmethod
     def str_number_to_tuple(cls, string: str) -> Tuple[int, ...]:
@@ -98,8 +120,8 @@ class Functions:
             json_format (bool, optional): If set to True, print in a json.dumps format. Defaults to True.
         """
         if json_format:
-            print(
-                f"{Colors.OKGREEN}{json.dumps(dictionary, indent=4, sort_keys=False, ensure_ascii=False)}{Colors.ENDC}"
-            )
+            # The read-only mappings of the shared charts (see ChartInterner) are dumped as dicts
+            dump = json.dumps(dictionary, indent=4, sort_keys=False, ensure_ascii=False, default=dict)
+            print(f"{Colors.OKGREEN}{dump}{Colors.ENDC}")
         else:
             print(f"{Colors.OKGREEN}{dictionary}{Colors.ENDC}")
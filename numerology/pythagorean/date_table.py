@@ -0,0 +1,225 @@
+import argparse
+import mmap
+import struct
+from datetime import date
+from typing import List, NamedTuple, Optional
+
+from .common import Functions as fct
+from .reduction import Reduction
+from .ruleset import DEFAULT_RULESET, Ruleset
+
+
+class DateFigures(NamedTuple):
+    """The figures depending on the birthdate only, for the Pythagorean, Chaldean and Vedic numerology."""
+
+    # Pythagorean figures (the Vedic destiny and psychic numbers are the life path and birthdate day numbers)
+    life_path_number: int
+    life_path_number_alternative: int
+    birthdate_day_num: int
+    birthdate_month_num: int
+    birthdate_year_num: int
+    birthdate_year_num_alternative: int
+    attitude_number: int
+    karma_number: int
+    # Pythagorean karmic debt figures, reduced up to 19
+    karmic_life_path_number: int
+    karmic_birthdate_day_num: int
+    # Chaldean figures: the unreduced life path number and the year reduced up to 52
+    compound_life_path_number: int
+    compound_birthdate_year_num: int
+
+
+class DateField:
+    """Positions of the figures in a record of the table."""
+
+    LIFE_PATH = 0
+    LIFE_PATH_ALTERNATIVE = 1
+    DAY = 2
+    MONTH = 3
+    YEAR = 4
+    YEAR_ALTERNATIVE = 5
+    ATTITUDE = 6
+    KARMA = 7
+    KARMIC_LIFE_PATH = 8
+    KARMIC_DAY = 9
+    COMPOUND_LIFE_PATH = 10
+    COMPOUND_YEAR = 11
+
+
+class DateFigureTable:
+    """The figures of every birthdate in a range of years, one record of bytes per day.
+
+    The record of a date is found from its number of days since the first date of the table,
+    so the figures of a birthdate are a single lookup.
+    A table written to a file can be memory-mapped (see `load`) and shared read-only by every process of a machine.
+
+    File format (little-endian):
+        header: magic (8 bytes), version (uint16), record size (uint16), first date ordinal (uint32),
+            number of records (uint32), fingerprint of the ruleset (16 bytes)
+        records: one record per day, one byte per figure in the order of `DateFigures`
+    """
+
+    MAGIC = b"NUMDATES"
+    VERSION = 1
+    HEADER = struct.Struct("<8sHHII16s")
+    RECORD_SIZE = len(DateFigures._fields)
+
+    def __init__(self, buffer, first_ordinal: int, count: int, fingerprint: bytes, offset: int = 0):
+        self.buffer = buffer
+        self.records = memoryview(buffer)[offset : offset + count * self.RECORD_SIZE]
+        self.first_ordinal = first_ordinal
+        self.count = count
+        self.fingerprint = fingerprint
+
+    @property
+    def first_date(self) -> date:
+        return date.fromordinal(self.first_ordinal)
+
+    @property
+    def last_date(self) -> date:
+        return date.fromordinal(self.first_ordinal + self.count - 1)
+
+    @classmethod
+    def date_figures(cls, year: int, month: int, day: int, ruleset: Ruleset = DEFAULT_RULESET) -> DateFigures:
+        """Computes the figures of a birthdate."""
+        digits = ruleset.digits_single
+        day_num = digits[day]
+        month_num = digits[month]
+        year_num = digits[year]
+        life_path_sum = day_num + month_num + year_num
+        return DateFigures(
+            life_path_number=digits[life_path_sum],
+            life_path_number_alternative=digits[day + month + year],
+            birthdate_day_num=day_num,
+            birthdate_month_num=month_num,
+            birthdate_year_num=year_num,
+            birthdate_year_num_alternative=digits[year % 100],
+            attitude_number=digits[day_num + month_num],
+            karma_number=digits[day - 1],
+            karmic_life_path_number=ruleset.sum_karmic[
+                Reduction.digit_sum(day) + Reduction.digit_sum(month) + Reduction.digit_sum(year)
+            ],
+            karmic_birthdate_day_num=ruleset.digits_karmic[day],
+            compound_life_path_number=life_path_sum,
+            compound_birthdate_year_num=ruleset.digits_compound[year],
+        )
+
+    @classmethod
+    def build(
+        cls, ruleset: Ruleset = DEFAULT_RULESET, first_year: int = 1800, last_year: int = 2300
+    ) -> "DateFigureTable":
+        """Computes the table of every date from the 1st of January of `first_year` to the 31st of December of `last_year`."""
+        first_ordinal = date(first_year, 1, 1).toordinal()
+        count = date(last_year, 12, 31).toordinal() - first_ordinal + 1
+        records = bytearray()
+        for ordinal in range(first_ordinal, first_ordinal + count):
+            birthdate = date.fromordinal(ordinal)
+            figures = cls.date_figures(birthdate.year, birthdate.month, birthdate.day, ruleset)
+            try:
+                records += bytes(figures)
+            except ValueError:
+                raise ValueError(f"The figures of {birthdate} do not fit in a byte with {ruleset}.") from None
+        return cls(bytes(records), first_ordinal, count, ruleset.fingerprint)
+
+    def write(self, path: str):
+        """Writes the table to a file."""
+        with open(path, "wb") as table_file:
+            table_file.write(
+                self.HEADER.pack(
+                    self.MAGIC, self.VERSION, self.RECORD_SIZE, self.first_ordinal, self.count, self.fingerprint
+                )
+            )
+            table_file.write(self.records)
+
+    @classmethod
+    def load(cls, path: str) -> "DateFigureTable":
+        """Memory-maps a table file, read-only."""
+        with open(path, "rb") as table_file:
+            buffer = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size, first_ordinal, count, fingerprint = cls.HEADER.unpack_from(buffer)
+        if magic != cls.MAGIC or version != cls.VERSION or record_size != cls.RECORD_SIZE:
+            raise ValueError(f"{path} is not a date figure table of version {cls.VERSION}.")
+        if len(buffer) < cls.HEADER.size + count * record_size:
+            raise ValueError(f"{path} is truncated.")
+        return cls(buffer, first_ordinal, count, fingerprint, offset=cls.HEADER.size)
+
+    def record(self, year: int, month: int, day: int) -> Optional[memoryview]:
+        """Returns the figures of a birthdate as a record of bytes (see `DateField`), or None if the date is not in the table."""
+        index = date(year, month, day).toordinal() - self.first_ordinal
+        if 0 <= index < self.count:
+            start = index * self.RECORD_SIZE
+            return self.records[start : start + self.RECORD_SIZE]
+        return None
+
+    def lookup(self, year: int, month: int, day: int) -> Optional[DateFigures]:
+        """Returns the figures of a birthdate, or None if the date is not in the table."""
+        record = self.record(year, month, day)
+        return DateFigures._make(record) if record is not None else None
+
+    def is_compatible(self, ruleset: Ruleset) -> bool:
+        """Returns True if the table was built with the same rules."""
+        return self.fingerprint == ruleset.fingerprint
+
+    def verify(self, step: int = 1) -> List[date]:
+        """Checks the table against the properties of the Pythagorean, Chaldean and Vedic charts.
+
+        Args:
+            step (int, optional): Checks one date every `step` days. Defaults to 1, every date.
+
+        Returns:
+            List[date]: The dates with a wrong record.
+        """
+        from numerology import Chaldean, Pythagorean, Vedic
+
+        # Charts computing every figure, even if a table is installed
+        charts = [type(cls.__name__, (cls,), {"date_table": None}) for cls in (Pythagorean, Chaldean, Vedic)]
+        wrong_dates = []
+        for index in range(0, self.count, step):
+            birthdate = date.fromordinal(self.first_ordinal + index)
+            figures = self.lookup(birthdate.year, birthdate.month, birthdate.day)
+            pythagorean, chaldean, vedic = (cls("a", "b", birthdate.isoformat(), verbose=False) for cls in charts)
+            day_digits = fct.int_to_tuple(birthdate.day)
+            expected = DateFigures(
+                life_path_number=pythagorean.life_path_number[0],
+                life_path_number_alternative=pythagorean.life_path_number_alternative[0],
+                birthdate_day_num=pythagorean.birthdate_day_num[0],
+                birthdate_month_num=pythagorean.birthdate_month_num,
+                birthdate_year_num=pythagorean.birthdate_year_num,
+                birthdate_year_num_alternative=pythagorean.birthdate_year_num_alternative,
+                attitude_number=pythagorean.attitude_number,
+                karma_number=pythagorean.karma_number,
+                karmic_life_path_number=Pythagorean.get_numerology_sum(
+                    day_digits + fct.int_to_tuple(birthdate.month) + fct.int_to_tuple(birthdate.year),
+                    upper_bound=19,
+                    master_number=False,
+                ),
+                karmic_birthdate_day_num=Pythagorean.get_numerology_sum(
+                    day_digits, upper_bound=19, master_number=False
+                ),
+                compound_life_path_number=chaldean.life_path_number[0],
+                compound_birthdate_year_num=chaldean.birthdate_year_num_alternative,
+            )
+            if (
+                figures != expected
+                or vedic.destiny_number != (figures.life_path_number,)
+                or vedic.psychic_number != (figures.birthdate_day_num,)
+                or chaldean.life_path_number[-1] != figures.life_path_number
+            ):
+                wrong_dates.append(birthdate)
+        return wrong_dates
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the table of the birthdate figures")
+    parser.add_argument("path", help="File to write")
+    parser.add_argument("--first_year", type=int, default=1800)
+    parser.add_argument("--last_year", type=int, default=2300)
+    parser.add_argument("--verify", action="store_true", help="Check every date against the numerology charts")
+    args = parser.parse_args()
+
+    table = DateFigureTable.build(first_year=args.first_year, last_year=args.last_year)
+    if args.verify:
+        wrong_dates = table.verify()
+        if wrong_dates:
+            raise SystemExit(f"{len(wrong_dates)} wrong dates, first one: {wrong_dates[0]}")
+    table.write(args.path)
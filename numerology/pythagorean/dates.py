@@ -0,0 +1,107 @@
+from typing import Iterable, NamedTuple, Optional, Tuple
+
+ISO_FORMAT = "YYYY-MM-DD"
+EUROPEAN_FORMAT = "DD/MM/YYYY"
+COMPACT_FORMAT = "YYYYMMDD"
+
+DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+class BirthDate(NamedTuple):
+    year: int
+    month: int
+    day: int
+
+
+class DateError(NamedTuple):
+    """Why a date could not be parsed.
+
+    The code is 'format' when the date does not match any format, 'year', 'month' or 'day' when a value is out of range.
+    """
+
+    code: str
+    message: str
+
+
+class DateFormat:
+    """A date format such as 'YYYY-MM-DD', compiled into the positions of the year, the month, the day and the separators."""
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.length = len(pattern)
+        self.year = self._field_slice(pattern, "YYYY")
+        self.month = self._field_slice(pattern, "MM")
+        self.day = self._field_slice(pattern, "DD")
+        self.separators: Tuple[Tuple[int, str], ...] = tuple(
+            (index, character) for index, character in enumerate(pattern) if character not in "YMD"
+        )
+
+    def __repr__(self) -> str:
+        return f"DateFormat({self.pattern!r})"
+
+    @classmethod
+    def _field_slice(cls, pattern: str, field: str) -> slice:
+        start = pattern.find(field)
+        if start < 0:
+            raise ValueError(f"The date format {pattern!r} has no {field} field.")
+        return slice(start, start + len(field))
+
+
+class DateParser:
+    """Validates a date and splits it into integers in a single step.
+
+    Args:
+        formats (Iterable[str], optional): The accepted formats, tried in order.
+            Any pattern made of YYYY, MM, DD and separators is accepted, for instance 'YYYY-MM-DD', 'DD/MM/YYYY' or 'YYYYMMDD'.
+            Defaults to ('YYYY-MM-DD',).
+    """
+
+    def __init__(self, formats: Iterable[str] = (ISO_FORMAT,)):
+        self.formats: Tuple[DateFormat, ...] = tuple(DateFormat(pattern) for pattern in formats)
+        self.format_error = DateError(
+            "format",
+            "Invalid date format. Expected: " + " or ".join(date_format.pattern.lower() for date_format in self.formats) + ".",
+        )
+
+    def parse(self, date_supplied: str) -> Tuple[Optional[BirthDate], Optional[DateError]]:
+        """Parses a date.
+
+        Args:
+            date_supplied (str): Date to parse.
+
+        Returns:
+            Tuple[Optional[BirthDate], Optional[DateError]]: The (year, month, day) of the date and None,
+                or None and the reason why the date is not valid.
+        """
+        if not date_supplied.isascii():
+            return None, self.format_error
+        for date_format in self.formats:
+            if len(date_supplied) != date_format.length:
+                continue
+            if any(date_supplied[index] != separator for index, separator in date_format.separators):
+                continue
+            year = date_supplied[date_format.year]
+            month = date_supplied[date_format.month]
+            day = date_supplied[date_format.day]
+            if not (year.isdigit() and month.isdigit() and day.isdigit()):
+                continue
+            return self.check_date(int(year), int(month), int(day))
+        return None, self.format_error
+
+    @classmethod
+    def check_date(cls, year: int, month: int, day: int) -> Tuple[Optional[BirthDate], Optional[DateError]]:
+        """Checks that the year, month and day make a valid date."""
+        if year < 1:
+            return None, DateError("year", "year 0 is out of range")
+        if not 1 <= month <= 12:
+            return None, DateError("month", f"month {month} is out of range")
+        if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+            days_in_month = 29
+        else:
+            days_in_month = DAYS_IN_MONTH[month]
+        if not 1 <= day <= days_in_month:
+            return None, DateError("day", "day is out of range for month")
+        return BirthDate(year, month, day), None
+
+
+ISO_DATE_PARSER = DateParser()
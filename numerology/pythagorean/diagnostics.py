@@ -0,0 +1,26 @@
+from typing import NamedTuple
+
+# A name has no letter of the alphabet.
+NO_VALID_CHARACTERS = "no_valid_characters"
+# The names cannot give a chart.
+INVALID_NAME = "invalid_name"
+# The birthdate is not a valid date.
+INVALID_DATE = "invalid_date"
+# A figure needing the birthdate was asked for without birthdate.
+MISSING_BIRTHDATE = "missing_birthdate"
+# A row of a batch could not be computed (see `compute_many`).
+ROW_ERROR = "row_error"
+
+
+class Diagnostic(NamedTuple):
+    """A problem found in the inputs of a chart, reported instead of printed.
+
+    Attributes:
+        code (str): NO_VALID_CHARACTERS, INVALID_NAME, INVALID_DATE, MISSING_BIRTHDATE or ROW_ERROR.
+        field (str): The input concerned: 'first_name', 'last_name', 'names', 'birthdate' or 'row'.
+        message (str): Human readable explanation.
+    """
+
+    code: str
+    field: str
+    message: str
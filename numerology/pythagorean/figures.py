@@ -0,0 +1,148 @@
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Set, Tuple
+
+# Inputs of the figures: the letter sums of the names and the day, month and year of the birthdate.
+NAMES = "<names>"
+BIRTHDATE = "<birthdate>"
+INPUTS = (NAMES, BIRTHDATE)
+
+
+class FigureGraph:
+    """The key figures of a numerology system and what every figure is computed from.
+
+    A figure depends on inputs (NAMES, BIRTHDATE) and on other figures, so a chart can compute a few figures
+    with only the inputs and intermediate figures they need:
+
+        Pythagorean.figure_graph.resolve(["power_number"])
+        # ('<birthdate>', 'life_path_number', '<names>', 'destiny_number', 'power_number')
+
+    Args:
+        key_figures (Iterable[str]): The key figures of a chart, in display order.
+        dependencies (Dict[str, Tuple[str, ...]]): For every figure, the inputs and figures it is computed from.
+        empty_figures (Iterable[str], optional): Key figures that do not exist in the system, always None. Defaults to ().
+    """
+
+    def __init__(
+        self,
+        key_figures: Iterable[str],
+        dependencies: Dict[str, Tuple[str, ...]],
+        empty_figures: Iterable[str] = (),
+    ):
+        self.key_figures: Tuple[str, ...] = tuple(key_figures)
+        self.dependencies: Dict[str, Tuple[str, ...]] = dict(dependencies)
+        self.empty_figures: FrozenSet[str] = frozenset(empty_figures)
+        # Inputs of the figure selections already resolved
+        self._inputs: Dict[Tuple[str, ...], FrozenSet[str]] = {}
+        # Figures depending on the input and figure selections already resolved
+        self._dependents: Dict[FrozenSet[str], FrozenSet[str]] = {}
+        for name in self.key_figures:
+            if name not in self.dependencies and name not in self.empty_figures:
+                raise ValueError(f"The key figure {name!r} has no dependencies.")
+        for name, requirements in self.dependencies.items():
+            for requirement in requirements:
+                if requirement not in self.dependencies and requirement not in INPUTS:
+                    raise ValueError(f"The figure {name!r} depends on the unknown figure {requirement!r}.")
+        # Checks that there is no cycle
+        self.resolve(self.dependencies)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.dependencies or name in self.empty_figures
+
+    def resolve(self, figures: Iterable[str]) -> Tuple[str, ...]:
+        """Returns the figures with every input and figure they depend on, each one after its dependencies.
+
+        Raises:
+            ValueError: If a figure is unknown or depends on itself.
+        """
+        order: List[str] = []
+        done: Set[str] = set()
+        for name in figures:
+            if name not in self:
+                raise ValueError(f"Unknown figure: {name!r}.")
+            self._visit(name, order, done, set())
+        return tuple(order)
+
+    def _visit(self, name: str, order: List[str], done: Set[str], visiting: Set[str]):
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"The figure {name!r} depends on itself.")
+        visiting.add(name)
+        for requirement in self.dependencies.get(name, ()):
+            self._visit(requirement, order, done, visiting)
+        visiting.discard(name)
+        done.add(name)
+        order.append(name)
+
+    def inputs(self, figures: Iterable[str]) -> FrozenSet[str]:
+        """Returns the inputs needed by the figures."""
+        figures = tuple(figures)
+        inputs = self._inputs.get(figures)
+        if inputs is None:
+            inputs = self._inputs[figures] = frozenset(name for name in self.resolve(figures) if name in INPUTS)
+        return inputs
+
+    def dependents(self, names: Iterable[str]) -> FrozenSet[str]:
+        """Returns the figures depending, directly or not, on any of the inputs or figures."""
+        names = frozenset(names)
+        dependents = self._dependents.get(names)
+        if dependents is None:
+            found = set(names)
+            for name in self.resolve(self.dependencies):
+                if any(requirement in found for requirement in self.dependencies.get(name, ())):
+                    found.add(name)
+            dependents = self._dependents[names] = frozenset(found - names)
+        return dependents
+
+    def extend(
+        self,
+        key_figures: Iterable[str],
+        dependencies: Dict[str, Tuple[str, ...]],
+        empty_figures: Iterable[str] = (),
+    ) -> "FigureGraph":
+        """Returns the graph of another system, reusing the dependencies of this one and overriding some."""
+        return FigureGraph(key_figures, {**self.dependencies, **dependencies}, empty_figures)
+
+
+class figure:
+    """Decorator of the figures of a chart: a property computed at most once per chart.
+
+    Like `functools.cached_property`, the value is stored in the instance dict, so the next lookups cost nothing.
+    A figure overridden in a subclass is reached through `super()` with the same name:
+    the overridden one is then kept in the `_memo` dict of the chart instead, keyed by the decorated method.
+    Every computed figure is recorded in `_memo`, which the chart empties when its inputs are initialized again.
+    """
+
+    def __init__(self, method: Callable[[Any], Any]):
+        self.method = method
+        self.__name__ = method.__name__
+        self.__doc__ = method.__doc__
+        # Whether the classes reach this figure, not an override, by its name
+        self._resolved: Dict[type, bool] = {}
+
+    def __repr__(self) -> str:
+        return f"figure({self.method.__qualname__})"
+
+    def __set_name__(self, owner: type, name: str):
+        self.__name__ = name
+        # Class defining the figure, whose figure graph tells what the figure depends on
+        self.owner = owner
+
+    def _is_resolved_by(self, cls: type) -> bool:
+        resolved = self._resolved.get(cls)
+        if resolved is None:
+            resolved = self._resolved[cls] = next(
+                klass.__dict__[self.__name__] for klass in cls.__mro__ if self.__name__ in klass.__dict__
+            ) is self
+        return resolved
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        memo = instance._memo
+        try:
+            return memo[self]
+        except KeyError:
+            value = memo[self] = self.method(instance)
+            if self._is_resolved_by(type(instance)):
+                instance.__dict__[self.__name__] = value
+            return value
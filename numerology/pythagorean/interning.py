@@ -0,0 +1,119 @@
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, NamedTuple
+from weakref import WeakValueDictionary
+
+from .chart import Chart
+
+# Figures of a chart which identify the person, left out of the shared charts.
+IDENTITY_FIGURES = frozenset(("first_name", "last_name", "birthdate"))
+
+
+class InternerStats(NamedTuple):
+    """Counters of a ChartInterner."""
+
+    # Charts given to `intern`
+    interned: int
+    # Charts found already shared
+    hits: int
+    # Distinct charts still referenced somewhere
+    resident_charts: int
+    # Distinct interpretation payloads
+    payloads: int
+    # Distinct figure values
+    values: int
+
+
+class ChartInterner:
+    """Flyweight of the charts: the charts with the same figures are replaced by one shared immutable chart.
+
+    Name and date figures have small domains, so many people share the same chart.
+    A shared chart has the figures and interpretations of the chart but the names and birthdate of the person,
+    its figure values and interpretation payloads being shared with the other charts, and read-only:
+
+        interner = ChartInterner()
+        charts = {user_id: interner.intern(compute(*person).chart) for user_id, person in users.items()}
+        interner.stats().resident_charts  # distinct charts in memory
+
+    The shared charts are kept as long as they are referenced somewhere else, the payloads and values for good.
+    """
+
+    def __init__(self):
+        self._charts: "WeakValueDictionary[Hashable, Chart]" = WeakValueDictionary()
+        self._payloads: Dict[Hashable, Any] = {}
+        self._values: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._interned = 0
+        self._hits = 0
+
+    def intern(self, chart: Chart) -> Chart:
+        """Returns the shared chart with the figures and interpretations of the chart, but the names and birthdate."""
+        key = (chart.system,) + tuple(
+            (name, self.freeze(value)) for name, value in chart.key_figures.items() if name not in IDENTITY_FIGURES
+        )
+        with self._lock:
+            self._interned += 1
+            shared = self._charts.get(key)
+            if shared is not None:
+                self._hits += 1
+                return shared
+            key_figures = {}
+            for name, value in key[1:]:
+                key_figures[name] = self._share(self._values, value, chart.key_figures[name])
+            interpretations = {
+                name: self._share(self._payloads, self.freeze(payload), payload)
+                for name, payload in chart.interpretations.items()
+                if name not in IDENTITY_FIGURES
+            }
+            shared = self._charts[key] = Chart(chart.system, key_figures, interpretations)
+            return shared
+
+    def stats(self) -> InternerStats:
+        with self._lock:
+            return InternerStats(self._interned, self._hits, len(self._charts), len(self._payloads), len(self._values))
+
+    def clear(self):
+        """Forgets the shared charts, payloads and values, and resets the counters."""
+        with self._lock:
+            self._charts.clear()
+            self._payloads.clear()
+            self._values.clear()
+            self._interned = self._hits = 0
+
+    @classmethod
+    def _share(cls, shared: Dict[Hashable, Any], key: Hashable, value: Any) -> Any:
+        """Returns the read-only copy of the value already shared, or shares a new one."""
+        try:
+            return shared[key]
+        except KeyError:
+            return shared.setdefault(key, cls.read_only(value))
+
+    @classmethod
+    def freeze(cls, value: Any) -> Hashable:
+        """Returns a hashable key of a figure value or interpretation payload, made of nested dicts and tuples."""
+        if isinstance(value, (dict, MappingProxyType)):
+            items = tuple(value.items())
+            try:
+                hash(items)
+                return (dict,) + items
+            except TypeError:
+                pass
+            return (dict,) + tuple((key, cls.freeze(item)) for key, item in value.items())
+        if isinstance(value, list):
+            return (list,) + tuple(cls.freeze(item) for item in value)
+        if isinstance(value, tuple):
+            try:
+                hash(value)
+                return value
+            except TypeError:
+                return tuple(cls.freeze(item) for item in value)
+        return value
+
+    @classmethod
+    def read_only(cls, value: Any) -> Any:
+        """Returns the value with its dicts as read-only mappings and its lists as tuples."""
+        if isinstance(value, (dict, MappingProxyType)):
+            return MappingProxyType({key: cls.read_only(item) for key, item in value.items()})
+        if isinstance(value, (list, tuple)):
+            return tuple(cls.read_only(item) for item in value)
+        return value
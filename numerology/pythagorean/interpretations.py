@@ -2,8 +2,10 @@ import gettext
 import locale
 import os
 import sys
-from typing import Dict, List, Optional
+import threading
+from typing import Any, Dict, Hashable, Iterable, List, Optional
 
+from .interning import IDENTITY_FIGURES, ChartInterner
 from .meanings import *
 
 localedir_path = os.path.join(
@@ -26,23 +28,66 @@ except Exception:
     language = gettext.translation(
         "numerology", localedir=localedir_path, languages=[default_lang]
     )
-language.install()
 _ = language.gettext
 
+# Read-only interpretations already computed, by class, figure and value (see `Interpretations.cached_interpretation`).
+# Read without a lock, filled under `_cache_lock` so that every chart of a value gets the same mapping.
+_cache: Dict[Hashable, Any] = {}
+_cache_lock = threading.Lock()
+
 
 class Interpretations:
 
-    key_figures: Dict = {}
-    _meanings: Dict = {}
+    key_figures: Dict
+    _meanings: Dict
 
     def __init__(self, key_figures: Dict):
         self.key_figures = key_figures
+        self._meanings = {}
         self.get_all_interpretations()
 
     def get_all_interpretations(self):
         for k, v in self.key_figures.items():
             self._meanings[k] = self.get_interpretation(k, v)
 
+    def update_interpretations(self, key_figures: Dict, names: Iterable[str]):
+        """Interprets again the key figures listed in `names`, and the new ones, keeping the other interpretations."""
+        names = set(names)
+        meanings = self._meanings
+        self.key_figures = key_figures
+        self._meanings = {
+            k: self.get_interpretation(k, v) if k in names or k not in meanings else meanings[k]
+            for k, v in key_figures.items()
+        }
+
+    @classmethod
+    def cached_interpretation(cls, name: str, value):
+        """Returns the interpretation of a figure, translated once for every value and shared as read-only mappings.
+
+        The names and birthdate, and the figures without interpretation, are not cached.
+        """
+        if name in IDENTITY_FIGURES:
+            return value
+        key = (cls, name, value)
+        try:
+            return _cache[key]
+        except KeyError:
+            frozen = False
+        except TypeError:
+            # Dict values
+            key = (cls, name, ChartInterner.freeze(value))
+            frozen = True
+            if key in _cache:
+                return _cache[key]
+        interpretation = cls.get_interpretation(name, value)
+        if interpretation is not None:
+            interpretation = ChartInterner.read_only(interpretation)
+        elif frozen:
+            # Not cached: the dicts without interpretation, as the number occurrences, are too many
+            return None
+        with _cache_lock:
+            return _cache.setdefault(key, interpretation)
+
     @classmethod
     def get_num_from_value(cls, value) -> int:
         if isinstance(value, str) and value.isdigit():
@@ -0,0 +1,125 @@
+import unicodedata
+from operator import add, mul
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+class LetterFilter(dict):
+    """`str.translate` table keeping the letters of an alphabet, in lower case and without accents.
+
+    The table is ready for the 128 ASCII characters.
+    Any other character is looked up once, then kept in the table.
+    The string to translate must be NFD-normalized first unless it is pure ASCII, so the accents are separate characters.
+    """
+
+    def __init__(self, alphabet: Dict[str, int]):
+        super().__init__()
+        self.alphabet = alphabet
+        for code in range(128):
+            self[code] = self.translate_character(chr(code))
+
+    def __missing__(self, code: int) -> Optional[str]:
+        translation = self[code] = self.translate_character(chr(code))
+        return translation
+
+    def translate_character(self, character: str) -> Optional[str]:
+        """Returns the valid letters of a character, or None to drop it."""
+        if unicodedata.category(character) == "Mn":
+            # Accents and other non-spacing marks
+            return None
+        letters = "".join(letter for letter in character.lower() if letter in self.alphabet)
+        return letters or None
+
+
+class LetterSums(NamedTuple):
+    """The sums of the numbers of the letters of a name in a numerology system."""
+
+    total: int
+    vowels_total: int
+    consonants_total: int
+    # Occurrences of every number from 0 to 9 among the letters
+    number_counts: Tuple[int, ...]
+    # Numbers of the letters in order of first appearance in the name
+    number_order: Tuple[int, ...] = ()
+
+
+class LetterValues:
+    """The numbers of the 26 letters in a numerology system, split between vowels and consonants.
+
+    Every name figure can be computed from the letter counts of a name (see `letter_counts`),
+    as the sum of the numbers of its letters is the dot product of the counts and the numbers.
+    """
+
+    def __init__(self, alphabet: Dict[str, int], vowels: Iterable[str], consonants: Iterable[str]):
+        vowels = set(vowels)
+        consonants = set(consonants)
+        self.numbers: Tuple[int, ...] = tuple(alphabet[letter] for letter in LETTERS)
+        self.vowel_numbers: Tuple[int, ...] = tuple(
+            number if letter in vowels else 0 for letter, number in zip(LETTERS, self.numbers)
+        )
+        self.consonant_numbers: Tuple[int, ...] = tuple(
+            number if letter in consonants else 0 for letter, number in zip(LETTERS, self.numbers)
+        )
+        # Indexes of the letters matching each number from 0 to 9.
+        self.letters_by_number: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(index for index, letter_number in enumerate(self.numbers) if letter_number == number)
+            for number in range(10)
+        )
+
+    @classmethod
+    def letter_counts(cls, cleaned_name: str) -> List[int]:
+        """Returns the occurrences of the 26 letters in a cleaned name (lower case letters only).
+
+        Example: 'abba' will give [2, 2, 0, 0, ...]."""
+        return [cleaned_name.count(letter) for letter in LETTERS]
+
+    @classmethod
+    def letter_order(cls, cleaned_name: str) -> Tuple[int, ...]:
+        """Returns the indexes of the letters of a cleaned name in order of first appearance.
+
+        Example: 'baba' will give (1, 0)."""
+        first_positions = ((cleaned_name.find(letter), index) for index, letter in enumerate(LETTERS))
+        return tuple(index for position, index in sorted(first_positions) if position >= 0)
+
+    @classmethod
+    def add_counts(cls, counts: Sequence[int], other_counts: Sequence[int]) -> List[int]:
+        """Returns the letter counts of two names put together."""
+        return list(map(add, counts, other_counts))
+
+    @classmethod
+    def add_orders(cls, number_order: Sequence[int], other_number_order: Sequence[int]) -> Tuple[int, ...]:
+        """Returns the order of first appearance of the numbers of two names put together."""
+        return tuple(dict.fromkeys((*number_order, *other_number_order)))
+
+    def total(self, counts: Sequence[int]) -> int:
+        """Returns the sum of the numbers of every letter."""
+        return sum(map(mul, counts, self.numbers))
+
+    def vowels_total(self, counts: Sequence[int]) -> int:
+        """Returns the sum of the numbers of the vowels."""
+        return sum(map(mul, counts, self.vowel_numbers))
+
+    def consonants_total(self, counts: Sequence[int]) -> int:
+        """Returns the sum of the numbers of the consonants."""
+        return sum(map(mul, counts, self.consonant_numbers))
+
+    def number_counts(self, counts: Sequence[int]) -> Tuple[int, ...]:
+        """Returns the occurrences of every number from 0 to 9 among the letters."""
+        return tuple(
+            sum(counts[index] for index in indexes) for indexes in self.letters_by_number
+        )
+
+    def number_order(self, letter_order: Sequence[int]) -> Tuple[int, ...]:
+        """Returns the numbers of the letters in order of first appearance (see `letter_order`)."""
+        return tuple(dict.fromkeys(self.numbers[index] for index in letter_order))
+
+    def sums(self, counts: Sequence[int], letter_order: Sequence[int] = ()) -> LetterSums:
+        """Returns every sum of a name at once."""
+        return LetterSums(
+            self.total(counts),
+            self.vowels_total(counts),
+            self.consonants_total(counts),
+            self.number_counts(counts),
+            self.number_order(letter_order),
+        )
@@ -19,14 +19,12 @@ try:
     language = gettext.translation(
         "numerology", localedir=localedir_path, languages=[lang]
     )
-    language.install()
     _ = language.gettext
 except Exception:
     # If the current language does not have a translation, the default laguage (English) will be used English
     language = gettext.translation(
         "numerology", localedir=localedir_path, languages=[default_lang]
     )
-    language.install()
     _ = language.gettext
 
 
@@ -0,0 +1,74 @@
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple
+
+from .common import Functions as fct
+from .letters import LETTERS, LetterSums, LetterValues
+
+# Every numerology system gives a number to the 26 letters.
+LETTERS_ALPHABET: Dict[str, int] = dict.fromkeys(LETTERS, 0)
+
+
+class NameToken:
+    """A name as supplied by the user, with its cleaned version, its letter counts and its letter order.
+
+    The sums of the numbers of its letters are computed once per numerology system (see `sums`).
+    """
+
+    __slots__ = ("name", "cleaned", "counts", "order", "_sums")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.cleaned = fct.clean_letters(name, LETTERS_ALPHABET)
+        self.counts: List[int] = LetterValues.letter_counts(self.cleaned)
+        self.order: Tuple[int, ...] = LetterValues.letter_order(self.cleaned)
+        self._sums: Dict[LetterValues, LetterSums] = {}
+
+    def __repr__(self) -> str:
+        return f"NameToken({self.name!r})"
+
+    def sums(self, letter_values: LetterValues) -> LetterSums:
+        """Returns the sums of the numbers of the letters of the name in a numerology system."""
+        sums = self._sums.get(letter_values)
+        if sums is None:
+            sums = self._sums[letter_values] = letter_values.sums(self.counts, self.order)
+        return sums
+
+
+class NameCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class NameCache:
+    """A size-bounded cache of names, shared by the Pythagorean, Chaldean and Vedic numerology.
+
+    First names and last names repeat a lot, so a name is cleaned and counted once,
+    then kept until it is the least recently used one of a full cache.
+
+    Args:
+        maxsize (int, optional): Maximum number of names kept. Defaults to 65536.
+    """
+
+    def __init__(self, maxsize: int = 65536):
+        self.maxsize = maxsize
+        self.clear()
+
+    def clear(self):
+        """Empties the cache and resets its statistics."""
+        # `cache.get(name)` returns the token of a name, from the cache if possible.
+        self.get: Callable[[str], NameToken] = lru_cache(maxsize=self.maxsize)(NameToken)
+
+    def warm(self, names: Iterable[str]):
+        """Loads names in the cache in advance, for instance the most common first names."""
+        get = self.get
+        for name in names:
+            get(name)
+
+    def info(self) -> NameCacheInfo:
+        """Returns the hits, misses, maximum size and current size of the cache."""
+        return NameCacheInfo(*self.get.cache_info())
+
+
+NAME_CACHE = NameCache()
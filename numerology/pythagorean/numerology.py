@@ -1,14 +1,38 @@
 import gettext
 import logging
-import math
 import os
 import locale
 import sys
-from collections import Counter
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
 
+from .chart import Chart
+from .colors import Colors
 from .common import Functions as fct
+from .date_table import DateField, DateFigureTable
+from .diagnostics import INVALID_DATE, INVALID_NAME, NO_VALID_CHARACTERS, Diagnostic
+from .dates import ISO_DATE_PARSER, BirthDate, DateError, DateParser
+from .figures import BIRTHDATE, INPUTS, NAMES, FigureGraph
 from .interpretations import Interpretations
+from .letters import LetterValues
+from .names import NAME_CACHE, NameCache
+from .reduction import Reduction, ReductionTable
+from .ruleset import DEFAULT_RULESET, Ruleset
+from .specs import (
+    SINGLE,
+    Const,
+    Fig,
+    FigureSpec,
+    FigureSpecs,
+    Mod,
+    Table,
+    Var,
+    call,
+    karmic_debt_figures,
+    missing_numbers,
+    number_occurrences,
+    recorded,
+    reduce,
+)
 
 localedir_path = os.path.join(
     os.path.dirname(os.path.realpath(__file__)), "..", "locale"
@@ -30,7 +54,6 @@ except Exception:
     language = gettext.translation(
         "numerology", localedir=localedir_path, languages=[default_lang]
     )
-language.install()
 _ = language.gettext
 
 
@@ -99,14 +122,345 @@ class Numerology:
         "z",
     )
 
-    _key_figures = {}
+    letter_values = LetterValues(alphabet, vowels, consonants)
+
+    # Name of the numerology system of the charts, and interpretations of their key figures.
+    system = "pythagorean"
+    interpretations_class = Interpretations
+
+    # How every figure is computed, compiled into the functions computing the charts (see FigureSpecs).
+    # Every spec is also a property of the charts, documented by the spec (see `specified_figure`).
+    # The figures of the birthdate are read from the date record when there is one (see DateFigureTable).
+    figure_specs = FigureSpecs(
+        [
+            FigureSpec("first_name", Var("first_name")),
+            FigureSpec("last_name", Var("last_name")),
+            FigureSpec("birthdate", Var("birthdate")),
+            FigureSpec(
+                "hearts_desire_number",
+                reduce("sum_master", Var("full_name_vowels_sum")),
+                doc="""Returns the Hearts Desire Number.
+
+                Sometimes called the Soul Urge or Soul Prompting Number, the Hearts Desire Number describes the inner desires.
+                It is calculated from the vowels in the full name.
+
+                Returns:
+                    int: Hearts Desire Number.
+                """,
+            ),
+            FigureSpec(
+                "personality_number",
+                reduce("sum_master", Var("full_name_consonants_sum")),
+                doc="""Returns the Personality Number.
+
+                Sometimes called the Inner Dream or Personal Dream Number, the Personality Number indicates our external personality.
+                It is calculated from the consonants in the full name.
+
+                Returns:
+                    int: Inner Dream Number.
+                """,
+            ),
+            FigureSpec(
+                "destiny_number",
+                reduce(
+                    "sum_master",
+                    reduce("sum_single", Var("first_name_sum")),
+                    reduce("sum_single", Var("last_name_sum")),
+                ),
+                SINGLE,
+                doc="""Returns the Destiny Number.
+
+                Sometimes called Expression Number or Lucky Number, it indicates the personal interest, unique capabilities and talents.
+
+                Returns:
+                    int: Destiny number.
+                """,
+            ),
+            FigureSpec(
+                "expression_number",
+                Fig("destiny_number"),
+                doc="Returns the Expression Number, another name of the Destiny Number.",
+            ),
+            FigureSpec(
+                "active_number",
+                reduce("sum_single", Var("first_name_sum")),
+                SINGLE,
+                doc="""Returns the Active Number.
+
+                The number from your first name.
+
+                Returns:
+                    int: The Active Number
+                """,
+            ),
+            FigureSpec(
+                "legacy_number",
+                reduce("sum_single", Var("last_name_sum")),
+                SINGLE,
+                doc="""Returns the Legacy Number.
+
+                The number from your last name.
+
+                Returns:
+                    int: The legacy number
+                """,
+            ),
+            FigureSpec(
+                "full_name_numbers",
+                call(number_occurrences, Var("full_name_number_counts"), Var("full_name_number_order")),
+                doc="""Returns the numbers from the full name as a dict.
+
+                The dict contains the numbers and their occurrences, the most common numbers first.
+                Numbers as common as each other are in order of first appearance in the full name.""",
+            ),
+            FigureSpec(
+                "full_name_missing_numbers",
+                call(missing_numbers, Var("full_name_number_counts")),
+                doc="""Returns the missing numbers from the name as a tuple.
+
+                Also called Karmic lesson numbers, shows a vacuum that needs to be filled in this lifetime by mastering the required Karmic lesson.""",
+            ),
+            FigureSpec(
+                "life_path_number",
+                recorded(
+                    DateField.LIFE_PATH,
+                    reduce(
+                        "digits_single",
+                        reduce("digits_single", Var("birthdate_day")),
+                        reduce("digits_single", Var("birthdate_month")),
+                        reduce("digits_single", Var("birthdate_year")),
+                    ),
+                ),
+                SINGLE,
+                doc="""Returns the Life Path Number.
+
+                The life path number, also referred as Lucky Number in some places, is the most important one in a numerology chart.
+                It describes the direction of your life journey.
+                It offers insight into the skills and traits you may possess and the kinds of challenges you can expect to face in your life.
+                It is calculated from the birth date.
+
+                This method sums-reduces to one digit the date, month, and year before summing-reducing their total.
+                The alternative method `life_path_number_alternative` sums-reduces to one digit the total of day, month, and year from the birthdate.
+
+                Returns:
+                    int: Life Path Number (Initial method).
+                """,
+            ),
+            FigureSpec(
+                "life_path_number_alternative",
+                recorded(
+                    DateField.LIFE_PATH_ALTERNATIVE,
+                    reduce("digits_single", Var("birthdate_day"), Var("birthdate_month"), Var("birthdate_year")),
+                ),
+                SINGLE,
+                doc="""Returns the Life Path Number (alternative method).
+
+                The life path number is the most important one in a numerology chart.
+                It describes the direction of your life journey.
+                It offers insight into the skills and traits you may possess and the kinds of challenges you can expect to face in your life.
+                It is calculated from the birth date.
+
+                The initial method sums-reduces to one digit the date, month, and year before summing-reducing their total.
+                This alternative method `life_path_number_alternative` sums-reduces to one digit the total of day, month, and year from the birthdate.
+
+                Returns:
+                    int: Life Path Number (Alternative method)
+                """,
+            ),
+            FigureSpec(
+                "birthdate_day_num",
+                recorded(DateField.DAY, reduce("digits_single", Var("birthdate_day"))),
+                SINGLE,
+                doc="""Returns the numerology sum of the birthday day.
+
+                Example: The 27 in 1986-03-27 will give 9.""",
+            ),
+            FigureSpec(
+                "birthdate_month_num",
+                recorded(DateField.MONTH, reduce("digits_single", Var("birthdate_month"))),
+                doc="""Returns the numerology sum of the birthday month.
+
+                Example: The 12 in 1986-12-27 will give 3.""",
+            ),
+            FigureSpec(
+                "birthdate_year_num",
+                recorded(DateField.YEAR, reduce("digits_single", Var("birthdate_year"))),
+                doc="""Returns the numerology sum of the birthday year.
+
+                This method sums-reduces the 4 digits of the year.
+                The alternative one sums-reduces the 2 last digits.""",
+            ),
+            FigureSpec(
+                "birthdate_year_num_alternative",
+                recorded(DateField.YEAR_ALTERNATIVE, reduce("digits_single", Mod(Var("birthdate_year"), 100))),
+                doc="""Returns the numerology sum of the birthday year.
+
+                The original method sums-reduces the 4 digits of the year (1958 > 23 > 5).
+                This alternative one sums-reduces the 2 last digits ((19)58 > 13 > 4).""",
+            ),
+            FigureSpec(
+                "attitude_number",
+                recorded(
+                    DateField.ATTITUDE,
+                    reduce(
+                        "digits_single",
+                        reduce("digits_single", Var("birthdate_day")),
+                        reduce("digits_single", Var("birthdate_month")),
+                    ),
+                ),
+                doc="""Returns the numerology sum of the birthday date and month.
+
+                Sometimes called the Sun Number, the Attitude Number indicates how we behave in situations with others Or our attitude towards them.
+                Example: The sum of 27th of December in 1986-12-27 will 27+12 > 12 > 3.""",
+            ),
+            FigureSpec(
+                "karma_number",
+                recorded(DateField.KARMA, reduce("digits_single", Var("birthdate_day"), Const(-1))),
+                doc="""Returns the numerology sum of the (birthday date - 1).
+
+                Example: For 1986-12-27 will be 27-1 > 26 > 8.""",
+            ),
+            # Karmic debts are looked for in the figures reduced up to 19
+            FigureSpec(
+                "karmic_life_path_number",
+                recorded(
+                    DateField.KARMIC_LIFE_PATH,
+                    reduce(
+                        "sum_karmic",
+                        call(Reduction.digit_sum, Var("birthdate_day")),
+                        call(Reduction.digit_sum, Var("birthdate_month")),
+                        call(Reduction.digit_sum, Var("birthdate_year")),
+                    ),
+                ),
+                doc="Returns the Life Path Number reduced up to 19, to look for a karmic debt.",
+            ),
+            FigureSpec(
+                "karmic_hearts_desire_number",
+                reduce("sum_karmic_master", Var("full_name_vowels_sum")),
+                doc="Returns the Hearts Desire Number reduced up to 19, to look for a karmic debt.",
+            ),
+            FigureSpec(
+                "karmic_personality_number",
+                reduce("sum_karmic_master", Var("full_name_consonants_sum")),
+                doc="Returns the Personality Number reduced up to 19, to look for a karmic debt.",
+            ),
+            FigureSpec(
+                "karmic_destiny_number",
+                reduce("sum_karmic_master", Fig("active_number", 0), Fig("legacy_number", 0)),
+                doc="Returns the Destiny Number reduced up to 19, to look for a karmic debt.",
+            ),
+            FigureSpec(
+                "karmic_birthdate_day_num",
+                recorded(DateField.KARMIC_DAY, reduce("digits_karmic", Var("birthdate_day"))),
+                doc="Returns the numerology sum of the birthday day reduced up to 19, to look for a karmic debt.",
+            ),
+            FigureSpec(
+                "karmic_debt_numbers",
+                call(
+                    karmic_debt_figures,
+                    Table("karmic_debts"),
+                    Fig("karmic_life_path_number"),
+                    Fig("karmic_hearts_desire_number"),
+                    Fig("karmic_personality_number"),
+                    Fig("karmic_destiny_number"),
+                    Fig("karmic_birthdate_day_num"),
+                ),
+                doc="Returns Karmic debts associated with any of Life Path, Personality, Birth Day, Expression, and Heart’s Desire.",
+            ),
+            FigureSpec(
+                "power_number",
+                reduce("digits_single", Fig("life_path_number", 0), Fig("destiny_number", 0)),
+                SINGLE,
+                doc="""Returns the Power Number
+
+                Sometimes called the Maturity Number, the power number is obtained by adding together the life path number and destiny number. Then reduce the number to a single digit.
+
+                Returns:
+                    int: [description]
+                """,
+            ),
+            FigureSpec(
+                "power_number_alternative",
+                reduce("digits_single", Fig("life_path_number_alternative", 0), Fig("destiny_number", 0)),
+                SINGLE,
+                doc="""Returns the Power Number (Alternative)
+
+                Sometimes called the Maturity Number, the power number is obtained by adding together the life path number (alternative) and destiny number. Then reduce the number to a single digit.
+
+                Returns:
+                    int: [description]
+                """,
+            ),
+        ]
+    )
+
+    # Whether the class computes its figures as declared in its specs, set once per class (see `__init_subclass__`)
+    _figures_are_specified: bool = True
+
+    # Key figures, in display order, and what every figure is computed from.
+    figure_graph = FigureGraph(
+        key_figures=(
+            "first_name",
+            "last_name",
+            # Hearts Desire Number (vowels) = Nombre intime (voyelles)
+            "hearts_desire_number",
+            # Personality Number (consonants) = Nombre de réalisation (consonnes)
+            "personality_number",
+            # Destiny Number (full name) = Nombre d'expression (nom complet)
+            "destiny_number",
+            "expression_number",
+            # Active Number (first name) = Nombre actif (prénom)
+            "active_number",
+            # Legacy Number (last name) = Nombre héréditaire (nom de famille)
+            "legacy_number",
+            "full_name_numbers",
+            "full_name_missing_numbers",
+            "name_number",
+            "psychic_number",
+            # Birthdate elements (as birthdate is optional)
+            "birthdate",
+            "life_path_number",
+            "life_path_number_alternative",
+            "birthdate_day_num",
+            "birthdate_month_num",
+            "birthdate_year_num",
+            "birthdate_year_num_alternative",
+            "attitude_number",
+            "karma_number",
+            "karmic_debt_numbers",
+            "power_number",
+            "power_number_alternative",
+        ),
+        dependencies=figure_specs.dependencies(),
+        empty_figures=("name_number", "psychic_number"),
+    )
+
+    # Master numbers, karmic debt numbers and upper bounds, compiled into reduction tables.
+    ruleset: Ruleset = DEFAULT_RULESET
+
+    # Cleaned names and their letter sums, shared by every chart.
+    name_cache: NameCache = NAME_CACHE
+
+    # Accepted birthdate formats.
+    date_parser: DateParser = ISO_DATE_PARSER
+
+    # Precomputed figures of the birthdates, used when built with the same ruleset (see DateFigureTable).
+    date_table: Optional[DateFigureTable] = None
 
     first_name: str
     last_name: str
     birthdate: Optional[str]
-
-    first_name_num: Tuple[int]
-    last_name_num: Tuple[int]
+    birthdate_parsed: Optional[BirthDate] = None
+    birthdate_error: Optional[DateError] = None
+    # Figures of the birthdate (see DateField), from the date table or shared by the charts of a person.
+    date_record: Optional[Sequence[int]] = None
+
+    first_name_sum: int
+    last_name_sum: int
+    full_name_vowels_sum: int
+    full_name_consonants_sum: int
+    full_name_number_counts: Tuple[int, ...]
+    full_name_number_order: Tuple[int, ...]
 
     first_name_is_valid: bool = False
     last_name_is_valid: bool = False
@@ -115,29 +469,63 @@ class Numerology:
 
     verbose = True
 
+    # Immutable result of the computation, None if the names are not valid.
+    chart: Optional[Chart] = None
+
+    # Figures requested, None meaning every key figure.
+    selected_figures: Optional[Tuple[str, ...]] = None
+
+    # Checked names and birthdate, shared by the charts of a person in several systems (see `from_inputs`).
+    input_attributes = (
+        "first_name",
+        "last_name",
+        "birthdate",
+        "ruleset",
+        "date_parser",
+        "date_table",
+        "first_name_token",
+        "first_name_cleaned",
+        "first_name_is_valid",
+        "last_name_token",
+        "last_name_cleaned",
+        "last_name_is_valid",
+        "names_are_valid",
+        "birthdate_parsed",
+        "birthdate_error",
+        "birthdate_is_valid",
+        "date_record",
+    )
+
     def __init__(
         self,
         first_name: str,
         last_name: str,
         birthdate: Optional[str] = None,
         verbose: bool = True,
+        ruleset: Optional[Ruleset] = None,
+        date_parser: Optional[DateParser] = None,
+        figures: Optional[Iterable[str]] = None,
     ):
-        self.first_name = first_name
-        self.last_name = last_name
-        self.birthdate = birthdate
+        self.set_inputs(first_name, last_name, birthdate, ruleset, date_parser)
         self.verbose = verbose
-
-        self.check_parameters()
+        self.print_diagnostics()
         if self.names_are_valid:
-            self.init_inner_variables()
-            self.set_key_figures()
-            self._interpretations = Interpretations(key_figures=self.key_figures)
+            self.get_key_figures(figures)
 
         if self.verbose and self.names_are_valid:
-            print(_("KEY FIGURES:"))
-            fct.print_beautiful_dict(dictionary=self.key_figures)
-            print(_("INTERPRETATIONS:"))
-            fct.print_beautiful_dict(dictionary=self.interpretations)
+            self.print_chart(self.chart)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.define_figures()
+
+    @classmethod
+    def define_figures(cls):
+        """Adds the figure properties of the specs declared by the class (see `FigureSpecs.define_figures`),
+        and finds out whether the class computes every figure as declared (see `figures_are_specified`)."""
+        if "figure_specs" in vars(cls):
+            cls.figure_specs.define_figures(cls)
+        cls._figures_are_specified = cls.figure_specs.are_defined_by(cls)
 
     # CLASSMETHODS
 
@@ -149,37 +537,199 @@ class Numerology:
         The numerology sum is the sum of every digit in a number.
         The result is sum again if it is greater than 9 unless it's a multiple of 11.
 
+        The master numbers are always the ones of the class ruleset (`cls.ruleset`), even when called on a chart
+        built with `ruleset=`: the figures of such a chart are reduced with the tables of `self.ruleset`,
+        as `self.ruleset.sum_master[number]`.
+
         Args:
             tuple_obj (Tuple[int]): Tuple to sum up
             upper_bound (int, optional): Upper bound of the recursive. Defaults to 9.
             master_number (bool, optional): If `master_number` is False, the multiple of 11 are not taken into account. Defaults to True.
 
         Returns:
-            int: [description]
+            int: The reduced sum.
         """
-        nsum = math.fsum(tuple_obj)
+        return ReductionTable.shared(upper_bound, master_number, master_numbers=cls.ruleset.master_numbers)[
+            sum(tuple_obj)
+        ]
 
-        if master_number:
-            while not (nsum <= upper_bound or (nsum % 11) == 0):
-                nsum = math.fsum(tuple(int(num) for num in str(int(nsum))))
-        else:
-            while not (nsum <= upper_bound):
-                nsum = math.fsum(tuple(int(num) for num in str(int(nsum))))
+    @classmethod
+    def evaluate(
+        cls,
+        first_name: str,
+        last_name: str,
+        birthdate: Optional[str] = None,
+        ruleset: Optional[Ruleset] = None,
+        date_parser: Optional[DateParser] = None,
+        figures: Optional[Iterable[str]] = None,
+    ) -> "Numerology":
+        """Builds a chart without printing or logging anything, the problems found are listed in `diagnostics`.
+
+        The arguments are the ones of the constructor.
+        """
+        numerology = cls.__new__(cls)
+        numerology.set_inputs(first_name, last_name, birthdate, ruleset, date_parser)
+        numerology.verbose = False
+        if numerology.names_are_valid:
+            numerology.get_key_figures(figures)
+        return numerology
+
+    @classmethod
+    def from_inputs(cls, inputs: "Numerology", figures: Optional[Iterable[str]] = None) -> "Numerology":
+        """Builds the chart of this numerology system for the person of another chart.
+
+        The names and birthdate already checked by `inputs` are not validated or normalized again,
+        and its date record (see `date_record`) is shared.
 
-        return int(nsum)
+        Args:
+            inputs (Numerology): A chart of the same person, in any numerology system.
+            figures (Iterable[str], optional): Figures to compute. Defaults to None, meaning every key figure.
+
+        Returns:
+            Numerology: The chart, not printed.
+        """
+        numerology = cls.__new__(cls)
+        for name in cls.input_attributes:
+            setattr(numerology, name, getattr(inputs, name))
+        numerology.diagnostics = list(inputs.diagnostics)
+        numerology.verbose = False
+        numerology._key_figures = {}
+        numerology._memo = {}
+        if numerology.names_are_valid:
+            numerology.get_key_figures(figures)
+        return numerology
+
+    @classmethod
+    def print_chart(cls, chart: Chart):
+        """Prints the key figures and interpretations of a chart."""
+        print(_("KEY FIGURES:"))
+        fct.print_beautiful_dict(dictionary=dict(chart.key_figures))
+        print(_("INTERPRETATIONS:"))
+        fct.print_beautiful_dict(dictionary=dict(chart.interpretations))
 
     # INIT METHODS
 
-    def get_key_figures(self):
+    def set_inputs(
+        self,
+        first_name: str,
+        last_name: str,
+        birthdate: Optional[str],
+        ruleset: Optional[Ruleset],
+        date_parser: Optional[DateParser],
+    ):
+        """Sets and checks the names and birthdate, listing the problems found in `diagnostics`."""
+        self.first_name = first_name
+        self.last_name = last_name
+        self.birthdate = birthdate
+        if ruleset is not None:
+            self.ruleset = ruleset
+        if date_parser is not None:
+            self.date_parser = date_parser
+
+        self.diagnostics: List[Diagnostic] = []
+        self._key_figures = {}
+        # Figures already computed (see `figure`)
+        self._memo = {}
+        self.check_parameters()
+
+    def print_diagnostics(self):
+        """Prints the problems found in the inputs."""
+        for diagnostic in self.diagnostics:
+            if diagnostic.code == INVALID_NAME:
+                logging.warning("Invalid names supplied.")
+                print(_("Invalid names supplied."))
+            elif diagnostic.code == INVALID_DATE:
+                fct.print_date_error(self.birthdate_error)
+            else:
+                print(f"{Colors.WARNING}{diagnostic.message}{Colors.ENDC}")
+
+    def get_key_figures(self, figures: Optional[Iterable[str]] = None):
         if self.names_are_valid:
-            self.init_inner_variables()
-            self.set_key_figures()
-            self._interpretations = Interpretations(key_figures=self.key_figures)
+            self.selected_figures = None if figures is None else tuple(figures)
+            self._key_figures = {}
+            self.set_key_figures(figures)
+            self._interpretations = self.interpretations_class(key_figures=self.key_figures)
+            self.chart = Chart(self.system, self.key_figures, self.interpretations)
             return self.key_figures
         else:
             return 'None'
 
+    def update_inputs(self, **inputs: Optional[str]) -> FrozenSet[str]:
+        """Changes some of the names and birthdate, computing again only the figures depending on them.
+
+        The other figures and their interpretations are kept, so editing the last name does not compute
+        the birthdate figures again, and editing the birthdate does not compute the name figures again:
+
+            numerology.update_inputs(last_name="Obama")
+
+        Args:
+            **inputs (Optional[str]): New values of `first_name`, `last_name` and/or `birthdate`.
+
+        Raises:
+            TypeError: If an input is unknown.
+
+        Returns:
+            FrozenSet[str]: The key figures computed again.
+        """
+        for name in inputs:
+            if name not in ("first_name", "last_name", "birthdate"):
+                raise TypeError(f"Unknown input: {name!r}.")
+        changed = frozenset(name for name, value in inputs.items() if value != getattr(self, name))
+        if not changed:
+            return frozenset()
+        for name in changed:
+            setattr(self, name, inputs[name])
+        changed_inputs = set()
+        if "first_name" in changed or "last_name" in changed:
+            changed_inputs.add(NAMES)
+        if "birthdate" in changed:
+            changed_inputs.add(BIRTHDATE)
+
+        # Checks the inputs again, keeping the birthdate figures from the date table or shared by other charts
+        date_record = None if BIRTHDATE in changed_inputs else self.date_record
+        had_chart = self.chart is not None
+        self.diagnostics = []
+        self.check_parameters()
+        if self.birthdate_is_valid and self.date_record is None:
+            self.date_record = date_record
+
+        if not self.names_are_valid:
+            self.forget_figures()
+            self._key_figures = {}
+            self.chart = None
+            return frozenset()
+        if not had_chart:
+            self.get_key_figures(self.selected_figures)
+            return frozenset(self.key_figures)
+
+        # A figure overridden in a subclass may not depend on the same inputs as the figure it overrides,
+        # and a figure inherited may depend on figures overridden by the class
+        own_dependents = self.figure_graph.dependents(changed_inputs)
+        dependents = {}
+        for computed in list(self._memo):
+            owner = computed.owner
+            if owner not in dependents:
+                dependents[owner] = owner.figure_graph.dependents(changed_inputs) | own_dependents
+            if computed.__name__ in dependents[owner]:
+                del self._memo[computed]
+                if computed._is_resolved_by(type(self)):
+                    self.__dict__.pop(computed.__name__, None)
+        stale = self.figure_graph.dependents(changed_inputs) | changed
+        names, inputs = self.select_figures(self.selected_figures)
+        if NAMES in changed_inputs and NAMES in inputs:
+            self.init_name_variables()
+        if BIRTHDATE in changed_inputs and BIRTHDATE in inputs:
+            self.init_birthdate_variables()
+        key_figures = self._key_figures
+        updated = self.compute_figures(tuple(name for name in names if name in stale or name not in key_figures))
+        self._key_figures = {name: updated[name] if name in updated else key_figures[name] for name in names}
+        self._interpretations.update_interpretations(self.key_figures, stale)
+        self.chart = Chart(self.system, self.key_figures, self.interpretations)
+        return frozenset(name for name in self.key_figures if name in stale)
+
     def check_parameters(self):
+        self.first_name_is_valid = self.last_name_is_valid = self.names_are_valid = self.birthdate_is_valid = False
+        self.birthdate_parsed = self.birthdate_error = self.date_record = None
         self.check_first_name()
         self.check_last_name()
 
@@ -187,382 +737,150 @@ class Numerology:
             self.names_are_valid = True
             self.check_birthdate()
         else:
-            logging.warning("Invalid names supplied.")
-            print(_("Invalid names supplied."))
+            self.diagnostics.append(Diagnostic(INVALID_NAME, "names", "Invalid names supplied."))
 
     def check_first_name(self):
         """Check if the first name supplied contains at least one letter of the alphabet."""
-        if fct.keep_valid_letters(self.first_name, self.alphabet):
+        self.first_name_token = self.name_cache.get(self.first_name)
+        self.first_name_cleaned = self.first_name_token.cleaned
+        if self.first_name_cleaned:
             self.first_name_is_valid = True
+        else:
+            self.diagnostics.append(
+                Diagnostic(NO_VALID_CHARACTERS, "first_name", "The string supplied contains no valid character.")
+            )
 
     def check_last_name(self):
         """Check if the last name supplied contains at least one letter of the alphabet."""
-        if fct.keep_valid_letters(self.last_name, self.alphabet):
+        self.last_name_token = self.name_cache.get(self.last_name)
+        self.last_name_cleaned = self.last_name_token.cleaned
+        if self.last_name_cleaned:
             self.last_name_is_valid = True
+        else:
+            self.diagnostics.append(
+                Diagnostic(NO_VALID_CHARACTERS, "last_name", "The string supplied contains no valid character.")
+            )
 
     def check_birthdate(self):
-        """Check if the birthdate supplied is a valid date."""
-        if self.birthdate and fct.is_valid_date(self.birthdate):
-            self.birthdate_is_valid = True
+        """Check if the birthdate supplied is a valid date, and split it into year, month and day."""
+        if self.birthdate:
+            self.birthdate_parsed, self.birthdate_error = self.date_parser.parse(self.birthdate)
+            if self.birthdate_error is None:
+                self.birthdate_is_valid = True
+                if self.date_table is not None and self.date_table.is_compatible(self.ruleset):
+                    self.date_record = self.date_table.record(*self.birthdate_parsed)
+            else:
+                self.diagnostics.append(Diagnostic(INVALID_DATE, "birthdate", self.birthdate_error.message))
 
-    def init_inner_variables(self):
-        """Initializes the inner variables of the class as cleaned version of names, etc."""
+    def init_inner_variables(self, inputs: FrozenSet[str] = frozenset(INPUTS)):
+        """Initializes the inner variables of the class as cleaned version of names, etc.
+
+        Args:
+            inputs (FrozenSet[str], optional): The inputs to initialize, NAMES and/or BIRTHDATE. Defaults to both.
+        """
         # first_name is the first name as supplied by the user.
         # first_name_cleaned is the clean version of the first_name : lower case, accents removed, only alphabet letters kept.
-        # first_name_num is the matching numbers of first_name_cleaned.
+        # first_name_counts is the occurrences of the 26 letters in first_name_cleaned.
+        # first_name_sum is the sum of the matching numbers of first_name_cleaned.
         # Same for last_name.
+        # Every name figure is computed from these letter counts, the names are not scanned again.
 
         # Initialize the variables - Set the names and birthdate and their matching numbers.
-        self.first_name_cleaned = fct.keep_valid_letters(self.first_name, self.alphabet)
-        self.last_name_cleaned = fct.keep_valid_letters(self.last_name, self.alphabet)
-
-        self.first_name_num = fct.match_numbers_to_letters(self.first_name_cleaned, self.alphabet)
-        self.last_name_num = fct.match_numbers_to_letters(self.last_name_cleaned, self.alphabet)
-
-        if self.birthdate_is_valid and self.birthdate is not None:
-            self.birthdate_year = int(self.birthdate.split("-")[0])
-            self.birthdate_month = int(self.birthdate.split("-")[1])
-            self.birthdate_day = int(self.birthdate.split("-")[2])
-
-    def set_key_figures(self):
-        """Initializes the key figures dictionary."""
-
-        # First name and last name elements
-        if self.names_are_valid:
-            # Setting the key figures
-            self._key_figures["first_name"] = self.first_name
-            self._key_figures["last_name"] = self.last_name
-            # Hearts Desire Number (vowels) = Nombre intime (voyelles)
-            self._key_figures["hearts_desire_number"] = self.hearts_desire_number
-            # Personality Number (consonants) = Nombre de réalisation (consonnes)
-            self._key_figures["personality_number"] = self.personality_number
-            # Destiny Number (full name) = Nombre d'expression (nom complet)
-            self._key_figures["destiny_number"] = self.destiny_number
-            self._key_figures["expression_number"] = self.destiny_number
-            # Active Number (first name) = Nombre actif (prénom)
-            self._key_figures["active_number"] = self.active_number
-            # Legacy Number (last name) = Nombre héréditaire (nom de famille)
-            self._key_figures["legacy_number"] = self.legacy_number
-            self._key_figures["full_name_numbers"] = self.full_name_numbers
-            self._key_figures[
-                "full_name_missing_numbers"
-            ] = self.full_name_missing_numbers
-            self._key_figures["name_number"] = None
-            self._key_figures["psychic_number"] = None
-
-        # Birthdate elements (as birthdate is optional)
-        if self.birthdate_is_valid:
-            self._key_figures["birthdate"] = self.birthdate
-            self._key_figures["life_path_number"] = self.life_path_number
-            self._key_figures[
-                "life_path_number_alternative"
-            ] = self.life_path_number_alternative
-            self._key_figures["birthdate_day_num"] = self.birthdate_day_num
-            self._key_figures["birthdate_month_num"] = self.birthdate_month_num
-            self._key_figures["birthdate_year_num"] = self.birthdate_year_num
-            self._key_figures[
-                "birthdate_year_num_alternative"
-            ] = self.birthdate_year_num_alternative
-            self._key_figures["attitude_number"] = self.attitude_number
-            self._key_figures["karma_number"] = self.karma_number
-            self._key_figures["karmic_debt_numbers"] = self.karmic_debt_numbers
-            self._key_figures["power_number"] = self.power_number
-            self._key_figures[
-                "power_number_alternative"
-            ] = self.power_number_alternative
-
-    # PROPERTIES
-    @property
-    def key_figures(self) -> Dict[str, int]:
-        """Returns the keys figures in a dictionary."""
-        return self._key_figures
-
-    @property
-    def interpretations(self) -> Dict:
-        return self._interpretations.meanings
-
-    @property
-    def life_path_number(self) -> tuple:
-        """Returns the Life Path Number.
-
-        The life path number, also referred as Lucky Number in some places, is the most important one in a numerology chart.
-        It describes the direction of your life journey.
-        It offers insight into the skills and traits you may possess and the kinds of challenges you can expect to face in your life.
-        It is calculated from the birth date.
-
-        This method sums-reduces to one digit the date, month, and year before summing-reducing their total.
-        The alternative method `life_path_number_alternative` sums-reduces to one digit the total of day, month, and year from the birthdate.
-
-        Returns:
-            int: Life Path Number (Initial method).
-        """
-        if self.birthdate:
-            day = self.get_numerology_sum(
-                fct.int_to_tuple(self.birthdate_day), master_number=False
-            )
-            month = self.get_numerology_sum(
-                fct.int_to_tuple(self.birthdate_month), master_number=False
-            )
-            year = self.get_numerology_sum(
-                fct.int_to_tuple(self.birthdate_year), master_number=False
-            )
-            nsum = day + month + year
-            return (self.get_numerology_sum(fct.int_to_tuple(nsum), master_number=False),)
-        else:
-            print("WARNING: Birthdate is not set. Cannot calculate Life Path Number.")
-            return (0,)
-
-    @property
-    def life_path_number_alternative(self) -> tuple:
-        """Returns the Life Path Number (alternative method).
-
-        The life path number is the most important one in a numerology chart.
-        It describes the direction of your life journey.
-        It offers insight into the skills and traits you may possess and the kinds of challenges you can expect to face in your life.
-        It is calculated from the birth date.
-
-        The initial method sums-reduces to one digit the date, month, and year before summing-reducing their total.
-        This alternative method `life_path_number_alternative` sums-reduces to one digit the total of day, month, and year from the birthdate.
-
-        Returns:
-            int: Life Path Number (Alternative method)
-        """
-        nsum = self.birthdate_day + self.birthdate_month + self.birthdate_year
-        return (self.get_numerology_sum(fct.int_to_tuple(nsum), master_number=False),)
-
-    @property
-    def destiny_number(self) -> tuple:
-        """Returns the Destiny Number.
-
-        Sometimes called Expression Number or Lucky Number, it indicates the personal interest, unique capabilities and talents.
-
-        Returns:
-            int: Destiny number.
-        """
-        active_number = self.get_numerology_sum(
-            self.first_name_num, master_number=False
+        # The name tokens and cleaned names are set by check_first_name and check_last_name.
+        self.forget_figures()
+        if NAMES in inputs:
+            self.init_name_variables()
+        if BIRTHDATE in inputs and self.birthdate_is_valid:
+            self.init_birthdate_variables()
+
+    def forget_figures(self):
+        """Forgets the figures computed from the previous inputs (see `figure`)."""
+        for computed in self._memo:
+            self.__dict__.pop(computed.__name__, None)
+        self._memo = {}
+
+    def init_name_variables(self):
+        """Initializes the letter counts and letter sums of the names."""
+        self.first_name_counts = self.first_name_token.counts
+        self.last_name_counts = self.last_name_token.counts
+
+        first_name_sums = self.first_name_token.sums(self.letter_values)
+        last_name_sums = self.last_name_token.sums(self.letter_values)
+        self.first_name_sum = first_name_sums.total
+        self.last_name_sum = last_name_sums.total
+        self.full_name_vowels_sum = first_name_sums.vowels_total + last_name_sums.vowels_total
+        self.full_name_consonants_sum = first_name_sums.consonants_total + last_name_sums.consonants_total
+        self.full_name_number_counts = LetterValues.add_counts(
+            first_name_sums.number_counts, last_name_sums.number_counts
         )
-        legacy_number = self.get_numerology_sum(self.last_name_num, master_number=False)
-        return (self.get_numerology_sum((active_number, legacy_number), master_number=True),)
-
-    @property
-    def power_number(self) -> tuple:
-        """Returns the Power Number
-
-        Sometimes called the Maturity Number, the power number is obtained by adding together the life path number and destiny number. Then reduce the number to a single digit.
-
-        Returns:
-            int: [description]
-        """
-        return (self.get_numerology_sum(fct.int_to_tuple(self.life_path_number[0] + self.destiny_number[0]),
-            master_number=False),)
-
-    @property
-    def power_number_alternative(self) -> tuple:
-        """Returns the Power Number (Alternative)
-
-        Sometimes called the Maturity Number, the power number is obtained by adding together the life path number (alternative) and destiny number. Then reduce the number to a single digit.
-
-        Returns:
-            int: [description]
-        """
-        return (self.get_numerology_sum(fct.int_to_tuple(self.life_path_number_alternative[0] + self.destiny_number[0]),
-            master_number=False),)
-
-    @property
-    def personality_number(self) -> int:
-        """Returns the Personality Number.
-
-        Sometimes called the Inner Dream or Personal Dream Number, the Personality Number indicates our external personality.
-        It is calculated from the consonants in the full name.
-
-        Returns:
-            int: Inner Dream Number.
-        """
-        consonants_in_name_num = fct.match_numbers_to_letters(
-            ''.join(
-                letter
-                for letter in (self.first_name_cleaned + self.last_name_cleaned)
-                if letter in self.consonants
-            ),
-            self.alphabet
+        self.full_name_number_order = LetterValues.add_orders(
+            first_name_sums.number_order, last_name_sums.number_order
         )
-        return self.get_numerology_sum(consonants_in_name_num)
-
-    @property
-    def hearts_desire_number(self) -> int:
-        """Returns the Hearts Desire Number.
 
-        Sometimes called the Soul Urge or Soul Prompting Number, the Hearts Desire Number describes the inner desires.
-        It is calculated from the vowels in the full name.
+    def init_birthdate_variables(self):
+        """Initializes the year, month and day of the birthdate."""
+        self.birthdate_year, self.birthdate_month, self.birthdate_day = self.birthdate_parsed
 
-        Returns:
-            int: Hearts Desire Number.
-        """
-        vowels_in_name_num = fct.match_numbers_to_letters(
-            ''.join(
-                letter
-                for letter in (self.first_name_cleaned + self.last_name_cleaned)
-                if letter in self.vowels
-            ),
-            self.alphabet
-        )
-        return self.get_numerology_sum(vowels_in_name_num)
-
-    @property
-    def active_number(self) -> Tuple[int]:
-        """Returns the Active Number.
+    def set_key_figures(self, figures: Optional[Iterable[str]] = None):
+        """Initializes the key figures dictionary.
 
-        The number from your first name.
+        Only the inputs and intermediate figures needed by the figures are computed (see `figure_graph`).
+        The figures needing the birthdate are left out if the birthdate is not valid.
 
-        Returns:
-            int: The Active Number
+        Args:
+            figures (Iterable[str], optional): Figures to compute. Defaults to None, meaning every key figure.
         """
-        return (self.get_numerology_sum(self.first_name_num, master_number=False),)
-
-    @property
-    def legacy_number(self) -> Tuple[int]:
-        """Returns the Legacy Number.
+        names, inputs = self.select_figures(figures)
+        self.init_inner_variables(inputs)
+        self._key_figures.update(self.compute_figures(names))
 
-        The number from your last name.
+    def compute_figures(self, names: Tuple[str, ...]) -> Dict[str, Any]:
+        """Returns the figures, the empty ones being None.
 
-        Returns:
-            int: The legacy number
+        They are computed by the function compiled from `figure_specs`, or by the properties of the chart
+        if a subclass overrides some of them (see `figures_are_specified`).
         """
-        return (self.get_numerology_sum(self.last_name_num, master_number=False),)
-
-    @property
-    def full_name_numbers(self) -> Dict[int, int]:
-        """Returns the numbers from the full name as a dict(Counter).
-
-        The dict contains the numbers and their occurrences."""
-        full_name = self.first_name_cleaned + self.last_name_cleaned
-        full_name_num = fct.match_numbers_to_letters(full_name, self.alphabet)
-        full_name_counter = Counter(full_name_num).most_common()
-        full_name_counter_dict = dict(full_name_counter)
-        return full_name_counter_dict
-
-    @property
-    def full_name_missing_numbers(self) -> Tuple:
-        """Returns the missing numbers from the name as a tuple.
-        
-        Also called Karmic lesson numbers, shows a vacuum that needs to be filled in this lifetime by mastering the required Karmic lesson."""
-        full_name = self.first_name_cleaned + self.last_name_cleaned
-        full_name_num = fct.match_numbers_to_letters(full_name, self.alphabet)
-        return tuple([number for number in range(1, 10) if number not in full_name_num])
-
-    @property
-    def birthdate_day_num(self) -> Tuple[int]:
-        """Returns the numerology sum of the birthday day.
-
-        Example: The 27 in 1986-03-27 will give 9."""
-        return (self.get_numerology_sum(fct.int_to_tuple(self.birthdate_day), master_number=False),)
-
-    @property
-    def birthdate_month_num(self) -> int:
-        """Returns the numerology sum of the birthday month.
-
-        Example: The 12 in 1986-12-27 will give 3."""
-        return self.get_numerology_sum(
-            fct.int_to_tuple(self.birthdate_month), master_number=False
-        )
+        if not self.figures_are_specified():
+            graph = self.figure_graph
+            return {name: None if name in graph.empty_figures else getattr(self, name) for name in names}
+        compiled = self.figure_specs.compile(self.figure_graph, names, self.ruleset)
+        return compiled.function(*[getattr(self, variable) for variable in compiled.variables])
 
-    @property
-    def birthdate_year_num(self) -> int:
-        """Returns the numerology sum of the birthday year.
-
-        This method sums-reduces the 4 digits of the year.
-        The alternative one sums-reduces the 2 last digits."""
-        return self.get_numerology_sum(
-            fct.int_to_tuple(self.birthdate_year), master_number=False
-        )
+    @classmethod
+    def figures_are_specified(cls) -> bool:
+        """Returns whether every figure property of the class is the one generated from its spec."""
+        return cls._figures_are_specified
+
+    def select_figures(self, figures: Optional[Iterable[str]] = None) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+        """Returns the key figures to set, but the ones needing a birthdate that is not valid, and their inputs."""
+        graph = self.figure_graph
+        names = graph.key_figures if figures is None else tuple(figures)
+        computed = [name for name in names if name not in graph.empty_figures]
+        inputs = graph.inputs(computed)
+        if not self.birthdate_is_valid and BIRTHDATE in inputs:
+            names = tuple(name for name in names if name in graph.empty_figures or BIRTHDATE not in graph.inputs((name,)))
+            inputs = inputs - {BIRTHDATE}
+        return names, inputs
 
+    # PROPERTIES
     @property
-    def birthdate_year_num_alternative(self) -> int:
-        """Returns the numerology sum of the birthday year.
-
-        The original method sums-reduces the 4 digits of the year (1958 > 23 > 5).
-        This alternative one sums-reduces the 2 last digits ((19)58 > 13 > 4)."""
-        birthday_year_truncate = int(str(self.birthdate_year)[-2:])
-        return self.get_numerology_sum(
-            fct.int_to_tuple(birthday_year_truncate), master_number=False
-        )
+    def key_figures(self) -> Dict[str, int]:
+        """Returns the keys figures in a dictionary."""
+        return self._key_figures
 
     @property
-    def attitude_number(self) -> int:
-        """Returns the numerology sum of the birthday date and month.
-
-        Sometimes called the Sun Number, the Attitude Number indicates how we behave in situations with others Or our attitude towards them.
-        Example: The sum of 27th of December in 1986-12-27 will 27+12 > 12 > 3."""
-        if self.birthdate:
-            day = self.get_numerology_sum(
-                fct.int_to_tuple(self.birthdate_day), master_number=False
-            )
-            month = self.get_numerology_sum(
-                fct.int_to_tuple(self.birthdate_month), master_number=False
-            )
-            nsum = day + month
-            return self.get_numerology_sum(fct.int_to_tuple(nsum), master_number=False)
-        return 0
+    def interpretations(self) -> Dict:
+        return self._interpretations.meanings
 
     @property
-    def karma_number(self) -> int:
-        """Returns the numerology sum of the (birthday date - 1).
-
-        Example: For 1986-12-27 will be 27-1 > 26 > 8."""
-        if self.birthdate:
-            day = self.birthdate_day - 1
-            return self.get_numerology_sum(fct.int_to_tuple(day), master_number=False)
-        return 0
+    def first_name_num(self) -> Tuple[int, ...]:
+        """Returns the matching numbers of the letters of the cleaned first name."""
+        return fct.match_numbers_to_letters(self.first_name_cleaned, self.alphabet)
 
     @property
-    def karmic_debt_numbers(self) -> Dict[str, int]:
-        """Returns Karmic debts associated with any of Life Path, Personality, Birth Day, Expression, and Heart’s Desire."""
-        debt_numbers = [19, 13, 14, 16]
-        core_karmic_num = {}
-        day = fct.int_to_tuple(self.birthdate_day)
-        month = fct.int_to_tuple(self.birthdate_month)
-        year = fct.int_to_tuple(self.birthdate_year)
-        nsum = day + month + year
-        life_path_number = self.get_numerology_sum(nsum, upper_bound=19, master_number=False)
-        if life_path_number in core_karmic_num:
-            core_karmic_num["life_path_number"] = life_path_number
-
-        vowels_in_name_num = fct.match_numbers_to_letters(
-            ''.join(
-                letter
-                for letter in (self.first_name_cleaned + self.last_name_cleaned)
-                if letter in self.vowels
-            ),
-            self.alphabet
-        )
-        hearts_desire_number = self.get_numerology_sum(vowels_in_name_num, upper_bound=19)
-        if hearts_desire_number in debt_numbers:
-            core_karmic_num["hearts_desire_number"] = hearts_desire_number
-
-        consonants_in_name_num = fct.match_numbers_to_letters(
-            ''.join(
-                letter
-                for letter in (self.first_name_cleaned + self.last_name_cleaned)
-                if letter in self.consonants
-            ),
-            self.alphabet
-        )
-        personality_number = self.get_numerology_sum(consonants_in_name_num, upper_bound=19)
-        if personality_number in debt_numbers:
-            core_karmic_num["personality_number"] = personality_number
-
-        destiny_number = self.get_numerology_sum(
-            (self.active_number[0], self.legacy_number[0]), upper_bound=19, master_number=True
-        )
-        if destiny_number in debt_numbers:
-            core_karmic_num["destiny_number"] = destiny_number
-
-        birthdate_day_num = self.get_numerology_sum(
-            fct.int_to_tuple(self.birthdate_day), upper_bound=19, master_number=False
-        )
-        if birthdate_day_num in debt_numbers:
-            core_karmic_num["birthdate_day_num"] = birthdate_day_num
+    def last_name_num(self) -> Tuple[int, ...]:
+        """Returns the matching numbers of the letters of the cleaned last name."""
+        return fct.match_numbers_to_letters(self.last_name_cleaned, self.alphabet)
 
-        return core_karmic_num
 
+Numerology.define_figures()
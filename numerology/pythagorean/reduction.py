@@ -0,0 +1,141 @@
+import threading
+from typing import FrozenSet, Optional
+
+
+class Reduction:
+    """Integer-only numerology reduction.
+
+    A reduction sums the digits of a number again and again until the result is lower or equal to an upper bound.
+    When master numbers are taken into account, the reduction also stops on a multiple of 11.
+    """
+
+    @classmethod
+    def digit_sum(cls, number: int) -> int:
+        """Returns the sum of the digits of a non-negative integer.
+
+        Example: The integer 1991 will give 20."""
+        total = 0
+        while number:
+            number, digit = divmod(number, 10)
+            total += digit
+        return total
+
+    @classmethod
+    def reduce(cls, number: int, upper_bound: int = 9, master_number: bool = True) -> int:
+        """Sums-reduces a non-negative integer.
+
+        Args:
+            number (int): Number to reduce.
+            upper_bound (int, optional): The reduction stops as soon as the number is lower or equal to it. Defaults to 9.
+            master_number (bool, optional): If True, the reduction also stops on a multiple of 11. Defaults to True.
+
+        Returns:
+            int: The reduced number.
+        """
+        if number <= upper_bound:
+            return number
+        if master_number:
+            while number > upper_bound and number % 11 != 0:
+                number = cls.digit_sum(number)
+            return number
+        if upper_bound == 9:
+            # Digital root: repeated digit sums of n > 9 always end on 1 + (n - 1) mod 9.
+            return 1 + (number - 1) % 9
+        while number > upper_bound:
+            number = cls.digit_sum(number)
+        return number
+
+
+class ReductionTable(dict):
+    """Lookup table of the reductions of every sum for one (upper_bound, master_number) rule.
+
+    The table maps every sum from 0 to `size - 1` to its reduced value, so a reduction is a single index: `table[number]`.
+    A sum beyond the current size (a very long name for instance) grows the table lazily, under a lock,
+    the tables being shared by every thread: the lookups of the sums already in the table take no lock.
+
+    With `digits=True`, the table maps a number to the reduction of the sum of its digits,
+    which is how the figures of a birthdate are reduced (1958 > 1 + 9 + 5 + 8 > 23 > 5).
+
+    When `master_number` is True, the reduction stops on the `master_numbers`, or on any multiple of 11 if they are not given.
+
+    Raises:
+        ValueError: If `upper_bound` is lower than 9, a single digit above it not being reducible.
+    """
+
+    default_size: int = 4096
+
+    _shared: dict = {}
+
+    def __init__(
+        self,
+        upper_bound: int = 9,
+        master_number: bool = True,
+        digits: bool = False,
+        size: Optional[int] = None,
+        master_numbers: Optional[FrozenSet[int]] = None,
+    ):
+        if upper_bound < 9:
+            raise ValueError(f"The upper bound of a reduction must be 9 or more, not {upper_bound}.")
+        super().__init__()
+        self.upper_bound = upper_bound
+        self.master_number = master_number
+        self.digits = digits
+        self.master_numbers = master_numbers
+        self._digit_sums = [0]
+        self._reductions = [0]
+        self._lock = threading.Lock()
+        self._fill(size or self.default_size)
+
+    @classmethod
+    def shared(
+        cls,
+        upper_bound: int = 9,
+        master_number: bool = True,
+        digits: bool = False,
+        master_numbers: Optional[FrozenSet[int]] = None,
+    ) -> "ReductionTable":
+        """Returns the table of a rule, built once and shared by every caller."""
+        if not master_number:
+            master_numbers = None
+        key = (upper_bound, master_number, digits, master_numbers)
+        table = cls._shared.get(key)
+        if table is None:
+            table = cls._shared.setdefault(key, cls(upper_bound, master_number, digits, master_numbers=master_numbers))
+        return table
+
+    @property
+    def size(self) -> int:
+        return len(self._reductions)
+
+    def __missing__(self, number: int) -> int:
+        if not isinstance(number, int) or number < 0:
+            raise KeyError(number)
+        with self._lock:
+            # Another thread may have grown the table while this one was waiting
+            if number >= self.size:
+                self._fill(max(2 * self.size, number + 1))
+        return dict.__getitem__(self, number)
+
+    def _fill(self, size: int):
+        """Grows the table up to `size`, the caller holding the lock once the table is shared."""
+        upper_bound = self.upper_bound
+        master_number = self.master_number
+        master_numbers = self.master_numbers
+        digit_sums = self._digit_sums
+        reductions = self._reductions
+        start = len(reductions) if self else 0
+        for number in range(len(reductions), size):
+            digit_sum = digit_sums[number // 10] + number % 10
+            digit_sums.append(digit_sum)
+            if number <= upper_bound or (
+                master_number
+                and (number % 11 == 0 if master_numbers is None else number in master_numbers)
+            ):
+                reductions.append(number)
+            else:
+                # The digit sum of a number greater than 9 is always lower than the number itself.
+                reductions.append(reductions[digit_sum])
+        if self.digits:
+            self.update((number, reductions[digit_sums[number]]) for number in range(start, size))
+        else:
+            self.update((number, reductions[number]) for number in range(start, size))
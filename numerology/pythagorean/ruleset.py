@@ -0,0 +1,96 @@
+import hashlib
+from typing import FrozenSet, Iterable, Optional, Tuple
+
+from .reduction import ReductionTable
+
+
+class Ruleset:
+    """The rules of a numerology chart: master numbers, karmic debt numbers and reduction upper bounds.
+
+    A ruleset is compiled once into the reduction and classification tables used by every figure.
+    Several rulesets can be used side by side in the same process, for instance:
+
+        Pythagorean("Barack", "Obama", "1961-08-04", ruleset=Ruleset(master_numbers=(11, 22, 33)))
+
+    Args:
+        master_numbers (Iterable[int], optional): Numbers on which a reduction with master numbers stops.
+            Defaults to None, meaning every multiple of 11.
+        karmic_debt_numbers (Iterable[int], optional): Karmic debt numbers. Defaults to (19, 13, 14, 16).
+        single_bound (int, optional): Upper bound of the single digit reductions. Defaults to 9.
+        karmic_bound (int, optional): Upper bound of the reductions looking for karmic debts. Defaults to 19.
+        compound_bound (int, optional): Upper bound of the Chaldean compound reductions. Defaults to 52.
+
+    Raises:
+        ValueError: If a bound is not an integer of 9 or more, a single digit above it not being reducible.
+    """
+
+    def __init__(
+        self,
+        master_numbers: Optional[Iterable[int]] = None,
+        karmic_debt_numbers: Iterable[int] = (19, 13, 14, 16),
+        single_bound: int = 9,
+        karmic_bound: int = 19,
+        compound_bound: int = 52,
+    ):
+        bounds = {"single_bound": single_bound, "karmic_bound": karmic_bound, "compound_bound": compound_bound}
+        for name, bound in bounds.items():
+            if not isinstance(bound, int) or bound < 9:
+                raise ValueError(f"{name} must be an integer of 9 or more, not {bound!r}.")
+        self.master_numbers: Optional[FrozenSet[int]] = (
+            frozenset(master_numbers) if master_numbers is not None else None
+        )
+        self.karmic_debt_numbers: Tuple[int, ...] = tuple(karmic_debt_numbers)
+        self.single_bound = single_bound
+        self.karmic_bound = karmic_bound
+        self.compound_bound = compound_bound
+        self.compile()
+
+    def __repr__(self) -> str:
+        return (
+            f"Ruleset(master_numbers={self.master_numbers and sorted(self.master_numbers)}, "
+            f"karmic_debt_numbers={self.karmic_debt_numbers}, single_bound={self.single_bound}, "
+            f"karmic_bound={self.karmic_bound}, compound_bound={self.compound_bound})"
+        )
+
+    @property
+    def parameters(self) -> Tuple:
+        """Returns the parameters of the ruleset, in a canonical order."""
+        return (
+            tuple(sorted(self.master_numbers)) if self.master_numbers is not None else None,
+            tuple(sorted(self.karmic_debt_numbers)),
+            self.single_bound,
+            self.karmic_bound,
+            self.compound_bound,
+        )
+
+    def compile(self):
+        """Builds the reduction and classification tables of the ruleset.
+
+        The `sum_*` tables reduce a sum, the `digits_*` tables reduce the sum of the digits of a number:
+        `ruleset.sum_single[number]` is the reduced number.
+        """
+        masters = self.master_numbers
+        self.sum_single = ReductionTable.shared(self.single_bound, False)
+        self.sum_master = ReductionTable.shared(self.single_bound, True, master_numbers=masters)
+        self.sum_karmic = ReductionTable.shared(self.karmic_bound, False)
+        self.sum_karmic_master = ReductionTable.shared(self.karmic_bound, True, master_numbers=masters)
+        self.sum_compound = ReductionTable.shared(self.compound_bound, True, master_numbers=masters)
+        self.digits_single = ReductionTable.shared(self.single_bound, False, digits=True)
+        self.digits_karmic = ReductionTable.shared(self.karmic_bound, False, digits=True)
+        self.digits_compound = ReductionTable.shared(self.compound_bound, True, digits=True, master_numbers=masters)
+        self.karmic_debts: FrozenSet[int] = frozenset(self.karmic_debt_numbers)
+        # 16 bytes digest of the parameters, identical for two rulesets giving the same figures.
+        self.fingerprint: bytes = hashlib.blake2b(repr(self.parameters).encode(), digest_size=16).digest()
+
+    def is_master_number(self, number: int) -> bool:
+        """Returns True if the number stops a reduction with master numbers."""
+        if self.master_numbers is None:
+            return number % 11 == 0
+        return number in self.master_numbers
+
+    def is_karmic_debt(self, number: int) -> bool:
+        """Returns True if the number is a karmic debt number."""
+        return number in self.karmic_debts
+
+
+DEFAULT_RULESET = Ruleset()
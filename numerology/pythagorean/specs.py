@@ -0,0 +1,468 @@
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .diagnostics import MISSING_BIRTHDATE, Diagnostic
+from .figures import BIRTHDATE, NAMES, FigureGraph, figure
+from .ruleset import Ruleset
+
+# Variables a figure can be computed from, set by `Numerology.init_inner_variables`, and the inputs they come from.
+VARIABLES: Dict[str, Tuple[str, ...]] = {
+    "first_name": (),
+    "last_name": (),
+    "first_name_sum": (NAMES,),
+    "last_name_sum": (NAMES,),
+    "full_name_vowels_sum": (NAMES,),
+    "full_name_consonants_sum": (NAMES,),
+    "full_name_number_counts": (NAMES,),
+    "full_name_number_order": (NAMES,),
+    "birthdate": (BIRTHDATE,),
+    "birthdate_day": (BIRTHDATE,),
+    "birthdate_month": (BIRTHDATE,),
+    "birthdate_year": (BIRTHDATE,),
+    # Figures of the birthdate read from the date table, None if the date is not in it (see DateFigureTable)
+    "date_record": (BIRTHDATE,),
+}
+
+# Shapes of the figures
+NUMBER = "number"
+# A number in a tuple: (7,)
+SINGLE = "single"
+# A compound number and its reduction, or only one number if they are equal: (16, 7) or (7,)
+COMPOUND = "compound"
+
+
+class Var(NamedTuple):
+    """A variable of the chart (see VARIABLES)."""
+
+    name: str
+
+    def source(self) -> str:
+        return self.name
+
+    def requirements(self) -> Tuple[str, ...]:
+        return (self.name,)
+
+    def bind(self, namespace: Dict[str, Any], ruleset: Ruleset):
+        pass
+
+
+class Fig(NamedTuple):
+    """Another figure, or one of its numbers if `index` is given."""
+
+    name: str
+    index: Optional[int] = None
+
+    def source(self) -> str:
+        return self.name if self.index is None else f"{self.name}[{self.index}]"
+
+    def requirements(self) -> Tuple[str, ...]:
+        return (self.name,)
+
+    def bind(self, namespace: Dict[str, Any], ruleset: Ruleset):
+        pass
+
+
+class Const(NamedTuple):
+    """A constant integer."""
+
+    value: int
+
+    def source(self) -> str:
+        return repr(self.value)
+
+    def requirements(self) -> Tuple[str, ...]:
+        return ()
+
+    def bind(self, namespace: Dict[str, Any], ruleset: Ruleset):
+        pass
+
+
+class Table(NamedTuple):
+    """An attribute of the ruleset, as `karmic_debts`."""
+
+    name: str
+
+    def source(self) -> str:
+        return self.name
+
+    def requirements(self) -> Tuple[str, ...]:
+        return ()
+
+    def bind(self, namespace: Dict[str, Any], ruleset: Ruleset):
+        namespace[self.name] = getattr(ruleset, self.name)
+
+
+class Sum(NamedTuple):
+    """The sum of the terms."""
+
+    terms: Tuple["Term", ...]
+
+    def source(self) -> str:
+        total = self.terms[0].source()
+        for term in self.terms[1:]:
+            if isinstance(term, Const) and term.value < 0:
+                total += f" - {-term.value}"
+            else:
+                total += f" + {term.source()}"
+        return total
+
+    def requirements(self) -> Tuple[str, ...]:
+        return tuple(requirement for term in self.terms for requirement in term.requirements())
+
+    def bind(self, namespace: Dict[str, Any], ruleset: Ruleset):
+        for term in self.terms:
+            term.bind(namespace, ruleset)
+
+
+class Reduce(NamedTuple):
+    """The sum of the terms reduced with a reduction table of the ruleset, as `sum_single` (see Ruleset)."""
+
+    table: str
+    terms: Tuple["Term", ...]
+
+    def source(self) -> str:
+        return f"{self.table}[{Sum(self.terms).source()}]"
+
+    def requirements(self) -> Tuple[str, ...]:
+        return Sum(self.terms).requirements()
+
+    def bind(self, namespace: Dict[str, Any], ruleset: Ruleset):
+        namespace[self.table] = getattr(ruleset, self.table)
+        Sum(self.terms).bind(namespace, ruleset)
+
+
+class Mod(NamedTuple):
+    """The remainder of a term divided by a constant, as the 2 last digits of a year."""
+
+    term: "Term"
+    divisor: int
+
+    def source(self) -> str:
+        return f"{self.term.source()} % {self.divisor}"
+
+    def requirements(self) -> Tuple[str, ...]:
+        return self.term.requirements()
+
+    def bind(self, namespace: Dict[str, Any], ruleset: Ruleset):
+        self.term.bind(namespace, ruleset)
+
+
+class Call(NamedTuple):
+    """A function of the terms."""
+
+    function: Callable[..., Any]
+    terms: Tuple["Term", ...]
+
+    def source(self) -> str:
+        return f"{self.function.__name__}({', '.join(term.source() for term in self.terms)})"
+
+    def requirements(self) -> Tuple[str, ...]:
+        return tuple(requirement for term in self.terms for requirement in term.requirements())
+
+    def bind(self, namespace: Dict[str, Any], ruleset: Ruleset):
+        namespace[self.function.__name__] = self.function
+        for term in self.terms:
+            term.bind(namespace, ruleset)
+
+
+class Recorded(NamedTuple):
+    """A figure of the birthdate read from the date record (see DateField), or the term if there is no record."""
+
+    field: int
+    term: "Term"
+
+    def source(self) -> str:
+        return f"({self.term.source()} if date_record is None else date_record[{self.field}])"
+
+    def requirements(self) -> Tuple[str, ...]:
+        return ("date_record",) + self.term.requirements()
+
+    def bind(self, namespace: Dict[str, Any], ruleset: Ruleset):
+        self.term.bind(namespace, ruleset)
+
+
+Term = Union[Var, Fig, Const, Table, Sum, Reduce, Mod, Call, Recorded]
+
+
+def add(*terms: Term) -> Sum:
+    """Returns the sum of the terms."""
+    return Sum(terms)
+
+
+def reduce(table: str, *terms: Term) -> Reduce:
+    """Returns the sum of the terms reduced with a reduction table of the ruleset."""
+    return Reduce(table, terms)
+
+
+def call(function: Callable[..., Any], *terms: Term) -> Call:
+    """Returns a function of the terms."""
+    return Call(function, terms)
+
+
+def recorded(field: int, term: Term) -> Recorded:
+    """Returns the figure of the date record at `field`, the term being computed if there is no record."""
+    return Recorded(field, term)
+
+
+class FigureSpec(NamedTuple):
+    """How a figure is computed, as data: the value of the figure, made of variables, figures and reductions.
+
+    Args:
+        name (str): Name of the figure.
+        value (Term): Value of the figure, or its compound number if the shape is COMPOUND.
+        shape (str, optional): NUMBER, SINGLE or COMPOUND. Defaults to NUMBER.
+        reduced (Term, optional): Reduction of the compound number, if the shape is COMPOUND. Defaults to None.
+        doc (str, optional): Documentation of the figure, the docstring of its property. Defaults to None.
+    """
+
+    name: str
+    value: Term
+    shape: str = NUMBER
+    reduced: Optional[Term] = None
+    doc: Optional[str] = None
+
+    def requirements(self) -> Tuple[str, ...]:
+        requirements = self.value.requirements()
+        if self.reduced is not None:
+            requirements += self.reduced.requirements()
+        return tuple(dict.fromkeys(requirements))
+
+    def renamed(self, name: str, doc: Optional[str] = None) -> "FigureSpec":
+        """Returns the spec of the same value under another name, as the Vedic name of a Pythagorean figure."""
+        return self._replace(name=name, doc=doc or self.doc)
+
+    def empty(self) -> Any:
+        """Returns the value of the figure when it cannot be computed, as without birthdate: 0 in its shape."""
+        return 0 if self.shape == NUMBER else (0,)
+
+    def statements(self) -> List[str]:
+        """Returns the lines of Python code computing the figure into a local variable of its name."""
+        if self.shape == NUMBER:
+            return [f"{self.name} = {self.value.source()}"]
+        if self.shape == SINGLE:
+            return [f"{self.name} = ({self.value.source()},)"]
+        if self.shape == COMPOUND:
+            return [
+                f"_compound = {self.value.source()}",
+                f"_reduced = {self.reduced.source()}",
+                f"{self.name} = (_reduced,) if _compound == _reduced else (_compound, _reduced)",
+            ]
+        raise ValueError(f"Unknown shape of the figure {self.name!r}: {self.shape!r}.")
+
+
+class CompiledFigures(NamedTuple):
+    """A generated function computing some figures of a chart from the variables (see VARIABLES)."""
+
+    function: Callable[..., Dict[str, Any]]
+    variables: Tuple[str, ...]
+    source: str
+
+
+class FigureSpecs:
+    """The figures of a numerology system declared as data, compiled into straight-line Python functions.
+
+    A selection of figures is compiled once per ruleset into one function computing every figure needed
+    into local variables, with the reduction tables of the ruleset bound as globals:
+
+        compiled = Pythagorean.figure_specs.compile(Pythagorean.figure_graph, ("power_number",), DEFAULT_RULESET)
+        print(compiled.source)
+
+    Args:
+        specs (Iterable[FigureSpec]): How the figures are computed.
+    """
+
+    def __init__(self, specs: Iterable[FigureSpec]):
+        self.specs: Dict[str, FigureSpec] = {spec.name: spec for spec in specs}
+        # Functions already compiled, by figure selection and ruleset fingerprint
+        self._compiled: Dict[Tuple[Tuple[str, ...], bytes], CompiledFigures] = {}
+        # Functions of one figure from the figures it depends on (see `compile_figure`), by figure and fingerprint
+        self._compiled_figures: Dict[Tuple[str, bytes], CompiledFigures] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.specs
+
+    def extend(self, specs: Iterable[FigureSpec]) -> "FigureSpecs":
+        """Returns the specs of another system, reusing the specs of this one and overriding some."""
+        return FigureSpecs([*self.specs.values(), *specs])
+
+    def dependencies(self) -> Dict[str, Tuple[str, ...]]:
+        """Returns the inputs (NAMES, BIRTHDATE) and figures every figure is computed from (see FigureGraph)."""
+        dependencies = {}
+        for name, spec in self.specs.items():
+            requirements = []
+            for requirement in spec.requirements():
+                requirements.extend(VARIABLES[requirement] if requirement in VARIABLES else (requirement,))
+            dependencies[name] = tuple(dict.fromkeys(requirements))
+        return dependencies
+
+    def compile(self, graph: FigureGraph, names: Iterable[str], ruleset: Ruleset) -> CompiledFigures:
+        """Returns the function computing the figures, the empty figures of the graph being None.
+
+        Raises:
+            ValueError: If a figure is unknown.
+        """
+        names = tuple(names)
+        key = (names, ruleset.fingerprint)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._compiled[key] = self._compile(graph, names, ruleset)
+        return compiled
+
+    def compile_figure(self, name: str, ruleset: Ruleset) -> CompiledFigures:
+        """Returns the function computing one figure from the variables and the figures its spec refers to.
+
+        This is the function of the figure property (see `specified_figure`): the figures it depends on
+        are read from the chart, so a figure overridden by a subclass is taken into account.
+
+        Raises:
+            ValueError: If the figure is unknown.
+        """
+        key = (name, ruleset.fingerprint)
+        compiled = self._compiled_figures.get(key)
+        if compiled is None:
+            if name not in self.specs:
+                raise ValueError(f"Unknown figure: {name!r}.")
+            requirements = self.specs[name].requirements()
+            compiled = self._compiled_figures[key] = self._generate((name,), requirements, (name,), (), ruleset)
+        return compiled
+
+    def define_figures(self, cls: type):
+        """Adds to a chart class the figure property of every spec (see `specified_figure`).
+
+        The variables, the figures defined by the class itself and the figures inherited with the same spec
+        are left as they are.
+        """
+        for name, spec in self.specs.items():
+            if name in VARIABLES or name in vars(cls):
+                continue
+            if getattr(getattr(cls, name, None), "spec", None) is spec:
+                continue
+            specified = specified_figure(self, name)
+            setattr(cls, name, specified)
+            specified.__set_name__(cls, name)
+
+    def are_defined_by(self, cls: type) -> bool:
+        """Returns whether every figure of the class is the property generated from its spec."""
+        return all(
+            getattr(getattr(cls, name, None), "spec", None) is spec
+            for name, spec in self.specs.items()
+            if name not in VARIABLES
+        )
+
+    def _compile(self, graph: FigureGraph, names: Tuple[str, ...], ruleset: Ruleset) -> CompiledFigures:
+        order = self._resolve(name for name in names if name not in graph.empty_figures)
+        variables = tuple(name for name in VARIABLES if name in order)
+        return self._generate(order, variables, names, graph.empty_figures, ruleset)
+
+    def _generate(
+        self,
+        order: Iterable[str],
+        parameters: Tuple[str, ...],
+        names: Tuple[str, ...],
+        empty_figures: Iterable[str],
+        ruleset: Ruleset,
+    ) -> CompiledFigures:
+        """Returns the function of the parameters computing the figures in order, and returning the `names`."""
+        namespace: Dict[str, Any] = {}
+        lines = [f"def compiled_figures({', '.join(parameters)}):"]
+        for name in order:
+            if name in parameters:
+                continue
+            spec = self.specs[name]
+            spec.value.bind(namespace, ruleset)
+            if spec.reduced is not None:
+                spec.reduced.bind(namespace, ruleset)
+            lines.extend(f"    {statement}" for statement in spec.statements())
+        figures = ", ".join(f"{name!r}: {'None' if name in empty_figures else name}" for name in names)
+        lines.append(f"    return {{{figures}}}")
+        source = "\n".join(lines) + "\n"
+        exec(compile(source, f"<figures of {', '.join(names)}>", "exec"), namespace)
+        return CompiledFigures(namespace["compiled_figures"], parameters, source)
+
+    def _resolve(self, names: Iterable[str]) -> List[str]:
+        """Returns the figures and variables needed, each one after its requirements."""
+        order: List[str] = []
+        for name in names:
+            self._visit(name, order)
+        return order
+
+    def _visit(self, name: str, order: List[str]):
+        if name in order:
+            return
+        if name not in VARIABLES:
+            try:
+                spec = self.specs[name]
+            except KeyError:
+                raise ValueError(f"Unknown figure: {name!r}.") from None
+            for requirement in spec.requirements():
+                self._visit(requirement, order)
+        order.append(name)
+
+
+class specified_figure(figure):
+    """A figure property computing the figure as declared by its spec, generated by `FigureSpecs.define_figures`.
+
+    A figure is declared once, as a spec: its property is the function compiled for the spec alone
+    (see `FigureSpecs.compile_figure`), documented by the spec. A figure needing the birthdate of a chart
+    without valid birthdate is empty (see `FigureSpec.empty`), with a MISSING_BIRTHDATE diagnostic.
+    """
+
+    def __init__(self, specs: FigureSpecs, name: str):
+        super().__init__(self.compute)
+        self.specs = specs
+        self.spec = specs.specs[name]
+        self.__name__ = name
+        self.__doc__ = self.spec.doc
+
+    def __repr__(self) -> str:
+        return f"specified_figure({self.__name__})"
+
+    def compute(self, chart) -> Any:
+        name = self.__name__
+        if not chart.birthdate_is_valid and BIRTHDATE in chart.figure_graph.inputs((name,)):
+            message = f"Birthdate is not set. Cannot calculate {name.replace('_', ' ').title()}."
+            chart.diagnostics.append(Diagnostic(MISSING_BIRTHDATE, "birthdate", message))
+            return self.spec.empty()
+        compiled = self.specs.compile_figure(name, chart.ruleset)
+        return compiled.function(*[getattr(chart, variable) for variable in compiled.variables])[name]
+
+
+# FUNCTIONS OF THE FIGURES
+
+
+def number_occurrences(number_counts: Tuple[int, ...], number_order: Tuple[int, ...]) -> Dict[int, int]:
+    """Returns the numbers of the full name and their occurrences, the most common numbers first.
+
+    Numbers as common as each other keep their order of first appearance in the full name, as `Counter.most_common`.
+    """
+    number_counts = [(number, number_counts[number]) for number in number_order]
+    return dict(sorted(number_counts, key=lambda number_count: -number_count[1]))
+
+
+def missing_numbers(number_counts: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Returns the numbers from 1 to 9 missing in the full name."""
+    return tuple(number for number in range(1, 10) if not number_counts[number])
+
+
+def karmic_debt_figures(
+    debt_numbers: Iterable[int],
+    life_path_number: int,
+    hearts_desire_number: int,
+    personality_number: int,
+    destiny_number: int,
+    birthdate_day_num: int,
+) -> Dict[str, int]:
+    """Returns the figures reduced up to 19 which are karmic debt numbers.
+
+    As `Numerology.karmic_debt_numbers`, the life path number is not looked at.
+    """
+    core_karmic_num = {}
+    if hearts_desire_number in debt_numbers:
+        core_karmic_num["hearts_desire_number"] = hearts_desire_number
+    if personality_number in debt_numbers:
+        core_karmic_num["personality_number"] = personality_number
+    if destiny_number in debt_numbers:
+        core_karmic_num["destiny_number"] = destiny_number
+    if birthdate_day_num in debt_numbers:
+        core_karmic_num["birthdate_day_num"] = birthdate_day_num
+    return core_karmic_num
+
@@ -0,0 +1,241 @@
+"""Numerology figures of whole arrays of birthdates and names at once, with NumPy.
+
+NumPy is an optional dependency: `pip install numerology[vectorized]`.
+The figures are reduced with the same tables as the charts (see Ruleset), so they are identical to the charts ones.
+"""
+import unicodedata
+from typing import Dict, Iterable, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from chaldean.numerology import CNumerology
+from pythagorean.letters import LETTERS, LetterFilter, LetterValues
+from pythagorean.names import LETTERS_ALPHABET
+from pythagorean.numerology import Numerology
+from pythagorean.reduction import ReductionTable
+from pythagorean.ruleset import DEFAULT_RULESET, Ruleset
+from vedic.numerology import VNumerology
+
+
+def require_numpy():
+    if np is None:
+        raise ImportError("The vectorized numerology requires NumPy: pip install numerology[vectorized]")
+
+
+# Reduction tables as arrays, by table id.
+_lookup_arrays: Dict[int, Tuple[ReductionTable, "np.ndarray"]] = {}
+
+
+def lookup_array(table: ReductionTable, max_number: int) -> "np.ndarray":
+    """Returns the reduction table as an array, covering every number up to `max_number`."""
+    if table.size <= max_number:
+        # Grows the table
+        table[max_number]
+    table_array = _lookup_arrays.get(id(table))
+    size = table.size
+    if table_array is None or table_array[0] is not table or len(table_array[1]) != size:
+        array = np.fromiter((table[number] for number in range(size)), np.int64, size)
+        table_array = _lookup_arrays[id(table)] = (table, array)
+    return table_array[1]
+
+
+def reduce_array(table: ReductionTable, numbers: "np.ndarray") -> "np.ndarray":
+    """Reduces every number of the array with a reduction table."""
+    if numbers.size == 0:
+        return numbers.copy()
+    return lookup_array(table, int(numbers.max()))[numbers]
+
+
+def digit_sums(numbers: "np.ndarray") -> "np.ndarray":
+    """Returns the sum of the digits of every number of the array."""
+    numbers = numbers.copy()
+    sums = np.zeros_like(numbers)
+    while numbers.any():
+        numbers, digits = np.divmod(numbers, 10)
+        sums += digits
+    return sums
+
+
+def split_dates(dates) -> tuple:
+    """Splits an array of dates (datetime64 or 'yyyy-mm-dd' strings) into arrays of years, months and days."""
+    days_array = np.asarray(dates, dtype="datetime64[D]")
+    if np.isnat(days_array).any():
+        raise ValueError("The dates contain NaT values.")
+    months_array = days_array.astype("datetime64[M]")
+    years = months_array.astype("datetime64[Y]").astype(np.int64) + 1970
+    months = months_array.astype(np.int64) % 12 + 1
+    days = (days_array - months_array).astype(np.int64) + 1
+    return years, months, days
+
+
+def date_figures(
+    years, months=None, days=None, ruleset: Ruleset = DEFAULT_RULESET
+) -> Dict[str, Dict[str, "np.ndarray"]]:
+    """Computes the birthdate figures of the Pythagorean, Chaldean and Vedic numerology for arrays of dates.
+
+    Args:
+        years: Array of years, or array of dates (datetime64 or 'yyyy-mm-dd' strings) if `months` and `days` are not given.
+        months (optional): Array of months, from 1 to 12.
+        days (optional): Array of days, from 1 to 31.
+        ruleset (Ruleset, optional): Rules of the reductions. Defaults to DEFAULT_RULESET.
+
+    Returns:
+        Dict[str, Dict[str, np.ndarray]]: The arrays of figures, by numerology system then by figure.
+            The Chaldean figures made of a compound and a single number are split in two arrays,
+            `<figure>_compound` and `<figure>` (the single number).
+    """
+    require_numpy()
+    if months is None and days is None:
+        years, months, days = split_dates(years)
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+    if not (years.shape == months.shape == days.shape):
+        raise ValueError("The years, months and days arrays must have the same shape.")
+    if (years < 1).any() or (months < 1).any() or (months > 12).any() or (days < 1).any() or (days > 31).any():
+        raise ValueError("The years, months and days arrays contain invalid values.")
+
+    digits = ruleset.digits_single
+    day_num = reduce_array(digits, days)
+    month_num = reduce_array(digits, months)
+    year_num = reduce_array(digits, years)
+    life_path_sum = day_num + month_num + year_num
+    life_path_number = reduce_array(digits, life_path_sum)
+
+    return {
+        "pythagorean": {
+            "life_path_number": life_path_number,
+            "life_path_number_alternative": reduce_array(digits, days + months + years),
+            "birthdate_day_num": day_num,
+            "birthdate_month_num": month_num,
+            "birthdate_year_num": year_num,
+            "birthdate_year_num_alternative": reduce_array(digits, years % 100),
+            "attitude_number": reduce_array(digits, day_num + month_num),
+            "karma_number": reduce_array(digits, days - 1),
+            "karmic_life_path_number": reduce_array(
+                ruleset.sum_karmic, digit_sums(days) + digit_sums(months) + digit_sums(years)
+            ),
+            "karmic_birthdate_day_num": reduce_array(ruleset.digits_karmic, days),
+        },
+        "chaldean": {
+            "life_path_number_compound": life_path_sum,
+            "life_path_number": life_path_number,
+            "birthdate_day_num_compound": days,
+            "birthdate_day_num": day_num,
+            "birthdate_year_num_alternative": reduce_array(ruleset.digits_compound, years),
+        },
+        "vedic": {
+            "destiny_number": life_path_number,
+            "psychic_number": day_num,
+        },
+    }
+
+
+# Matrices of the numbers of the 26 letters, of the vowels and of the consonants, by LetterValues id.
+_letter_matrices: Dict[int, Tuple[LetterValues, "np.ndarray"]] = {}
+
+
+def letter_matrix(letter_values: LetterValues) -> "np.ndarray":
+    """Returns the numbers of the letters, of the vowels and of the consonants as the 3 columns of a 26 rows matrix."""
+    matrix = _letter_matrices.get(id(letter_values))
+    if matrix is None or matrix[0] is not letter_values:
+        columns = (letter_values.numbers, letter_values.vowel_numbers, letter_values.consonant_numbers)
+        matrix = _letter_matrices[id(letter_values)] = (letter_values, np.array(columns, np.int64).T)
+    return matrix[1]
+
+
+# Names are cleaned many at once, separated by NUL characters, which the letter filter keeps.
+NAME_SEPARATOR = "\0"
+_names_filter = LetterFilter(LETTERS_ALPHABET)
+_names_filter[ord(NAME_SEPARATOR)] = NAME_SEPARATOR
+
+
+def count_letters(names: Sequence[str]) -> "np.ndarray":
+    """Returns the occurrences of the 26 letters in every cleaned name, one row a name.
+
+    The names are cleaned at once as one string, then counted by NumPy as `LetterValues.letter_counts` does,
+    without going through the name cache of the charts, which names seen once would only fill with misses.
+
+    Example: ['Zoë', 'Al'] will give [[0, 0, 0, 0, 1, ...], [1, 0, ...]]."""
+    joined = NAME_SEPARATOR.join(names)
+    if joined.count(NAME_SEPARATOR) != max(len(names) - 1, 0):
+        joined = NAME_SEPARATOR.join(name.replace(NAME_SEPARATOR, "") for name in names)
+    if not joined.isascii():
+        joined = unicodedata.normalize("NFD", joined)
+    cleaned = np.frombuffer(joined.translate(_names_filter).encode("ascii"), np.uint8)
+    is_separator = cleaned == ord(NAME_SEPARATOR)
+    # Row of every letter, and its index in LETTERS
+    rows = np.cumsum(is_separator)[~is_separator]
+    letters = cleaned[~is_separator].astype(np.int64) - ord("a")
+    counts = np.bincount(rows * len(LETTERS) + letters, minlength=len(names) * len(LETTERS))
+    return counts.reshape(len(names), len(LETTERS))
+
+
+def letter_sums(counts: "np.ndarray", letter_values: LetterValues) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Returns the sums of the numbers of the letters, of the vowels and of the consonants from the letter counts."""
+    sums = counts @ letter_matrix(letter_values)
+    return sums[:, 0], sums[:, 1], sums[:, 2]
+
+
+def name_figures(
+    first_names: Iterable[str], last_names: Iterable[str], ruleset: Ruleset = DEFAULT_RULESET
+) -> Dict[str, Dict[str, "np.ndarray"]]:
+    """Computes the name figures of the Pythagorean, Chaldean and Vedic numerology for lists of names.
+
+    Args:
+        first_names (Iterable[str]): First names, as supplied by the users.
+        last_names (Iterable[str]): Last names, as supplied by the users.
+        ruleset (Ruleset, optional): Rules of the reductions. Defaults to DEFAULT_RULESET.
+
+    Returns:
+        Dict[str, Dict[str, np.ndarray]]: The arrays of figures, by numerology system then by figure.
+            `names_are_valid` tells which rows have at least one valid letter in both names, the figures of the other rows are meaningless.
+            The Chaldean figures made of a compound and a single number are split in two arrays,
+            `<figure>_compound` and `<figure>` (the single number).
+    """
+    require_numpy()
+    first_names = count_letters(list(first_names))
+    last_names = count_letters(list(last_names))
+    if len(first_names) != len(last_names):
+        raise ValueError("There must be as many first names as last names.")
+    names_are_valid = first_names.any(axis=1) & last_names.any(axis=1)
+
+    figures = {}
+    for system, letter_values in (
+        ("pythagorean", Numerology.letter_values),
+        ("chaldean", CNumerology.letter_values),
+        ("vedic", VNumerology.letter_values),
+    ):
+        first_name_sum, first_name_vowels, first_name_consonants = letter_sums(first_names, letter_values)
+        last_name_sum, last_name_vowels, last_name_consonants = letter_sums(last_names, letter_values)
+        active_number = reduce_array(ruleset.sum_single, first_name_sum)
+        legacy_number = reduce_array(ruleset.sum_single, last_name_sum)
+        name_sum = active_number + legacy_number
+        destiny_number = reduce_array(ruleset.sum_master, name_sum)
+        if system == "pythagorean":
+            figures[system] = {
+                "names_are_valid": names_are_valid,
+                "hearts_desire_number": reduce_array(ruleset.sum_master, first_name_vowels + last_name_vowels),
+                "personality_number": reduce_array(ruleset.sum_master, first_name_consonants + last_name_consonants),
+                "destiny_number": destiny_number,
+                "expression_number": destiny_number,
+                "active_number": active_number,
+                "legacy_number": legacy_number,
+            }
+        elif system == "chaldean":
+            figures[system] = {
+                "names_are_valid": names_are_valid,
+                "name_number_compound": name_sum,
+                "name_number": destiny_number,
+                "active_number_compound": reduce_array(ruleset.sum_compound, first_name_sum),
+                "active_number": active_number,
+            }
+        else:
+            figures[system] = {
+                "names_are_valid": names_are_valid,
+                "name_number": destiny_number,
+            }
+    return figures
@@ -27,17 +27,17 @@ except Exception:
     language = gettext.translation(
         "numerology", localedir=localedir_path, languages=[default_lang]
     )
-language.install()
 _ = language.gettext
 
 
 class Interpretations(pInterpretations.Interpretations):
 
-    key_figures: Dict = {}
-    _meanings: Dict = {}
+    key_figures: Dict
+    _meanings: Dict
 
     def __init__(self, key_figures: Dict):
         self.key_figures = key_figures
+        self._meanings = {}
         self.get_all_interpretations()
 
     def get_all_interpretations(self):
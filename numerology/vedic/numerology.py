@@ -1,10 +1,13 @@
 import os
 import locale
 import gettext
+from typing import Iterable, Optional
 from numerology.pythagorean import *
 import pythagorean.numerology as pNumerology
 
-from pythagorean.common import Functions as fct
+from pythagorean.dates import DateParser
+from pythagorean.letters import LetterValues
+from pythagorean.ruleset import Ruleset
 from vedic.interpretations import Interpretations as VInterpretations
 
 localedir_path = os.path.join(
@@ -27,7 +30,6 @@ except Exception:
     language = gettext.translation(
         "numerology", localedir=localedir_path, languages=[default_lang]
     )
-language.install()
 _ = language.gettext
 
 class VNumerology(pNumerology.Numerology):
@@ -95,72 +97,98 @@ class VNumerology(pNumerology.Numerology):
         "z",
     )
 
-    def __init__(self, first_name: str, last_name: str, birthdate: str, verbose: bool = True):
-        super().__init__(first_name, last_name, birthdate, False)
-        self.verbose = verbose
-        if self.names_are_valid:
-            self._interpretations = VInterpretations(key_figures=self.key_figures)
-        if self.verbose and self.names_are_valid:
-            print(_("KEY FIGURES:"))
-            fct.print_beautiful_dict(dictionary=self.key_figures)
-            print(_("INTERPRETATIONS:"))
-            fct.print_beautiful_dict(dictionary=self.interpretations)
-
-    def set_key_figures(self):
-        """Initializes the key figures dictionary."""
-        self._key_figures["name_number"] = self.name_number
-        self._key_figures["destiny_number"] = self.destiny_number
-        self._key_figures["psychic_number"] = self.psychic_number
-        self._key_figures["life_path_number"] = None
-        self._key_figures["life_path_number_alternative"] = None
-        self._key_figures["attitude_number"] = None
-        self._key_figures["karma_number"] = None
-        self._key_figures["karmic_debt_numbers"] = None
-        self._key_figures["power_number"] = None
-        self._key_figures["power_number_alternative"] = None
-        self._key_figures["expression_number"] = None
-        self._key_figures["birthdate_year_num_alternative"] = None
-
-    @property
-    def name_number(self) -> tuple:
-        """Returns the Name Number.
-
-        This number is arrived at by adding the numerological value of each letter in a name and reducing the total
-        into a single compound number. As you can see below, each letter in the alphabet has been assigned a value
-        between 1 and 8 based upon Vedic mathematics and the pattern of numbers present in the Vedic Square.
-        Number 9 is not considered in such calculations because adding 9 to any other number does not alter its value
-        (for example, 9 + 1 = 10 = 1, 9 + 2 = 11 = 2).
-
-        Returns:
-            int: Name Number.
-        """
-        return super(VNumerology, self).destiny_number
-
-    @property
-    def destiny_number(self) -> tuple:
-        """Returns the Destiny Number.
-
-        This number in Vedic Numerology will reveal what the world think of you. It is the characteristics that other
-        people find within you. The destiny number is obtained by adding the date, month and year of your birth
-        and then converting that into a single digit whole number.
-
-        Returns:
-            int: Destiny Number.
-        """
-        return super(VNumerology, self).life_path_number
-
-    @property
-    def psychic_number(self) -> tuple:
-        """Returns the Psychic Number.
-
-        The psychic number in Vedic Numerology tells the way you look at yourself. It defines your basic characteristics.
-        It reveals what you want to be or about the talents with which you have come to this earth.
-
-        To obtain your psychic number you will have to find the single whole number of the date of your birth.
-        Only the date is considered and you have to make it in a single one if it is two digit number.
-        If your date of birth is 15th of any month your psychic number is 1+5=6
-
-        Returns:
-            int: Psychic Number.
-        """
-        return super(VNumerology, self).birthdate_day_num
\ No newline at end of file
+    letter_values = LetterValues(alphabet, vowels, consonants)
+
+    system = "vedic"
+    interpretations_class = VInterpretations
+
+    # The Vedic name number is the Pythagorean destiny number, the Vedic destiny number is the life path number
+    figure_specs = pNumerology.Numerology.figure_specs.extend(
+        [
+            pNumerology.Numerology.figure_specs.specs["destiny_number"].renamed(
+                "name_number",
+                """Returns the Name Number.
+
+                This number is arrived at by adding the numerological value of each letter in a name and reducing the total
+                into a single compound number. As you can see below, each letter in the alphabet has been assigned a value
+                between 1 and 8 based upon Vedic mathematics and the pattern of numbers present in the Vedic Square.
+                Number 9 is not considered in such calculations because adding 9 to any other number does not alter its value
+                (for example, 9 + 1 = 10 = 1, 9 + 2 = 11 = 2).
+
+                Returns:
+                    int: Name Number.
+                """,
+            ),
+            pNumerology.Numerology.figure_specs.specs["life_path_number"].renamed(
+                "destiny_number",
+                """Returns the Destiny Number.
+
+                This number in Vedic Numerology will reveal what the world think of you. It is the characteristics that other
+                people find within you. The destiny number is obtained by adding the date, month and year of your birth
+                and then converting that into a single digit whole number.
+
+                Returns:
+                    int: Destiny Number.
+                """,
+            ),
+            pNumerology.Numerology.figure_specs.specs["birthdate_day_num"].renamed(
+                "psychic_number",
+                """Returns the Psychic Number.
+
+                The psychic number in Vedic Numerology tells the way you look at yourself. It defines your basic characteristics.
+                It reveals what you want to be or about the talents with which you have come to this earth.
+
+                To obtain your psychic number you will have to find the single whole number of the date of your birth.
+                Only the date is considered and you have to make it in a single one if it is two digit number.
+                If your date of birth is 15th of any month your psychic number is 1+5=6
+
+                Returns:
+                    int: Psychic Number.
+                """,
+            ),
+        ]
+    )
+
+    figure_graph = pNumerology.Numerology.figure_graph.extend(
+        key_figures=(
+            "first_name",
+            "last_name",
+            "birthdate",
+            "name_number",
+            "destiny_number",
+            "psychic_number",
+            "life_path_number",
+            "life_path_number_alternative",
+            "attitude_number",
+            "karma_number",
+            "karmic_debt_numbers",
+            "power_number",
+            "power_number_alternative",
+            "expression_number",
+            "birthdate_year_num_alternative",
+        ),
+        dependencies=figure_specs.dependencies(),
+        empty_figures=(
+            "life_path_number",
+            "life_path_number_alternative",
+            "attitude_number",
+            "karma_number",
+            "karmic_debt_numbers",
+            "power_number",
+            "power_number_alternative",
+            "expression_number",
+            "birthdate_year_num_alternative",
+        ),
+    )
+
+    def __init__(
+        self,
+        first_name: str,
+        last_name: str,
+        birthdate: str,
+        verbose: bool = True,
+        ruleset: Optional[Ruleset] = None,
+        date_parser: Optional[DateParser] = None,
+        figures: Optional[Iterable[str]] = None,
+    ):
+        super().__init__(first_name, last_name, birthdate, verbose, ruleset, date_parser, figures)
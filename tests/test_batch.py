@@ -0,0 +1,100 @@
+import os
+import sys
+import unittest
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import Ruleset, compute, compute_many
+from numerology.batch import PackedResult, compute_parallel, decode_chunk, encode_chunk
+from numerology.packing import ChartPacker
+from numerology.pythagorean.diagnostics import ROW_ERROR
+
+ROWS = [
+    ("Barack", "Obama", "1961-08-04"),
+    ("Jean-Pierre", "Boisrond", "1958-12-15"),
+    ("Marie-Thérèse", "d'Alembert", None),
+    ("Ann", "Lee"),
+    ("Ann", "Lee", "1999-29-01"),
+    ("!!", "Obama", "1961-08-04"),
+    ("Mary\tAnn", "O'Neil\n", "1978-02-03"),
+]
+
+
+def figures_of(chart):
+    return {
+        name: value for name, value in chart.key_figures.items() if name not in ("first_name", "last_name", "birthdate")
+    }
+
+
+class EncodingTestCase(unittest.TestCase):
+    def test_round_trip(self):
+        buffer, errors = encode_chunk(ROWS[:5])
+        self.assertEqual({}, errors)
+        self.assertEqual([list(row) if row[-1] else list(row[:2]) for row in ROWS[:5]], decode_chunk(buffer))
+        self.assertEqual([["Ann", "Lee", ""]], decode_chunk(encode_chunk([("Ann", "Lee", "")])[0]))
+
+    def test_separators_in_fields(self):
+        buffer, _ = encode_chunk(ROWS[-1:])
+        self.assertEqual([["Mary Ann", "O'Neil ", "1978-02-03"]], decode_chunk(buffer))
+
+    def test_rows_which_cannot_be_encoded(self):
+        buffer, errors = encode_chunk([("Ann",), ("Ann", 1), ("Ann", "Lee")])
+        self.assertEqual([[""], [""], ["Ann", "Lee"]], decode_chunk(buffer))
+        self.assertEqual([0, 1], list(errors))
+        self.assertEqual(ROW_ERROR, errors[1][0].code)
+
+
+class ComputeParallelTestCase(unittest.TestCase):
+    def test_same_charts_as_compute_many(self):
+        for system in ("pythagorean", "chaldean", "vedic"):
+            with self.subTest(system=system):
+                packer = ChartPacker()
+                results = list(compute_parallel(ROWS * 3, system=system, workers=2, chunk_size=4))
+                self.assertEqual(list(range(len(ROWS) * 3)), [result.index for result in results])
+                for expected, result in zip(compute_many(ROWS * 3, system=system), results):
+                    self.assertEqual(expected.diagnostics, result.diagnostics)
+                    if expected.chart is None:
+                        self.assertIsNone(result.words)
+                    else:
+                        self.assertEqual(figures_of(expected.chart), packer.unpack(system, result.words))
+
+    def test_unordered(self):
+        ordered = list(compute_parallel(ROWS * 5, workers=2, chunk_size=3))
+        unordered = list(compute_parallel(ROWS * 5, workers=2, chunk_size=3, ordered=False))
+        self.assertEqual(ordered, sorted(unordered))
+
+    def test_ruleset(self):
+        ruleset = Ruleset(master_numbers=(11, 22))
+        (result,) = compute_parallel([ROWS[0]], workers=1, ruleset=ruleset)
+        chart = compute(*ROWS[0], ruleset=ruleset).chart
+        self.assertEqual(figures_of(chart), ChartPacker(ruleset).unpack("pythagorean", result.words))
+
+    def test_row_errors(self):
+        results = list(compute_parallel([("Ann",), ("A" * 16, "Lee"), ("Ann", "Lee")], workers=1))
+        self.assertIsNone(results[0].words)
+        self.assertEqual(ROW_ERROR, results[0].diagnostics[-1].code)
+        # 16 letters of the same number are packed since the counts take 7 bits
+        self.assertEqual(PackedResult(1, ChartPacker().pack(compute("A" * 16, "Lee").chart), ()), results[1])
+        self.assertEqual(PackedResult(2, ChartPacker().pack(compute("Ann", "Lee").chart), ()), results[2])
+
+    def test_charts_not_packed_exactly(self):
+        packer = ChartPacker()
+        rows = [("A" * 200, "Lee", "1999-01-29"), ("Ann", "Lee")]
+        results = list(compute_parallel(rows, workers=1))
+        self.assertFalse(packer.is_exact("pythagorean", results[0].words))
+        self.assertEqual((), results[0].diagnostics)
+        for row, result in zip(rows, results):
+            with self.subTest(row=row):
+                self.assertEqual(figures_of(compute(*row).chart), result.unpack(packer, "pythagorean"))
+        self.assertEqual(200, results[0].key_figures["full_name_numbers"][1])
+        self.assertIsNone(results[1].key_figures)
+
+    def test_invalid_arguments(self):
+        for kwargs in ({"system": "mayan"}, {"workers": 0}, {"chunk_size": 0}):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                compute_parallel([], **kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
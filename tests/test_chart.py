@@ -0,0 +1,54 @@
+import os
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import Chaldean, Pythagorean, Vedic
+
+
+class ChartTestCase(unittest.TestCase):
+    def test_chart_is_immutable(self):
+        chart = Pythagorean("Barack", "Obama", "1961-08-04", verbose=False).chart
+        self.assertEqual("pythagorean", chart.system)
+        self.assertEqual((2,), chart.key_figures["life_path_number"])
+        with self.assertRaises(AttributeError):
+            chart.system = "chaldean"
+        with self.assertRaises(TypeError):
+            chart.key_figures["life_path_number"] = (3,)
+        with self.assertRaises(AttributeError):
+            chart.other = None
+
+    def test_charts_do_not_share_figures(self):
+        pythagorean = Pythagorean("Barack", "Obama", "1961-08-04", verbose=False)
+        chaldean = Chaldean("Jean-Pierre", "Boisrond", "1958-12-15", verbose=False)
+        vedic = Vedic("Jean-Pierre", "Boisrond", "1958-12-15", verbose=False)
+        self.assertEqual("Barack", pythagorean.key_figures["first_name"])
+        self.assertEqual("Jean-Pierre", chaldean.key_figures["first_name"])
+        self.assertNotIn("hearts_desire_number", chaldean.key_figures)
+        self.assertNotIn("active_number", vedic.key_figures)
+        self.assertEqual("Barack", pythagorean.interpretations["first_name"])
+        self.assertEqual(pythagorean.key_figures, dict(pythagorean.chart.key_figures))
+        self.assertEqual(chaldean.interpretations, dict(chaldean.chart.interpretations))
+
+    def test_invalid_names_give_no_chart(self):
+        self.assertIsNone(Pythagorean("!!", "Obama", "1961-08-04", verbose=False).chart)
+
+    def test_concurrent_charts(self):
+        people = [("Barack", "Obama", "1961-08-04"), ("Jean-Pierre", "Boisrond", "1958-12-15")] * 50
+        systems = (Pythagorean, Chaldean, Vedic)
+        expected = {(cls, person): cls(*person, verbose=False).chart for cls in systems for person in people[:2]}
+
+        def build(job):
+            cls, person = job
+            return job, cls(*person, verbose=False).chart
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for job, chart in executor.map(build, [(cls, person) for person in people for cls in systems]):
+                self.assertEqual(expected[job], chart)
+
+
+if __name__ == "__main__":
+    unittest.main()
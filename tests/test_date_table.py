@@ -0,0 +1,90 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import Chaldean, DateFigureTable, Pythagorean, Ruleset, Vedic
+from numerology import compute, compute_all_systems, compute_many
+
+
+class DateFigureTableTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.table = DateFigureTable.build(first_year=1956, last_year=1960)
+
+    def tearDown(self):
+        Pythagorean.date_table = None
+
+    def test_range(self):
+        self.assertEqual("1956-01-01", self.table.first_date.isoformat())
+        self.assertEqual("1960-12-31", self.table.last_date.isoformat())
+        self.assertIsNone(self.table.lookup(1961, 1, 1))
+
+    def test_matches_charts(self):
+        self.assertEqual([], self.table.verify(step=7))
+
+    def test_write_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "dates.bin")
+            self.table.write(path)
+            table = DateFigureTable.load(path)
+            self.assertEqual(self.table.count, table.count)
+            self.assertEqual(self.table.lookup(1958, 12, 15), table.lookup(1958, 12, 15))
+            self.assertEqual(5, table.lookup(1958, 12, 15).life_path_number)
+            del table
+
+    def test_charts_read_the_table(self):
+        expected = [
+            dict(cls("Jean-Pierre", "Boisrond", "1958-12-15", verbose=False).key_figures)
+            for cls in (Pythagorean, Chaldean, Vedic)
+        ]
+        Pythagorean.date_table = self.table
+        num = Pythagorean("Jean-Pierre", "Boisrond", "1958-12-15", verbose=False)
+        self.assertIsNotNone(num.date_record)
+        self.assertEqual(
+            expected,
+            [
+                dict(cls("Jean-Pierre", "Boisrond", "1958-12-15", verbose=False).key_figures)
+                for cls in (Pythagorean, Chaldean, Vedic)
+            ],
+        )
+
+    def wrong_table(self) -> DateFigureTable:
+        """Returns a table in which every figure of every date is 7."""
+        table = self.table
+        return DateFigureTable(bytes([7]) * len(table.records), table.first_ordinal, table.count, table.fingerprint)
+
+    def test_figures_are_read_from_the_table(self):
+        Pythagorean.date_table = self.wrong_table()
+        person = ("Jean-Pierre", "Boisrond", "1958-12-15")
+        self.assertEqual((7,), Pythagorean(*person, verbose=False).key_figures["life_path_number"])
+        self.assertEqual((7,), Pythagorean(*person, verbose=False).life_path_number)
+        self.assertEqual(7, compute(*person).chart.key_figures["attitude_number"])
+        self.assertEqual((7,), next(compute_many([person], "vedic")).chart.key_figures["destiny_number"])
+        self.assertEqual((7,), compute(*person, system="chaldean").chart.key_figures["life_path_number"])
+        self.assertEqual((7,), compute_all_systems(*person)["vedic"].chart.key_figures["psychic_number"])
+        # Dates out of the table are computed
+        self.assertEqual((2,), compute("Barack", "Obama", "1961-08-04").chart.key_figures["life_path_number"])
+
+    def test_compute_all_systems_shares_the_date_figures(self):
+        person = ("Jean-Pierre", "Boisrond", "1958-12-15")
+        results = compute_all_systems(*person)
+        for cls in (Pythagorean, Chaldean, Vedic):
+            self.assertEqual(cls(*person, verbose=False).key_figures, results[cls.system].chart.key_figures)
+        with mock.patch.object(DateFigureTable, "date_figures", return_value=(7,) * DateFigureTable.RECORD_SIZE):
+            results = compute_all_systems(*person)
+        self.assertEqual((7,), results["pythagorean"].chart.key_figures["life_path_number"])
+        self.assertEqual((7,), results["chaldean"].chart.key_figures["life_path_number"])
+
+    def test_table_is_ignored_with_other_rules(self):
+        Pythagorean.date_table = self.table
+        num = Pythagorean("Jean-Pierre", "Boisrond", "1958-12-15", verbose=False, ruleset=Ruleset(karmic_bound=18))
+        self.assertIsNone(num.date_record)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import sys
+import unittest
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import DateParser, Pythagorean
+
+
+class DateParserTestCase(unittest.TestCase):
+    def setUp(self):
+        self.parser = DateParser(formats=("YYYY-MM-DD", "DD/MM/YYYY", "YYYYMMDD"))
+
+    def test_formats(self):
+        for date_supplied in ("1958-12-15", "15/12/1958", "19581215"):
+            with self.subTest(date_supplied=date_supplied):
+                self.assertEqual(((1958, 12, 15), None), self.parser.parse(date_supplied))
+
+    def test_invalid_format(self):
+        birthdate, error = self.parser.parse("1958-12-15T00:00")
+        self.assertIsNone(birthdate)
+        self.assertEqual("format", error.code)
+
+    def test_out_of_range_values(self):
+        self.assertEqual("month", self.parser.parse("1958-13-15")[1].code)
+        self.assertEqual("day", self.parser.parse("1958-02-29")[1].code)
+        self.assertEqual("year", self.parser.parse("0000-01-01")[1].code)
+        self.assertEqual(((2000, 2, 29), None), self.parser.parse("2000-02-29"))
+
+    def test_default_parser_only_accepts_iso_dates(self):
+        num = Pythagorean("Jean-Pierre", "Boisrond", "15/12/1958", verbose=False)
+        self.assertFalse(num.birthdate_is_valid)
+        self.assertEqual("format", num.birthdate_error.code)
+
+    def test_chart_with_parser(self):
+        num = Pythagorean("Jean-Pierre", "Boisrond", "15/12/1958", verbose=False, date_parser=self.parser)
+        self.assertEqual((1958, 12, 15), num.birthdate_parsed)
+        self.assertEqual((5,), num.key_figures["life_path_number"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import os
+import sys
+import unittest
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import compute_many
+from numerology.batch import compute_parallel
+from numerology.dedup import DedupStats, DistinctCounter, RowDeduplicator
+from numerology.pythagorean.dates import ISO_DATE_PARSER
+
+ROWS = [
+    ("Barack", "Obama", "1961-08-04"),
+    ("BARACK ", "obama", "1961-08-04"),
+    ("Barack", "Obama", "1961-08-04"),
+    ("Barack", "Obama", "1961-08-05"),
+    ("Zoë", "Saldaña", "1978-06-19"),
+    ("Zoe", "Saldana", "1978-06-19"),
+    ("Zoe", "Saldana", "1978-13-19"),
+    ("Zoe", "Saldana", "1978-13-19"),
+    ("Zoe", "Saldana", ""),
+    ("Zoe", "Saldana"),
+    ("!!", "Obama", "1961-08-04"),
+    ("??", "Obama", "1961-08-04"),
+    ("Barack", 1),
+    None,
+]
+
+
+class RowDeduplicatorTestCase(unittest.TestCase):
+    def test_key(self):
+        deduplicator = RowDeduplicator()
+        self.assertEqual((("zoe", "saldana"), (1978, 6, 19)), deduplicator.key(ROWS[4], ISO_DATE_PARSER))
+        self.assertEqual((("zoe", "saldana"), "1978-13-19"), deduplicator.key(ROWS[6], ISO_DATE_PARSER))
+        self.assertEqual(deduplicator.key(ROWS[8], ISO_DATE_PARSER), deduplicator.key(ROWS[9], ISO_DATE_PARSER))
+        self.assertIsNone(deduplicator.key(ROWS[12], ISO_DATE_PARSER))
+
+    def test_same_results(self):
+        for system in ("pythagorean", "chaldean", "vedic"):
+            for figures in (None, ("life_path_number", "first_name")):
+                with self.subTest(system=system, figures=figures):
+                    deduplicator = RowDeduplicator()
+                    results = list(compute_many(ROWS, system, figures, chunk_size=5, deduplicator=deduplicator))
+                    self.assertEqual(list(compute_many(ROWS, system, figures)), results)
+                    self.assertEqual("BARACK ", results[1].chart.key_figures.get("first_name", "BARACK "))
+
+    def test_stats(self):
+        deduplicator = RowDeduplicator()
+        list(compute_many(ROWS, deduplicator=deduplicator))
+        stats = deduplicator.stats()
+        self.assertEqual(DedupStats(rows=14, computed=8, names=3, dates=5), stats)
+        self.assertAlmostEqual(14 / 8, stats.ratio)
+        self.assertAlmostEqual(14 / 3, stats.name_ratio)
+        self.assertAlmostEqual(14 / 5, stats.date_ratio)
+
+        list(compute_many(ROWS[:6], deduplicator=deduplicator))
+        self.assertEqual(8, deduplicator.stats().computed)
+        list(compute_many(ROWS[:6], system="vedic", deduplicator=deduplicator))
+        self.assertEqual(11, deduplicator.stats().computed)
+
+        deduplicator.clear()
+        self.assertEqual(DedupStats(0, 0, 0, 0), deduplicator.stats())
+        self.assertEqual(1.0, deduplicator.stats().ratio)
+
+    def test_bounded_results(self):
+        deduplicator = RowDeduplicator(maxsize=2)
+        for chunk_size in (1, 5):
+            with self.subTest(chunk_size=chunk_size):
+                results = list(compute_many(ROWS * 3, chunk_size=chunk_size, deduplicator=deduplicator))
+                self.assertEqual(list(compute_many(ROWS * 3)), results)
+                self.assertLessEqual(len(deduplicator._results), 2)
+        # The results of the chunks in flight stay available while the cache is full
+        deduplicator = RowDeduplicator(maxsize=1)
+        results = list(compute_parallel(ROWS * 4, workers=2, chunk_size=3, deduplicator=deduplicator))
+        self.assertEqual(list(compute_parallel(ROWS * 4, workers=2, chunk_size=3)), results)
+
+    def test_compute_parallel(self):
+        deduplicator = RowDeduplicator()
+        results = list(compute_parallel(ROWS * 10, workers=1, chunk_size=10, deduplicator=deduplicator))
+        self.assertEqual(list(compute_parallel(ROWS * 10, workers=1, chunk_size=10)), results)
+        # The malformed rows are computed every time
+        self.assertLess(deduplicator.stats().computed, 2 * len(ROWS) + 2 * 10)
+
+
+class DistinctCounterTestCase(unittest.TestCase):
+    def test_exact(self):
+        counter = DistinctCounter(exact_limit=10)
+        for item in ("a", "b", "a", ("a", "b"), None):
+            counter.add(item)
+        self.assertEqual(4, len(counter))
+        counter.clear()
+        self.assertEqual(0, len(counter))
+
+    def test_estimate(self):
+        counter = DistinctCounter(exact_limit=100)
+        for number in range(50_000):
+            counter.add((f"name {number}", number % 12))
+            counter.add((f"name {number}", number % 12))
+        self.assertIsNone(counter._items)
+        self.assertEqual(1 << 14, len(counter._registers))
+        self.assertAlmostEqual(50_000, len(counter), delta=50_000 * 0.03)
+        with self.assertRaises(ValueError):
+            DistinctCounter(precision=20)
+
+
+if __name__ == "__main__":
+    unittest.main()
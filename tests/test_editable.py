@@ -0,0 +1,90 @@
+import os
+import sys
+import unittest
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import EditableChart, compute
+from numerology.pythagorean.diagnostics import INVALID_DATE, INVALID_NAME
+
+NAME_FIGURES = ("hearts_desire_number", "personality_number", "full_name_numbers", "full_name_missing_numbers")
+DATE_FIGURES = (
+    "life_path_number",
+    "life_path_number_alternative",
+    "birthdate_day_num",
+    "birthdate_month_num",
+    "birthdate_year_num",
+    "birthdate_year_num_alternative",
+    "attitude_number",
+    "karma_number",
+)
+
+
+class EditableChartTestCase(unittest.TestCase):
+    def assertSameChart(self, editable: EditableChart, system: str = "pythagorean"):
+        result = compute(editable.first_name, editable.last_name, editable.birthdate, system=system)
+        self.assertEqual(result.chart, editable.chart)
+        if result.chart is not None:
+            self.assertEqual(list(result.chart.key_figures), list(editable.key_figures))
+        self.assertEqual(result.diagnostics, editable.diagnostics)
+
+    def test_editing_the_last_name_keeps_the_birthdate_figures(self):
+        editable = EditableChart("Barack", "Obam", "1961-08-04")
+        key_figures, interpretations = editable.key_figures, editable.interpretations
+        editable.last_name = "Obama"
+        self.assertSameChart(editable)
+        for name in DATE_FIGURES:
+            self.assertNotIn(name, editable.updated_figures)
+            self.assertIs(key_figures[name], editable.key_figures[name])
+            self.assertIs(interpretations[name], editable.interpretations[name])
+        self.assertIn("personality_number", editable.updated_figures)
+        self.assertIn("power_number", editable.updated_figures)
+
+    def test_editing_the_birthdate_keeps_the_name_figures(self):
+        editable = EditableChart("Barack", "Obama", "1961-08-04")
+        key_figures, interpretations = editable.key_figures, editable.interpretations
+        editable.birthdate = "1962-01-02"
+        self.assertSameChart(editable)
+        for name in NAME_FIGURES:
+            self.assertNotIn(name, editable.updated_figures)
+            self.assertIs(key_figures[name], editable.key_figures[name])
+            self.assertIs(interpretations[name], editable.interpretations[name])
+        self.assertIn("life_path_number", editable.updated_figures)
+        self.assertIn("karmic_debt_numbers", editable.updated_figures)
+
+    def test_invalid_inputs(self):
+        editable = EditableChart("Barack", "Obama", "1961-08-04")
+        editable.birthdate = "1961-13-04"
+        self.assertSameChart(editable)
+        self.assertEqual([INVALID_DATE], [diagnostic.code for diagnostic in editable.diagnostics])
+        self.assertNotIn("life_path_number", editable.key_figures)
+        editable.first_name = "123"
+        self.assertIsNone(editable.chart)
+        self.assertIn(INVALID_NAME, [diagnostic.code for diagnostic in editable.diagnostics])
+        editable.update(first_name="Michelle", birthdate="1964-01-17")
+        self.assertSameChart(editable)
+        self.assertEqual(frozenset(), editable.update(last_name="Obama"))
+        with self.assertRaises(TypeError):
+            editable.update(middle_name="Hussein")
+
+    def test_systems(self):
+        for system in ("chaldean", "vedic"):
+            with self.subTest(system=system):
+                editable = EditableChart("Jean-Pierre", "Boisrond", "1958-12-15", system=system)
+                editable.last_name = "Obama"
+                self.assertSameChart(editable, system)
+                editable.birthdate = "1961-08-04"
+                self.assertSameChart(editable, system)
+                editable.birthdate = None
+                self.assertSameChart(editable, system)
+
+    def test_figures(self):
+        editable = EditableChart("Barack", "Obama", "1961-08-04", figures=("power_number",))
+        editable.birthdate = "1962-01-02"
+        expected = compute("Barack", "Obama", "1962-01-02", figures=("power_number",)).chart
+        self.assertEqual(expected, editable.chart)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import Chaldean, Pythagorean, Ruleset, Vedic, compute, compute_all_systems, compute_many
+from numerology.pythagorean.diagnostics import INVALID_DATE, INVALID_NAME, NO_VALID_CHARACTERS, ROW_ERROR, Diagnostic
+
+
+class ComputeAllSystemsTestCase(unittest.TestCase):
+    people = [
+        ("Barack", "Obama", "1961-08-04"),
+        ("Jean-Pierre", "Boisrond", "1958-12-15"),
+        ("Zoë", "Saldaña", "1978-06-19"),
+        ("Mary Ann", "O'Neil", None),
+        ("Mary Ann", "O'Neil", "1978-02-30"),
+    ]
+
+    def test_same_charts_as_each_system(self):
+        for ruleset in (None, Ruleset(master_numbers=(11, 22))):
+            for person in self.people:
+                with self.subTest(person=person, ruleset=ruleset):
+                    results = compute_all_systems(*person, ruleset=ruleset)
+                    self.assertEqual(["pythagorean", "chaldean", "vedic"], list(results))
+                    for system, cls in (("pythagorean", Pythagorean), ("chaldean", Chaldean), ("vedic", Vedic)):
+                        self.assertEqual(cls(*person, verbose=False, ruleset=ruleset).chart, results[system].chart)
+
+    def test_invalid_names(self):
+        results = compute_all_systems("!!", "Obama")
+        self.assertEqual([None, None, None], [result.chart for result in results.values()])
+        self.assertEqual(
+            [NO_VALID_CHARACTERS, INVALID_NAME], [diagnostic.code for diagnostic in results["vedic"].diagnostics]
+        )
+
+    def test_from_inputs(self):
+        inputs = Pythagorean("Barack", "Obama", "1961-08-04", verbose=False)
+        chaldean = Chaldean.from_inputs(inputs, figures=["name_number"])
+        self.assertEqual({"name_number": (8,)}, chaldean.key_figures)
+        self.assertIs(inputs.first_name_token, chaldean.first_name_token)
+        self.assertEqual(inputs.birthdate_parsed, chaldean.birthdate_parsed)
+
+
+class ComputeManyTestCase(unittest.TestCase):
+    rows = ComputeAllSystemsTestCase.people + [
+        ("!!", "Obama", "1961-08-04"),
+        ("Barack", "Obama"),
+        ("Barack", "Obama", "1961-13-04"),
+    ]
+
+    def test_same_results_as_compute(self):
+        for system in ("pythagorean", "chaldean", "vedic"):
+            for figures in (None, ("life_path_number", "destiny_number")):
+                with self.subTest(system=system, figures=figures):
+                    results = list(compute_many(self.rows, system=system, figures=figures, chunk_size=3))
+                    expected = [compute(*row, figures=figures, system=system) for row in self.rows]
+                    self.assertEqual(expected, results)
+
+    def test_row_errors(self):
+        rows = [("Barack", "Obama", "1961-08-04", "extra"), None, ("Barack", 42), ("Barack", "Obama", "1961-08-04")]
+        results = list(compute_many(rows))
+        self.assertEqual([None, None, None], [result.chart for result in results[:3]])
+        self.assertEqual([ROW_ERROR] * 3, [result.diagnostics[0].code for result in results[:3]])
+        self.assertEqual(compute("Barack", "Obama", "1961-08-04"), results[3])
+
+    def test_lazy(self):
+        read = []
+
+        def rows():
+            for row in self.rows:
+                read.append(row)
+                yield row
+
+        results = compute_many(rows(), chunk_size=2)
+        self.assertEqual([], read)
+        next(results)
+        self.assertEqual(2, len(read))
+        self.assertEqual(len(self.rows), 1 + len(list(results)))
+
+    def test_shared_interpretations(self):
+        first, second = compute_many([("Barack", "Obama", "1961-08-04"), ("Obama", "Barack", "1961-08-04")])
+        self.assertIs(
+            first.chart.interpretations["life_path_number"], second.chart.interpretations["life_path_number"]
+        )
+        with self.assertRaises(TypeError):
+            first.chart.interpretations["life_path_number"]["number"] = (1,)
+
+    def test_threads(self):
+        rows = [(row[0], last, *row[2:]) for row in self.rows for last in ("Obama", "Lee", "Saldaña")]
+        expected = list(compute_many(rows))
+        with ThreadPoolExecutor(4) as executor:
+            for system in ("pythagorean", "chaldean", "vedic"):
+                with self.subTest(system=system):
+                    runs = executor.map(lambda _: list(compute_many(rows, system=system)), range(8))
+                    self.assertEqual([list(compute_many(rows, system=system))] * 8, list(runs))
+        self.assertEqual(expected, list(compute_many(rows)))
+
+    def test_invalid_arguments(self):
+        for kwargs in ({"system": "mayan"}, {"figures": ("unknown_number",)}, {"chunk_size": 0}):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                compute_many([], **kwargs)
+
+
+
+class DiagnosticsTestCase(unittest.TestCase):
+    def test_nothing_printed(self):
+        with contextlib.redirect_stdout(io.StringIO()) as stdout, self.assertNoLogs(level="WARNING"):
+            results = [
+                compute("!!", "Obama", "1961-08-04"),
+                compute("Barack", "Obama", "1961-13-04"),
+                compute("Barack", "Obama", "04/08/1961", system="vedic"),
+            ]
+        self.assertEqual("", stdout.getvalue())
+        self.assertEqual(
+            [
+                (
+                    Diagnostic(NO_VALID_CHARACTERS, "first_name", "The string supplied contains no valid character."),
+                    Diagnostic(INVALID_NAME, "names", "Invalid names supplied."),
+                ),
+                (Diagnostic(INVALID_DATE, "birthdate", "month 13 is out of range"),),
+                (Diagnostic(INVALID_DATE, "birthdate", "Invalid date format. Expected: yyyy-mm-dd."),),
+            ],
+            [result.diagnostics for result in results],
+        )
+        self.assertIsNone(results[0].chart)
+        self.assertNotIn("life_path_number", results[1].chart.key_figures)
+
+    def test_valid_inputs(self):
+        result = compute("Barack", "Obama", "1961-08-04")
+        self.assertEqual((), result.diagnostics)
+
+    def test_constructors_still_print(self):
+        with contextlib.redirect_stdout(io.StringIO()) as stdout, self.assertLogs(level="WARNING"):
+            numerology = Pythagorean("!!", "Obama", "1961-08-04", verbose=False)
+        self.assertIn("The string supplied contains no valid character.", stdout.getvalue())
+        self.assertIn("Invalid names supplied.", stdout.getvalue())
+        self.assertEqual(INVALID_NAME, numerology.diagnostics[-1].code)
+
+
+if __name__ == "__main__":
+    unittest.main()
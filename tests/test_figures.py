@@ -0,0 +1,123 @@
+import os
+import sys
+import unittest
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import Chaldean, Pythagorean, Vedic, compute
+from numerology.pythagorean.figures import BIRTHDATE, NAMES, FigureGraph, figure
+
+
+class CountingPythagorean(Pythagorean):
+    destiny_number_calls = 0
+
+    @figure
+    def destiny_number(self) -> tuple:
+        CountingPythagorean.destiny_number_calls += 1
+        return super().destiny_number
+
+
+class FigureGraphTestCase(unittest.TestCase):
+    def test_resolve(self):
+        graph = Pythagorean.figure_graph
+        order = graph.resolve(["power_number"])
+        self.assertEqual({BIRTHDATE, NAMES, "life_path_number", "destiny_number", "power_number"}, set(order))
+        self.assertLess(order.index("destiny_number"), order.index("power_number"))
+        self.assertEqual(frozenset({BIRTHDATE}), graph.inputs(["life_path_number", "karma_number"]))
+        self.assertEqual(frozenset({BIRTHDATE, NAMES}), graph.inputs(["karmic_debt_numbers"]))
+
+    def test_dependents(self):
+        graph = Pythagorean.figure_graph
+        dependents = graph.dependents([NAMES])
+        self.assertIn("power_number", dependents)
+        self.assertIn("karmic_debt_numbers", dependents)
+        self.assertNotIn("life_path_number", dependents)
+        self.assertNotIn("name_number", dependents)
+        self.assertEqual(
+            frozenset({"expression_number", "power_number", "power_number_alternative"}),
+            graph.dependents(["destiny_number"]),
+        )
+
+    def test_invalid_graphs(self):
+        with self.assertRaises(ValueError):
+            FigureGraph(["a"], {"a": ("b",), "b": ("a",)})
+        with self.assertRaises(ValueError):
+            FigureGraph(["a"], {"a": ("c",)})
+        with self.assertRaises(ValueError):
+            FigureGraph(["a", "b"], {"a": ()})
+        with self.assertRaises(ValueError):
+            Pythagorean.figure_graph.resolve(["unknown_number"])
+
+    def test_every_key_figure_of_every_system(self):
+        for cls in (Pythagorean, Chaldean, Vedic):
+            with self.subTest(cls=cls.__name__):
+                chart = cls("Jean-Pierre", "Boisrond", "1958-12-15", verbose=False)
+                self.assertEqual(cls.figure_graph.key_figures, tuple(chart.key_figures))
+
+
+class FigureMemoTestCase(unittest.TestCase):
+    def setUp(self):
+        CountingPythagorean.destiny_number_calls = 0
+
+    def test_figures_computed_once(self):
+        numerology = CountingPythagorean("Barack", "Obama", "1961-08-04", verbose=False)
+        # destiny_number, expression_number, power_number and power_number_alternative share one computation
+        self.assertEqual(1, CountingPythagorean.destiny_number_calls)
+        self.assertEqual((5,), numerology.expression_number)
+        self.assertEqual((7,), numerology.power_number)
+        self.assertEqual(1, CountingPythagorean.destiny_number_calls)
+
+    def test_memo_forgotten_with_new_inputs(self):
+        numerology = CountingPythagorean("Barack", "Obama", "1961-08-04", verbose=False)
+        numerology.last_name_token = numerology.name_cache.get("Boisrond")
+        numerology.get_key_figures()
+        self.assertEqual(2, CountingPythagorean.destiny_number_calls)
+        expected = Pythagorean("Barack", "Boisrond", "1961-08-04", verbose=False).key_figures
+        self.assertEqual(expected["destiny_number"], numerology.key_figures["destiny_number"])
+
+    def test_overridden_figures(self):
+        vedic = Vedic("Barack", "Obama", "1961-08-04", verbose=False)
+        # The Vedic destiny number is the life path number, its name number is the Pythagorean destiny number
+        self.assertEqual((2,), vedic.destiny_number)
+        self.assertEqual((7,), vedic.name_number)
+        self.assertEqual((2,), vedic.destiny_number)
+
+
+class ComputeTestCase(unittest.TestCase):
+    def test_selected_figures(self):
+        figures = ("life_path_number", "destiny_number", "power_number")
+        chart = compute("Barack", "Obama", "1961-08-04", figures=figures).chart
+        self.assertEqual({"life_path_number": (2,), "destiny_number": (5,), "power_number": (7,)}, chart.key_figures)
+        full_chart = Pythagorean("Barack", "Obama", "1961-08-04", verbose=False).chart
+        for name, value in chart.key_figures.items():
+            self.assertEqual(full_chart.key_figures[name], value)
+
+    def test_only_needed_inputs(self):
+        numerology = Pythagorean("Barack", "Obama", "1961-08-04", verbose=False, figures=["life_path_number"])
+        self.assertEqual({"life_path_number": (2,)}, numerology.key_figures)
+        self.assertFalse(hasattr(numerology, "first_name_sum"))
+        numerology = Pythagorean("Barack", "Obama", "1961-08-04", verbose=False, figures=["active_number"])
+        self.assertFalse(hasattr(numerology, "birthdate_year"))
+
+    def test_other_systems(self):
+        chart = compute("Barack", "Obama", "1961-08-04", figures=["name_number"], system="chaldean").chart
+        self.assertEqual("chaldean", chart.system)
+        self.assertEqual((8,), chart.key_figures["name_number"])
+        figures = ["name_number", "destiny_number"]
+        chart = compute("Barack", "Obama", "1961-08-04", figures=figures, system="vedic").chart
+        self.assertEqual({"name_number": (7,), "destiny_number": (2,)}, chart.key_figures)
+
+    def test_birthdate_figures_without_birthdate(self):
+        chart = compute("Barack", "Obama", figures=["life_path_number", "active_number"]).chart
+        self.assertEqual({"active_number": (9,)}, chart.key_figures)
+
+    def test_unknown_figure_or_system(self):
+        with self.assertRaises(ValueError):
+            compute("Barack", "Obama", figures=["lucky_number"])
+        with self.assertRaises(ValueError):
+            compute("Barack", "Obama", system="egyptian")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import Ruleset, compute_many
+from numerology.incremental import ADDED, CHANGED, RERENDERED, UNCHANGED, IncrementalBatch, IncrementalReport
+from numerology.packing import ChartPacker
+
+ROWS = [
+    (1, "Barack", "Obama", "1961-08-04"),
+    (2, "Mary Ann", "O'Neil"),
+    (3, "Zoë", "Saldaña", "1978-06-19"),
+    (4, "!!", "Obama", "1961-08-04"),
+    (5, "Barack", "Obama", "1961-13-04"),
+    (6, "Barack", 1),
+    (7, "Jean-Pierre", "Boisrond", ""),
+]
+
+
+class IncrementalBatchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.manifest_path = os.path.join(self.directory.name, "charts.manifest")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_first_run(self):
+        for system in ("pythagorean", "chaldean", "vedic"):
+            with self.subTest(system=system):
+                batch = IncrementalBatch(self.manifest_path + system, system, chunk_size=3)
+                results = list(batch.run(ROWS))
+                self.assertEqual([row[0] for row in ROWS], [result.row_id for result in results])
+                self.assertEqual([ADDED] * len(ROWS), [result.status for result in results])
+                self.assertEqual(list(compute_many([row[1:] for row in ROWS], system)), [r.result for r in results])
+                self.assertEqual(IncrementalReport(len(ROWS), 0, 0, 0, 0), batch.report())
+
+    def test_unchanged_rows(self):
+        for system in ("pythagorean", "chaldean", "vedic"):
+            with self.subTest(system=system):
+                manifest_path = self.manifest_path + system
+                list(IncrementalBatch(manifest_path, system).run(ROWS))
+                batch = IncrementalBatch(manifest_path, system, chunk_size=2)
+                results = list(batch.run(ROWS))
+                self.assertEqual(list(compute_many([row[1:] for row in ROWS], system)), [r.result for r in results])
+                # The malformed row is computed again
+                self.assertEqual([UNCHANGED] * 5 + [CHANGED, UNCHANGED], [result.status for result in results])
+
+    def test_changed_rows(self):
+        list(IncrementalBatch(self.manifest_path).run(ROWS))
+        rows = [(1, "BARACK ", "obama", "1961-08-04"), (3, "Zoe", "Saldana", "1978-06-20"), (8, "Barack", "Obama")]
+        batch = IncrementalBatch(self.manifest_path)
+        results = list(batch.run(rows))
+        self.assertEqual([UNCHANGED, CHANGED, ADDED], [result.status for result in results])
+        self.assertEqual(list(compute_many([row[1:] for row in rows])), [result.result for result in results])
+        self.assertEqual("BARACK ", results[0].result.chart.key_figures["first_name"])
+        self.assertEqual(IncrementalReport(added=1, changed=1, unchanged=1, rerendered=0, removed=5), batch.report())
+
+        # The removed rows are added again
+        batch = IncrementalBatch(self.manifest_path)
+        self.assertEqual([ADDED, CHANGED], [result.status for result in batch.run(ROWS[1:3])])
+
+    def test_other_ruleset(self):
+        list(IncrementalBatch(self.manifest_path).run(ROWS))
+        batch = IncrementalBatch(self.manifest_path, ruleset=Ruleset(master_numbers=(11, 22)))
+        results = list(batch.run(ROWS))
+        self.assertEqual([CHANGED] * len(ROWS), [result.status for result in results])
+
+    def test_other_meanings(self):
+        list(IncrementalBatch(self.manifest_path).run(ROWS))
+        batch = IncrementalBatch(self.manifest_path)
+        batch.meanings_version = "other meanings"
+        results = list(batch.run(ROWS))
+        self.assertEqual([RERENDERED] * 5 + [CHANGED, RERENDERED], [result.status for result in results])
+        self.assertEqual(list(compute_many([row[1:] for row in ROWS])), [result.result for result in results])
+        # The manifest keeps the meanings of the last run
+        batch = IncrementalBatch(self.manifest_path)
+        batch.meanings_version = "other meanings"
+        self.assertEqual(UNCHANGED, next(iter(batch.run(ROWS))).status)
+
+    def test_saturated_counts(self):
+        rows = [("long", "A" * 200, "Lee", "1999-01-29"), (1, "Ann", "Lee")]
+        list(IncrementalBatch(self.manifest_path).run(rows))
+        batch = IncrementalBatch(self.manifest_path)
+        results = list(batch.run(rows))
+        self.assertEqual([UNCHANGED, UNCHANGED], [result.status for result in results])
+        self.assertEqual(list(compute_many([row[1:] for row in rows])), [result.result for result in results])
+
+    def test_long_names(self):
+        # Master numbers of 396 and 66033, the second one saturating its packed field
+        rows = [(1, "r" * 33, "r" * 11, "1990-01-01"), (2, "r" * 7337, "a", "1990-01-01"), (3, "a", "b", "1990-01-01")]
+        expected = list(compute_many([row[1:] for row in rows]))
+        self.assertEqual(396, expected[0].chart.key_figures["personality_number"])
+        self.assertEqual(expected, [result.result for result in IncrementalBatch(self.manifest_path).run(rows)])
+        results = list(IncrementalBatch(self.manifest_path).run(rows))
+        self.assertEqual([UNCHANGED] * 3, [result.status for result in results])
+        self.assertEqual(expected, [result.result for result in results])
+
+    def test_charts_not_packed(self):
+        rows = [(1, "Barack", "Obama", "1961-08-04"), (2, "Ann", "Lee")]
+        with mock.patch.object(ChartPacker, "pack", side_effect=ValueError("Not packed.")):
+            list(IncrementalBatch(self.manifest_path).run(rows))
+        results = list(IncrementalBatch(self.manifest_path).run(rows))
+        self.assertEqual([UNCHANGED] * 2, [result.status for result in results])
+        self.assertEqual(list(compute_many([row[1:] for row in rows])), [result.result for result in results])
+
+    def test_row_ids(self):
+        with self.assertRaises(TypeError):
+            list(IncrementalBatch(self.manifest_path).run([(("users", 1), "Ann", "Lee")]))
+        self.assertFalse(os.path.exists(self.manifest_path))
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            IncrementalBatch(self.manifest_path, chunk_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import gc
+import io
+import os
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import ChartInterner, Pythagorean, compute, compute_all_systems
+
+
+class ChartInternerTestCase(unittest.TestCase):
+    def test_identical_charts_are_shared(self):
+        interner = ChartInterner()
+        # Same figures, other names and birthdate
+        obama = interner.intern(compute("Barack", "Obama", "1961-08-04").chart)
+        other = interner.intern(compute("Barack", "Obama", "1961-08-13").chart)
+        self.assertIs(obama, other)
+        self.assertNotIn("first_name", obama.key_figures)
+        self.assertNotIn("birthdate", obama.interpretations)
+        self.assertEqual((2,), obama.key_figures["life_path_number"])
+        self.assertEqual((2, 1, 1), interner.stats()[:3])
+
+    def test_payloads_and_values_are_shared(self):
+        interner = ChartInterner()
+        obama = interner.intern(compute("Barack", "Obama", "1961-08-04").chart)
+        boisrond = interner.intern(compute("Barack", "Boisrond", "1961-08-04").chart)
+        self.assertIsNot(obama, boisrond)
+        self.assertIs(obama.interpretations["life_path_number"], boisrond.interpretations["life_path_number"])
+        self.assertIs(obama.key_figures["life_path_number"], boisrond.key_figures["life_path_number"])
+        self.assertIs(obama.key_figures["active_number"], boisrond.key_figures["active_number"])
+        with self.assertRaises(TypeError):
+            obama.interpretations["life_path_number"]["meaning"]["title"] = ""
+        with self.assertRaises(TypeError):
+            obama.key_figures["full_name_numbers"][1] = 0
+
+    def test_interpretations_shared_by_threads(self):
+        interpretation = Pythagorean.interpretations_class.cached_interpretation
+        with ThreadPoolExecutor(8) as executor:
+            shared = list(executor.map(lambda _: interpretation("karma_number", 3), range(64)))
+        self.assertTrue(all(value is shared[0] for value in shared))
+        self.assertIs(shared[0], interpretation("karma_number", 3))
+
+    def test_systems_are_not_mixed(self):
+        interner = ChartInterner()
+        charts = compute_all_systems("Barack", "Obama", "1961-08-04")
+        shared = {system: interner.intern(result.chart) for system, result in charts.items()}
+        self.assertEqual(3, interner.stats().resident_charts)
+        for system, chart in shared.items():
+            self.assertEqual(system, chart.system)
+            self.assertEqual(charts[system].chart.key_figures["name_number"], chart.key_figures["name_number"])
+
+    def test_resident_charts(self):
+        interner = ChartInterner()
+        chart = interner.intern(compute("Barack", "Obama", "1961-08-04").chart)
+        interner.intern(compute("Jean-Pierre", "Boisrond", "1958-12-15").chart)
+        gc.collect()
+        self.assertEqual(1, interner.stats().resident_charts)
+        self.assertIs(chart, interner.intern(compute("Barack", "Obama", "1961-08-04").chart))
+        interner.clear()
+        self.assertEqual((0, 0, 0, 0, 0), tuple(interner.stats()))
+
+    def test_print_shared_chart(self):
+        chart = ChartInterner().intern(compute("Barack", "Obama", "1961-08-04").chart)
+        with redirect_stdout(io.StringIO()) as output:
+            Pythagorean.print_chart(chart)
+        self.assertIn("Life Path Number", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
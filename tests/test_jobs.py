@@ -0,0 +1,111 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import DateParser, Ruleset
+from numerology.jobs import Checkpoint, JobReport, run_job
+
+LINES = [
+    "Barack,Obama,1961-08-04",
+    '"Mary Ann",O\'Neil',
+    "Zoë,Saldaña,1978-06-19",
+    "!!,Obama,1961-08-04",
+    "Barack,Obama,1961-13-04",
+    "",
+    "Jean-Pierre,Boisrond,1958-12-15,extra",
+] * 5
+
+
+class RunJobTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.directory.name, "people.csv")
+        with open(self.input_path, "w", encoding="utf-8", newline="") as file:
+            file.write("\r\n".join(LINES) + "\r\n")
+        self.output_path = os.path.join(self.directory.name, "charts.jsonl")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read_output(self, path=None):
+        with open(path or self.output_path, "rb") as file:
+            return file.read()
+
+    def test_output(self):
+        report = run_job(self.input_path, self.output_path, chunk_size=4, checkpoint_every=10)
+        self.assertEqual(JobReport(rows=len(LINES), resumed_rows=0, checkpoints=3), report)
+        lines = [json.loads(line) for line in self.read_output().decode("utf-8").splitlines()]
+        self.assertEqual(list(range(len(LINES))), [line["row"] for line in lines])
+        self.assertEqual([2], lines[0]["key_figures"]["life_path_number"])
+        self.assertNotIn("first_name", lines[0]["key_figures"])
+        self.assertIsNone(lines[3]["key_figures"])
+        self.assertEqual("invalid_date", lines[4]["diagnostics"][0][0])
+        self.assertEqual(["row_error", "row_error"], [lines[index]["diagnostics"][0][0] for index in (5, 6)])
+        checkpoint = Checkpoint.read(self.output_path + ".checkpoint")
+        self.assertEqual((os.path.getsize(self.input_path), len(self.read_output()), len(LINES)), checkpoint[:3])
+
+    def test_process_pool(self):
+        for system in ("pythagorean", "vedic"):
+            with self.subTest(system=system):
+                pool_path = os.path.join(self.directory.name, "pool.jsonl")
+                run_job(self.input_path, self.output_path, system, chunk_size=4)
+                run_job(self.input_path, pool_path, system, workers=2, chunk_size=4)
+                self.assertEqual(self.read_output(), self.read_output(pool_path))
+
+    def test_process_pool_long_names(self):
+        # The counts of a name with more than 126 letters of a number are not packed exactly
+        with open(self.input_path, "w", encoding="utf-8") as file:
+            file.write(f"{'A' * 200},Lee,1999-01-29\nMaria Fernanda Aparecida,Santos Sousa Costa Alves,1980-05-17\n")
+        pool_path = os.path.join(self.directory.name, "pool.jsonl")
+        run_job(self.input_path, self.output_path)
+        run_job(self.input_path, pool_path, workers=1)
+        self.assertEqual(self.read_output(), self.read_output(pool_path))
+        line = json.loads(self.read_output().splitlines()[0])
+        self.assertEqual(200, line["key_figures"]["full_name_numbers"]["1"])
+
+    def test_resume_after_crash(self):
+        run_job(self.input_path, self.output_path)
+        expected = self.read_output()
+        # State of a job stopped after 10 rows had been saved, and 3 more rows written
+        with open(self.input_path, "rb") as file:
+            input_offset = len(b"".join(file.readline() for _ in range(10)))
+        output_offset = len(b"".join(expected.splitlines(keepends=True)[:10]))
+        settings = Checkpoint.read(self.output_path + ".checkpoint").settings
+        Checkpoint(input_offset, output_offset, 10, settings).write(self.output_path + ".checkpoint")
+        with open(self.output_path, "r+b") as file:
+            file.truncate(len(b"".join(expected.splitlines(keepends=True)[:13])) - 5)
+
+        for workers in (0, 2):
+            with self.subTest(workers=workers):
+                report = run_job(self.input_path, self.output_path, workers=workers, chunk_size=3, resume=True)
+                self.assertEqual(JobReport(rows=len(LINES) - 10, resumed_rows=10, checkpoints=1), report)
+                self.assertEqual(expected, self.read_output())
+                Checkpoint(input_offset, output_offset, 10, settings).write(self.output_path + ".checkpoint")
+
+    def test_resume_finished_job(self):
+        run_job(self.input_path, self.output_path)
+        self.assertEqual(JobReport(0, len(LINES), 0), run_job(self.input_path, self.output_path, resume=True))
+
+    def test_resume_without_checkpoint(self):
+        with open(self.output_path, "wb") as file:
+            file.write(b"previous output\n")
+        self.assertEqual(JobReport(len(LINES), 0, 1), run_job(self.input_path, self.output_path, resume=True))
+        self.assertTrue(self.read_output().startswith(b'{"row":0,'))
+
+    def test_resume_with_other_settings(self):
+        run_job(self.input_path, self.output_path)
+        with self.assertRaises(ValueError):
+            run_job(self.input_path, self.output_path, system="vedic", resume=True)
+        with self.assertRaises(ValueError):
+            run_job(self.input_path, self.output_path, ruleset=Ruleset(master_numbers=(11, 22)), resume=True)
+        with self.assertRaises(ValueError):
+            run_job(self.input_path, self.output_path, date_parser=DateParser(("DD/MM/YYYY",)), resume=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
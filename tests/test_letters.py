@@ -0,0 +1,57 @@
+import os
+import sys
+import unittest
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import Pythagorean, fct
+from numerology.pythagorean.letters import LETTERS, LetterValues
+
+
+class LetterValuesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.letter_values = LetterValues(Pythagorean.alphabet, Pythagorean.vowels, Pythagorean.consonants)
+        self.counts = LetterValues.letter_counts("jeanpierreboisrond")
+
+    def test_letter_counts(self):
+        counts = LetterValues.letter_counts("abba")
+        self.assertEqual(26, len(counts))
+        self.assertEqual([2, 2, 0], counts[:3])
+
+    def test_totals(self):
+        name = "jeanpierreboisrond"
+        self.assertEqual(sum(Pythagorean.alphabet[letter] for letter in name), self.letter_values.total(self.counts))
+        self.assertEqual(
+            sum(Pythagorean.alphabet[letter] for letter in name if letter in Pythagorean.vowels),
+            self.letter_values.vowels_total(self.counts),
+        )
+        self.assertEqual(
+            sum(Pythagorean.alphabet[letter] for letter in name if letter in Pythagorean.consonants),
+            self.letter_values.consonants_total(self.counts),
+        )
+
+    def test_number_counts(self):
+        self.assertEqual((0, 3, 1, 0, 1, 5, 2, 1, 0, 5), self.letter_values.number_counts(self.counts))
+
+    def test_number_order(self):
+        self.assertEqual((1, 0), LetterValues.letter_order("baba"))
+        order = LetterValues.letter_order("jeanpierreboisrond")
+        self.assertEqual((1, 5, 1, 5, 7, 9, 9, 2, 6, 1, 4), tuple(Pythagorean.alphabet[LETTERS[index]] for index in order))
+        self.assertEqual((1, 5, 7, 9, 2, 6, 4), self.letter_values.number_order(order))
+        self.assertEqual((1, 5, 7, 9, 6, 2, 4, 3), LetterValues.add_orders((1, 5, 7, 9, 6, 2), (2, 4, 3, 1)))
+
+
+class KeepValidLettersTestCase(unittest.TestCase):
+    def test_ascii(self):
+        self.assertEqual("jeanpierre", fct.keep_valid_letters("Jean-Pierre", Pythagorean.alphabet))
+
+    def test_accents_are_removed(self):
+        self.assertEqual("nunezzoe", fct.keep_valid_letters("Ñúñez Zoë", Pythagorean.alphabet))
+
+    def test_no_valid_letter(self):
+        self.assertEqual("", fct.keep_valid_letters("1234 ☺", Pythagorean.alphabet))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import sys
+import unittest
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import Chaldean, NameCache, Pythagorean
+
+
+class NameCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cache = NameCache(maxsize=2)
+
+    def test_hits_and_misses(self):
+        token = self.cache.get("Zoë")
+        self.assertEqual("zoe", token.cleaned)
+        self.assertIs(token, self.cache.get("Zoë"))
+        info = self.cache.info()
+        self.assertEqual((1, 1, 2, 1), (info.hits, info.misses, info.maxsize, info.currsize))
+
+    def test_least_recently_used_name_is_evicted(self):
+        self.cache.warm(["Alice", "Bob"])
+        self.cache.get("Alice")
+        self.cache.get("Charlie")
+        self.cache.get("Alice")
+        self.cache.get("Bob")
+        # Bob was evicted by Charlie, Alice was not.
+        info = self.cache.info()
+        self.assertEqual((2, 4), (info.hits, info.misses))
+
+    def test_sums_per_system(self):
+        token = self.cache.get("Barack")
+        self.assertEqual(18, token.sums(Pythagorean.letter_values).total)
+        self.assertEqual(11, token.sums(Chaldean.letter_values).total)
+        self.assertIs(token.sums(Chaldean.letter_values), token.sums(Chaldean.letter_values))
+
+    def test_charts_share_the_cache(self):
+        cache = Pythagorean.name_cache
+        misses = cache.info().misses
+        Pythagorean("Jean-Pierre", "Boisrond", "1958-12-15", verbose=False)
+        Chaldean("Jean-Pierre", "Boisrond", "1958-12-15", verbose=False)
+        self.assertLessEqual(cache.info().misses - misses, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
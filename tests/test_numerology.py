@@ -1,5 +1,6 @@
 import os
 import sys
+from collections import Counter
 
 # # For relative imports to work in Python 3.6
 sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
@@ -57,6 +58,15 @@ class PythagoreanTestCase(unittest.TestCase):
             self.name1.key_figures["full_name_numbers"],
         )
 
+    def test_full_name_numbers_order(self):
+        # The numbers of the same count in order of first appearance in the full name, as Counter.most_common
+        for first_name, last_name in (("Jean-Pierre", "Boisrond"), ("Ann", "Lee"), ("Zoe", "Ba"), ("Barack", "Obama")):
+            with self.subTest(first_name=first_name, last_name=last_name):
+                full_name = (first_name + last_name).replace("-", "").lower()
+                expected = Counter(Pythagorean.alphabet[letter] for letter in full_name).most_common()
+                figures = Pythagorean(first_name, last_name, verbose=False).key_figures
+                self.assertEqual(expected, list(figures["full_name_numbers"].items()))
+
     def test_full_name_missing_numbers(self):
         self.assertEqual((3, 8), self.name1.key_figures["full_name_missing_numbers"])
 
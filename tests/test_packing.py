@@ -0,0 +1,126 @@
+import os
+import sys
+import unittest
+from array import array
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import Chaldean, Pythagorean, Ruleset, Vedic, compute, compute_all_systems
+from numerology.packing import ChartPacker, permutation_of_rank, permutation_rank
+
+PEOPLE = (
+    ("Barack", "Obama", "1961-08-04"),
+    ("Jean-Pierre", "Boisrond", "1958-12-15"),
+    ("Michel", "Colucci", "1944-10-28"),
+    ("Marie-Thérèse", "d'Alembert", None),
+    ("Ann", "Lee", "1999-29-01"),
+)
+
+
+def figures_of(chart):
+    return {
+        name: value for name, value in chart.key_figures.items() if name not in ("first_name", "last_name", "birthdate")
+    }
+
+
+class ChartPackerTestCase(unittest.TestCase):
+    def test_round_trip(self):
+        packer = ChartPacker()
+        for person in PEOPLE:
+            for system, result in compute_all_systems(*person).items():
+                with self.subTest(person=person, system=system):
+                    words = packer.pack(result.chart)
+                    self.assertEqual(ChartPacker.WORDS[system], len(words))
+                    self.assertTrue(all(0 <= word < 1 << ChartPacker.WORD_BITS for word in words))
+                    figures = packer.unpack(system, words)
+                    self.assertEqual(figures_of(result.chart), figures)
+                    self.assertEqual(list(figures_of(result.chart)), list(figures))
+
+    def test_packed_charts_are_comparable(self):
+        packer = ChartPacker()
+        obama = packer.pack(Pythagorean("Barack", "Obama", "1961-08-04", verbose=False).chart)
+        self.assertEqual(obama, packer.pack(compute("Barack", "Obama", "1961-08-04").chart))
+        self.assertNotEqual(obama, packer.pack(compute("Barack", "Obama", "1961-08-05").chart))
+        self.assertEqual(array("Q", obama).tobytes(), array("Q", list(obama)).tobytes())
+        self.assertEqual(24, len(array("Q", obama).tobytes()))
+        chaldean = Chaldean("Barack", "Obama", "1961-08-04", verbose=False).chart
+        vedic = Vedic("Barack", "Obama", "1961-08-04", verbose=False).chart
+        self.assertEqual(1, len(packer.pack(chaldean)))
+        self.assertEqual(1, len(packer.pack(vedic)))
+
+    def test_ruleset(self):
+        ruleset = Ruleset(master_numbers=(11, 22, 33))
+        chart = compute("Barack", "Obama", "1961-08-04", ruleset=ruleset).chart
+        packer = ChartPacker(ruleset)
+        self.assertEqual(figures_of(chart), packer.unpack("pythagorean", packer.pack(chart)))
+
+    def test_errors(self):
+        packer = ChartPacker()
+        partial = compute("Barack", "Obama", "1961-08-04", figures=("life_path_number",)).chart
+        with self.assertRaises(ValueError):
+            packer.pack(partial)
+        with self.assertRaises(ValueError):
+            packer.pack(compute("Barack", "Obama").chart.key_figures, system="egyptian")
+        with self.assertRaises(ValueError):
+            packer.unpack("vedic", (0, 0))
+
+    def test_permutation_rank(self):
+        self.assertEqual(0, permutation_rank(range(9)))
+        self.assertEqual(362879, permutation_rank(range(8, -1, -1)))
+        for permutation in ([2, 0, 1], [4, 8, 0, 7, 5, 1, 3, 2, 6]):
+            self.assertEqual(permutation, permutation_of_rank(permutation_rank(permutation), len(permutation)))
+
+    def test_tied_numbers_order(self):
+        packer = ChartPacker()
+        for person in (("Zoe", "Ba"), ("Ba", "Zoe"), ("Barack", "Obama")):
+            with self.subTest(person=person):
+                figures = figures_of(compute(*person).chart)
+                unpacked = packer.unpack("pythagorean", packer.pack(figures, "pythagorean"))
+                self.assertEqual(list(figures["full_name_numbers"].items()), list(unpacked["full_name_numbers"].items()))
+
+    def test_long_names(self):
+        packer = ChartPacker()
+        chart = compute("Maria Fernanda Aparecida", "Santos Sousa Costa Alves", "1980-05-17").chart
+        self.assertEqual(17, chart.key_figures["full_name_numbers"][1])
+        words = packer.pack(chart)
+        self.assertTrue(packer.is_exact("pythagorean", words))
+        self.assertEqual(figures_of(chart), packer.unpack("pythagorean", words))
+
+    def test_master_numbers_of_long_names(self):
+        # Multiples of 11 are master numbers: the figures of the names have no upper bound
+        packer = ChartPacker()
+        for person, system, name, value in (
+            (("r" * 33, "r" * 11), "pythagorean", "personality_number", 396),
+            (("p" * 44, "r"), "chaldean", "active_number", (396, 9)),
+        ):
+            with self.subTest(person=person, system=system):
+                chart = compute(*person, "1990-01-01", system=system).chart
+                self.assertEqual(value, chart.key_figures[name])
+                words = packer.pack(chart)
+                self.assertTrue(packer.is_exact(system, words))
+                self.assertEqual(figures_of(chart), packer.unpack(system, words))
+        for person, system, name in (
+            (("r" * 7337, "a"), "pythagorean", "personality_number"),
+            (("p" * 517, "r"), "chaldean", "active_number"),
+        ):
+            with self.subTest(person=person, system=system):
+                chart = compute(*person, "1990-01-01", system=system).chart
+                words = packer.pack(chart)
+                self.assertFalse(packer.is_exact(system, words))
+                self.assertNotEqual(chart.key_figures[name], packer.unpack(system, words)[name])
+
+    def test_saturated_counts(self):
+        packer = ChartPacker()
+        chart = compute("A" * 200, "Obama", "1961-08-04").chart
+        words = packer.pack(chart)
+        self.assertFalse(packer.is_exact("pythagorean", words))
+        figures = packer.unpack("pythagorean", words)
+        self.assertEqual(ChartPacker.COUNT_MAX, figures["full_name_numbers"][1])
+        self.assertEqual(chart.key_figures["full_name_missing_numbers"], figures["full_name_missing_numbers"])
+        self.assertEqual(chart.key_figures["destiny_number"], figures["destiny_number"])
+        self.assertTrue(packer.is_exact("vedic", packer.pack(compute("A" * 200, "Obama", system="vedic").chart)))
+
+
+if __name__ == "__main__":
+    unittest.main()
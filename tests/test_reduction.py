@@ -0,0 +1,105 @@
+import math
+import os
+import sys
+import threading
+import unittest
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import Pythagorean, Ruleset
+from numerology.pythagorean.reduction import Reduction, ReductionTable
+
+
+def legacy_numerology_sum(tuple_obj, upper_bound=9, master_number=True):
+    """The float/str based reduction the integer engine replaces."""
+    nsum = math.fsum(tuple_obj)
+    if master_number:
+        while not (nsum <= upper_bound or (nsum % 11) == 0):
+            nsum = math.fsum(tuple(int(num) for num in str(int(nsum))))
+    else:
+        while not (nsum <= upper_bound):
+            nsum = math.fsum(tuple(int(num) for num in str(int(nsum))))
+    return int(nsum)
+
+
+class ReductionTestCase(unittest.TestCase):
+    def test_digit_sum(self):
+        self.assertEqual(0, Reduction.digit_sum(0))
+        self.assertEqual(20, Reduction.digit_sum(1991))
+
+    def test_same_results_as_legacy_reduction(self):
+        for upper_bound in (9, 19, 52):
+            for master_number in (True, False):
+                with self.subTest(upper_bound=upper_bound, master_number=master_number):
+                    self.assertEqual(
+                        [legacy_numerology_sum((n,), upper_bound, master_number) for n in range(5000)],
+                        [Reduction.reduce(n, upper_bound, master_number) for n in range(5000)],
+                    )
+
+    def test_reduction_tables(self):
+        for upper_bound in (9, 19, 52):
+            for master_number in (True, False):
+                with self.subTest(upper_bound=upper_bound, master_number=master_number):
+                    sums = ReductionTable(upper_bound, master_number, size=16)
+                    digits = ReductionTable(upper_bound, master_number, digits=True, size=16)
+                    self.assertEqual(
+                        [Reduction.reduce(n, upper_bound, master_number) for n in range(5000)],
+                        [sums[n] for n in range(5000)],
+                    )
+                    self.assertEqual(
+                        [Reduction.reduce(Reduction.digit_sum(n), upper_bound, master_number) for n in range(5000)],
+                        [digits[n] for n in range(5000)],
+                    )
+                    self.assertGreaterEqual(sums.size, 5000)
+
+    def test_reduction_table_grown_by_threads(self):
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for digits in (False, True):
+                table = ReductionTable(9, False, digits=digits, size=2)
+                barrier = threading.Barrier(8)
+
+                def grow(start):
+                    barrier.wait()
+                    for number in range(start, 50000, 997):
+                        table[number]
+
+                threads = [threading.Thread(target=grow, args=(start,)) for start in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                reduce = Reduction.reduce
+                expected = [reduce(Reduction.digit_sum(n) if digits else n, 9, False) for n in range(50000)]
+                self.assertEqual(expected, [table[n] for n in range(50000)])
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+    def test_reduction_table_rejects_negative_sums(self):
+        with self.assertRaises(KeyError):
+            ReductionTable.shared(9, False)[-1]
+
+    def test_reduction_table_is_a_dict(self):
+        table = ReductionTable.shared(9, False)
+        self.assertIs(table, ReductionTable.shared(9, False))
+        self.assertEqual(5, table.get(5))
+        self.assertIsNone(table.get(-1))
+
+    def test_reduction_table_rejects_low_upper_bounds(self):
+        with self.assertRaises(ValueError):
+            ReductionTable(7)
+
+    def test_get_numerology_sum(self):
+        self.assertEqual(11, Pythagorean.get_numerology_sum((5, 6)))
+        self.assertEqual(2, Pythagorean.get_numerology_sum((5, 6), master_number=False))
+        self.assertEqual(19, Pythagorean.get_numerology_sum((9, 9, 1), upper_bound=19, master_number=False))
+        # The class ruleset, whatever the ruleset of the chart
+        chart = Pythagorean("Barack", "Obama", ruleset=Ruleset(master_numbers=(22,)), verbose=False)
+        self.assertEqual(11, chart.get_numerology_sum((5, 6)))
+        self.assertEqual(2, chart.ruleset.sum_master[11])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import sys
+import unittest
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import Pythagorean, Ruleset
+
+
+class RulesetTestCase(unittest.TestCase):
+    def test_default_master_numbers_are_multiples_of_11(self):
+        ruleset = Ruleset()
+        self.assertTrue(ruleset.is_master_number(44))
+        self.assertFalse(ruleset.is_master_number(45))
+        self.assertEqual(44, ruleset.sum_master[44])
+        self.assertEqual(5, ruleset.sum_single[5 + 9 + 9])
+
+    def test_custom_master_numbers(self):
+        ruleset = Ruleset(master_numbers=(11, 22, 33))
+        self.assertEqual(33, ruleset.sum_master[33])
+        self.assertEqual(8, ruleset.sum_master[44])
+        self.assertFalse(ruleset.is_master_number(44))
+
+    def test_karmic_debt_numbers(self):
+        ruleset = Ruleset(karmic_debt_numbers=(13, 14))
+        self.assertTrue(ruleset.is_karmic_debt(13))
+        self.assertFalse(ruleset.is_karmic_debt(19))
+
+    def test_invalid_bounds(self):
+        for bounds in ({"single_bound": 7}, {"karmic_bound": 0}, {"compound_bound": 52.0}):
+            with self.subTest(**bounds):
+                with self.assertRaises(ValueError):
+                    Ruleset(**bounds)
+
+    def test_rulesets_side_by_side(self):
+        # The vowels of "Isaac Newton" sum up to 22.
+        default = Pythagorean("Isaac", "Newton", "1643-01-04", verbose=False)
+        self.assertEqual(22, default.hearts_desire_number)
+        without_22 = Pythagorean("Isaac", "Newton", "1643-01-04", verbose=False, ruleset=Ruleset(master_numbers=(11, 33)))
+        self.assertEqual(4, without_22.hearts_desire_number)
+        self.assertEqual(22, default.hearts_desire_number)
+
+
+if __name__ == "__main__":
+    unittest.main()
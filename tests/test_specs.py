@@ -0,0 +1,120 @@
+import os
+import sys
+import unittest
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import Chaldean, Pythagorean, Ruleset, Vedic
+from numerology.pythagorean.figures import figure
+from numerology.pythagorean.ruleset import DEFAULT_RULESET
+from numerology.pythagorean.specs import SINGLE, Fig, FigureSpec, Var, reduce
+
+PEOPLE = (
+    ("Barack", "Obama", "1961-08-04"),
+    ("Jean-Pierre", "Boisrond", "1958-12-15"),
+    ("Michel", "Colucci", "1944-10-28"),
+    ("Marie-Thérèse", "d'Alembert", "2000-02-29"),
+    ("Zoë", "O'Neil", "1999-11-30"),
+    ("Ann", "Lee", None),
+)
+
+
+class FigureSpecsTestCase(unittest.TestCase):
+    def test_compiled_figures_are_the_properties(self):
+        rulesets = (DEFAULT_RULESET, Ruleset(master_numbers=(11, 22, 33), karmic_debt_numbers=(13, 14, 16, 19)))
+        for cls in (Pythagorean, Chaldean, Vedic):
+            for ruleset in rulesets:
+                for person in PEOPLE:
+                    with self.subTest(system=cls.system, person=person, ruleset=ruleset.parameters):
+                        numerology = cls.evaluate(*person, ruleset=ruleset)
+                        graph = cls.figure_graph
+                        for name, value in numerology.key_figures.items():
+                            if name not in graph.empty_figures:
+                                self.assertEqual(getattr(numerology, name), value, name)
+
+    def test_properties_are_generated_from_the_specs(self):
+        for cls in (Pythagorean, Chaldean, Vedic):
+            for name, spec in cls.figure_specs.specs.items():
+                if name not in ("first_name", "last_name", "birthdate"):
+                    with self.subTest(system=cls.system, name=name):
+                        self.assertIs(spec, getattr(cls, name).spec)
+                        self.assertTrue(getattr(cls, name).__doc__)
+        self.assertIs(Pythagorean.power_number, Vedic.power_number)
+        self.assertIsNot(Pythagorean.destiny_number, Vedic.destiny_number)
+
+    def test_property_without_birthdate(self):
+        numerology = Pythagorean.evaluate("Barack", "Obama")
+        self.assertEqual((0,), numerology.life_path_number)
+        self.assertEqual(0, numerology.attitude_number)
+        self.assertEqual("missing_birthdate", numerology.diagnostics[-1].code)
+
+    def test_overridden_figures(self):
+        class Doubled(Pythagorean):
+            @figure
+            def destiny_number(self):
+                return (2 * super().destiny_number[0],)
+
+        self.assertTrue(Pythagorean.figures_are_specified())
+        self.assertTrue(type("Subclass", (Chaldean,), {}).figures_are_specified())
+        self.assertFalse(Doubled.figures_are_specified())
+        numerology = Doubled.evaluate("Barack", "Obama", "1961-08-04")
+        self.assertEqual((2 * Pythagorean.evaluate("Barack", "Obama").destiny_number[0],), numerology.destiny_number)
+        self.assertEqual(numerology.destiny_number, numerology.key_figures["destiny_number"])
+
+    def test_dependencies(self):
+        graph = Pythagorean.figure_graph
+        self.assertEqual(("life_path_number", "destiny_number"), graph.dependencies["power_number"])
+        self.assertEqual(("<names>", "destiny_number"), Chaldean.figure_graph.dependencies["name_number"])
+        self.assertEqual(("<birthdate>",), Vedic.figure_graph.dependencies["destiny_number"])
+
+    def test_straight_line_code(self):
+        compiled = Pythagorean.figure_specs.compile(Pythagorean.figure_graph, ("power_number",), DEFAULT_RULESET)
+        self.assertNotIn("self", compiled.source)
+        self.assertNotIn("hearts_desire_number", compiled.source)
+        self.assertEqual(
+            ("first_name_sum", "last_name_sum", "birthdate_day", "birthdate_month", "birthdate_year", "date_record"),
+            compiled.variables,
+        )
+        self.assertEqual({"power_number": (7,)}, compiled.function(18, 14, 4, 8, 1961, None))
+        # The life path number read from a date record
+        self.assertEqual({"power_number": (1,)}, compiled.function(18, 14, 4, 8, 1961, (5,)))
+        self.assertIs(
+            compiled,
+            Pythagorean.figure_specs.compile(Pythagorean.figure_graph, ("power_number",), DEFAULT_RULESET),
+        )
+
+    def test_new_figure(self):
+        specs = Pythagorean.figure_specs.extend(
+            [
+                FigureSpec(
+                    "soul_path_number",
+                    reduce("digits_single", Fig("life_path_number", 0), Fig("hearts_desire_number")),
+                    SINGLE,
+                ),
+                FigureSpec("first_name_number", reduce("sum_single", Var("first_name_sum"))),
+            ]
+        )
+        graph = Pythagorean.figure_graph.extend(("soul_path_number",), specs.dependencies())
+        self.assertEqual(frozenset({"<names>", "<birthdate>"}), graph.inputs(["soul_path_number"]))
+        compiled = specs.compile(graph, ("soul_path_number", "first_name_number"), DEFAULT_RULESET)
+        self.assertEqual(
+            (
+                "first_name_sum",
+                "full_name_vowels_sum",
+                "birthdate_day",
+                "birthdate_month",
+                "birthdate_year",
+                "date_record",
+            ),
+            compiled.variables,
+        )
+        self.assertEqual(
+            {"soul_path_number": (7,), "first_name_number": 9}, compiled.function(18, 14, 4, 8, 1961, None)
+        )
+        with self.assertRaises(ValueError):
+            specs.compile(graph, ("unknown_number",), DEFAULT_RULESET)
+
+
+if __name__ == "__main__":
+    unittest.main()
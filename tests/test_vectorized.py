@@ -0,0 +1,122 @@
+import os
+import sys
+import unittest
+from datetime import date
+
+# # For relative imports to work in Python 3.6
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from numerology import NAME_CACHE, Chaldean, DateFigureTable, Pythagorean, Ruleset, Vedic, fct
+from numerology import vectorized
+from numerology.pythagorean.letters import LetterValues
+from numerology.vectorized import np
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class VectorizedDateFiguresTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        first = date(1890, 1, 1).toordinal()
+        cls.dates = [date.fromordinal(ordinal) for ordinal in range(first, first + 365 * 40, 3)]
+        cls.figures = vectorized.date_figures(np.array([d.isoformat() for d in cls.dates], dtype="datetime64[D]"))
+
+    def test_split_dates(self):
+        years, months, days = vectorized.split_dates(["1958-12-15", "2000-02-29"])
+        self.assertEqual([1958, 2000], years.tolist())
+        self.assertEqual([12, 2], months.tolist())
+        self.assertEqual([15, 29], days.tolist())
+
+    def test_same_figures_as_date_table(self):
+        pythagorean = self.figures["pythagorean"]
+        chaldean = self.figures["chaldean"]
+        for index, birthdate in enumerate(self.dates):
+            expected = DateFigureTable.date_figures(birthdate.year, birthdate.month, birthdate.day)
+            self.assertEqual(
+                expected,
+                (
+                    pythagorean["life_path_number"][index],
+                    pythagorean["life_path_number_alternative"][index],
+                    pythagorean["birthdate_day_num"][index],
+                    pythagorean["birthdate_month_num"][index],
+                    pythagorean["birthdate_year_num"][index],
+                    pythagorean["birthdate_year_num_alternative"][index],
+                    pythagorean["attitude_number"][index],
+                    pythagorean["karma_number"][index],
+                    pythagorean["karmic_life_path_number"][index],
+                    pythagorean["karmic_birthdate_day_num"][index],
+                    chaldean["life_path_number_compound"][index],
+                    chaldean["birthdate_year_num_alternative"][index],
+                ),
+            )
+
+    def test_same_figures_as_charts(self):
+        for index in range(0, len(self.dates), 97):
+            birthdate = self.dates[index].isoformat()
+            pythagorean = Pythagorean("a", "b", birthdate, verbose=False)
+            chaldean = Chaldean("a", "b", birthdate, verbose=False)
+            vedic = Vedic("a", "b", birthdate, verbose=False)
+            self.assertEqual(pythagorean.life_path_number, (self.figures["pythagorean"]["life_path_number"][index],))
+            self.assertEqual(pythagorean.karma_number, self.figures["pythagorean"]["karma_number"][index])
+            self.assertEqual(
+                chaldean.birthdate_year_num_alternative,
+                self.figures["chaldean"]["birthdate_year_num_alternative"][index],
+            )
+            self.assertEqual(chaldean.life_path_number[0], self.figures["chaldean"]["life_path_number_compound"][index])
+            self.assertEqual(vedic.psychic_number, (self.figures["vedic"]["psychic_number"][index],))
+
+    def test_arrays_of_years_months_and_days(self):
+        figures = vectorized.date_figures([1958, 9999], [12, 1], [15, 1], ruleset=Ruleset(master_numbers=(11,)))
+        self.assertEqual([5, 2], figures["pythagorean"]["life_path_number"].tolist())
+
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            vectorized.date_figures([1958], [13], [15])
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class VectorizedNameFiguresTestCase(unittest.TestCase):
+    first_names = ["Barack", "Jean-Pierre", "Zoë", "Ánh", "Mary Ann", "X", "Ölüdeniz", "!!", "Christopher"]
+    last_names = ["Obama", "Boisrond", "Saldaña", "Nguyễn", "O'Neil", "Yz", "Kaya", "Doe", "Columbus"]
+
+    def test_count_letters(self):
+        names = ["Zoë", "Al", "", "!!", "Jean-Pierre", "Nguyễn", "Ánh\0Al", "ÉÉ"]
+        counts = vectorized.count_letters(names)
+        expected = [LetterValues.letter_counts(fct.clean_letters(name, Pythagorean.alphabet)) for name in names]
+        self.assertEqual(expected, counts.tolist())
+        self.assertEqual((0, 26), vectorized.count_letters([]).shape)
+        self.assertEqual([[0] * 26], vectorized.count_letters([""]).tolist())
+
+    def test_name_cache_untouched(self):
+        NAME_CACHE.clear()
+        vectorized.name_figures(self.first_names, self.last_names)
+        self.assertEqual(0, NAME_CACHE.info().currsize)
+
+    def test_same_figures_as_charts(self):
+        figures = vectorized.name_figures(self.first_names, self.last_names)
+        for index, (first_name, last_name) in enumerate(zip(self.first_names, self.last_names)):
+            if first_name == "!!":
+                self.assertFalse(figures["pythagorean"]["names_are_valid"][index])
+                continue
+            self.assertTrue(figures["pythagorean"]["names_are_valid"][index])
+            pythagorean = Pythagorean(first_name, last_name, "2000-01-01", verbose=False)
+            chaldean = Chaldean(first_name, last_name, "2000-01-01", verbose=False)
+            vedic = Vedic(first_name, last_name, "2000-01-01", verbose=False)
+            python_figures = figures["pythagorean"]
+            self.assertEqual(pythagorean.hearts_desire_number, python_figures["hearts_desire_number"][index])
+            self.assertEqual(pythagorean.personality_number, python_figures["personality_number"][index])
+            self.assertEqual(pythagorean.destiny_number, (python_figures["destiny_number"][index],))
+            self.assertEqual(pythagorean.active_number, (python_figures["active_number"][index],))
+            self.assertEqual(pythagorean.legacy_number, (python_figures["legacy_number"][index],))
+            self.assertEqual(chaldean.name_number[0], figures["chaldean"]["name_number_compound"][index])
+            self.assertEqual(chaldean.name_number[-1], figures["chaldean"]["name_number"][index])
+            self.assertEqual(chaldean.active_number[0], figures["chaldean"]["active_number_compound"][index])
+            self.assertEqual(chaldean.active_number[-1], figures["chaldean"]["active_number"][index])
+            self.assertEqual(vedic.name_number, (figures["vedic"]["name_number"][index],))
+
+    def test_different_lengths(self):
+        with self.assertRaises(ValueError):
+            vectorized.name_figures(["Barack"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()